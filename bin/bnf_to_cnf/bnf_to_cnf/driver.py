@@ -1,10 +1,12 @@
 import argparse
+import sys
 from pathlib import Path
 from typing import Dict, Iterator, Optional, Union
 
 from .node import Node
 from .parser import Parser
-from .translator import Translator
+from .specializer import IMPORTS, Specializer
+from .translator import Translator, count_productions
 from .validate import Validator
 
 parser = argparse.ArgumentParser(description="Convert BNF grammar to CNF")
@@ -16,19 +18,32 @@ parser.add_argument(
 parser.add_argument(
     "-f",
     "--format",
-    choices=["cyk", "py"],
+    choices=["cyk", "py", "specialized"],
     default="py",
     nargs="?",
     type=str,
     help=(
-        'The output format.  Can be either "cyk" or "py".  "cyk" '
+        'The output format.  Can be "cyk", "py" or "specialized".  "cyk" '
         "outputs the file in CYK format, as a .cyk file.  Py "
-        "generates a grammar which can be read by darglint2."
+        "generates a grammar which can be read by darglint2.  "
+        '"specialized" generates the same grammar, with a parse '
+        "function specialized to it, which is used when the grammar's "
+        'engine is set to "specialized".'
     ),
 )
 parser.add_argument(
     "-o", "--output", nargs=1, type=str, default=None, help=("The output file.")
 )
+parser.add_argument(
+    "-m",
+    "--minimize",
+    action="store_true",
+    help=(
+        "Merge equivalent nonterminals introduced by the translation, "
+        "and remove duplicate derivations.  The number of productions "
+        "before and after is reported on stderr."
+    ),
+)
 
 
 class Driver(object):
@@ -52,6 +67,18 @@ class Driver(object):
         self.translator.translate(self.tree)
         return self
 
+    def minimize(self) -> "Driver":
+        assert self.tree is not None
+        before = count_productions(self.tree)
+        self.translator.minimize(self.tree)
+        after = count_productions(self.tree)
+        name = "Grammar"
+        for name_node in self.tree.filter(Node.is_name):
+            assert name_node.value is not None
+            name = name_node.value
+        print(f"{name}: {before} -> {after} productions", file=sys.stderr)
+        return self
+
     def validate(self) -> "Driver":
         self.validator.validate(self.tree)
         return self
@@ -62,9 +89,24 @@ class Driver(object):
             return str(self.tree)
         elif _format == "py":
             return self.tree.to_python()
+        elif _format == "specialized":
+            return self.specialize()
         else:
             raise Exception(f"Unrecognized format type {_format}")
 
+    def specialize(self) -> str:
+        assert self.tree is not None
+        start = None
+        for start_node in self.tree.filter(Node.is_start):
+            start = start_node.value
+        if start is None:
+            # A grammar without a start symbol is only imported into
+            # other grammars, so it isn't parsed with directly.
+            return self.tree.to_python()
+        comment, python = self.tree.to_python().split("\n", 1)
+        specializer = Specializer(self.tree.get_productions(), start)
+        return "\n".join([comment] + IMPORTS + [python, specializer.to_python(), ""])
+
     def get_imports(self) -> Iterator[str]:
         assert self.tree is not None
         for _import in self.tree.filter(Node.is_import):
@@ -126,7 +168,10 @@ def load_script(filepath: Path, cache: Dict[str, Driver] = None):
 def main():
     args = parser.parse_args()
     driver = load_script(args.file)
-    translated = driver.translate().validate().write(args.format)
+    driver.translate()
+    if args.minimize:
+        driver.minimize()
+    translated = driver.validate().write(args.format)
 
     if args.output:
         with open(args.output[0], "w") as fout:
@@ -1,6 +1,6 @@
 from collections import deque
 from enum import Enum
-from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 from lark import Token, Tree
 
@@ -514,6 +514,46 @@ class Node(object):
         else:
             raise Exception(f"Unrecognized node type, {self.node_type}")
 
+    def get_productions(self) -> List[Tuple[str, List[Tuple]]]:
+        """Get the productions of the translated grammar.
+
+        The productions are in the same order, and the derivations
+        in the same form, as in the output of `to_python`.  Token
+        types and annotations are given as source code.
+
+        Returns:
+            The symbol and derivations of each production.
+
+        """
+        productions: List[Tuple[str, List[Tuple]]] = list()
+        for production in self.filter(Node.is_production):
+            symbol = production.children[0]
+            if len(production.children) > 1 and Node.is_annotations(symbol):
+                symbol = production.children[1]
+            if not Node.is_symbol(symbol):
+                # The symbol was elided up to the grammar.
+                continue
+            assert symbol.value is not None
+            expression = next(production.filter(Node.is_expression))
+            derivations: List[Tuple] = list()
+            for sequence in expression.children:
+                annotations = "[]"
+                children = sequence.children
+                if Node.is_annotations(children[0]):
+                    annotations = children[0].to_python()
+                    children = children[1:]
+                weight = int(sequence.probability or 0)
+                if len(children) == 1:
+                    derivations.append((children[0].to_python(), weight))
+                else:
+                    lchild, rchild = children
+                    assert lchild.value is not None and rchild.value is not None
+                    derivations.append(
+                        (annotations, lchild.value, rchild.value, weight)
+                    )
+            productions.append((symbol.value, derivations))
+        return productions
+
     @staticmethod
     def is_symbol(x: "Node") -> bool:
         return x.node_type == NodeType.SYMBOL
@@ -0,0 +1,242 @@
+"""Generate a parse function specialized to a CNF grammar.
+
+Darglint2's CYK parser interprets a grammar's productions: for every
+span of a section, and every split of the span, it loops over the
+derivations, unpacking each and checking whether it's a terminal.
+The function generated here does the same work with the grammar
+unrolled into straight-line code: symbols are integer ids, terminals
+are matched through a dict from token type, and each binary
+derivation is a handful of statements.  It builds exactly the trees
+the CYK parser builds, since it fills the same chart in the same
+order.
+
+This module doesn't depend on lark or darglint2, so that it can also
+be used on the grammars darglint2 has already loaded (for example,
+to benchmark the specialized parsers against the CYK parser.)
+
+"""
+
+from typing import Dict, List, Tuple, Union
+
+# A terminal derivation: the token type (as source code) and the
+# weight.
+TerminalDerivation = Tuple[str, int]
+
+# A binary derivation: the annotations (as source code), the two
+# symbols, and the weight.
+BinaryDerivation = Tuple[str, str, str, int]
+
+Derivation = Union[TerminalDerivation, BinaryDerivation]
+
+# A production: its symbol, and its derivations, in order.
+Production = Tuple[str, List[Derivation]]
+
+# The binary derivations, with their symbols replaced by ids: the
+# index of the production, its symbol, the annotations, the ids of
+# the two symbols, and the weight.
+_Binary = Tuple[int, str, str, int, int, int]
+
+IMPORTS = [
+    "from typing import Any, List",
+    "from darglint2.node import CykNode",
+    "from darglint2.parse.budget import check_time",
+    "from darglint2.parse.cyk import checkout_arena, return_arena",
+]
+
+
+class Specializer(object):
+    """Generates a parse function for a grammar."""
+
+    def __init__(self, productions: List[Production], start: str) -> None:
+        """Create a new Specializer.
+
+        Args:
+            productions: The productions of the grammar, in the order
+                they appear in the grammar's `productions` list.
+            start: The start symbol.
+
+        """
+        self.productions = productions
+        self.start = start
+
+        # As in the CYK parser, a symbol refers to the last
+        # production with it on the left-hand side.
+        self.lookup = {lhs: a for a, (lhs, _) in enumerate(productions)}
+
+        # Each distinct list of annotations is a module-level
+        # constant, so every node built with it shares the list.
+        self.annotations: Dict[str, str] = dict()
+
+    def _get_annotations(self, annotations: str) -> str:
+        if annotations not in self.annotations:
+            self.annotations[annotations] = "_A{}".format(len(self.annotations))
+        return self.annotations[annotations]
+
+    def _get_terminals(self) -> Dict[str, List[Tuple[int, str, int]]]:
+        """Get the productions which derive each token type.
+
+        Returns:
+            For each token type, the index, symbol and weight of
+            each production deriving it.  If a production derives
+            the token type more than once, the CYK parser keeps the
+            last derivation, so only it is included.
+
+        """
+        terminals: Dict[str, Dict[int, Tuple[int, str, int]]] = dict()
+        for a, (lhs, derivations) in enumerate(self.productions):
+            for derivation in derivations:
+                if len(derivation) == 2:
+                    token_type, weight = derivation  # type: ignore
+                    terminals.setdefault(token_type, dict())[a] = (a, lhs, weight)
+        return {
+            token_type: list(by_production.values())
+            for token_type, by_production in terminals.items()
+        }
+
+    def _get_binaries(self) -> List[_Binary]:
+        binaries: List[_Binary] = list()
+        for a, (lhs, derivations) in enumerate(self.productions):
+            for derivation in derivations:
+                if len(derivation) == 4:
+                    annotations, B, C, weight = derivation  # type: ignore
+                    binaries.append(
+                        (
+                            a,
+                            lhs,
+                            self._get_annotations(annotations),
+                            self.lookup[B],
+                            self.lookup[C],
+                            weight,
+                        )
+                    )
+        return binaries
+
+    def _group(self, binaries: List[_Binary]) -> List[List[_Binary]]:
+        """Group the derivations by their left child.
+
+        Then the left child only has to be read from the chart once
+        per group.  The derivations for a production have to be
+        tried in order (when there's a tie, the last wins), so if
+        grouping all of them would reorder the derivations for any
+        production, only consecutive derivations are grouped.
+
+        Args:
+            binaries: The binary derivations, in order.
+
+        Returns:
+            The derivations, in groups with the same left child.
+
+        """
+        by_left: Dict[int, List[_Binary]] = dict()
+        for binary in binaries:
+            by_left.setdefault(binary[3], list()).append(binary)
+        grouped = list(by_left.values())
+        reordered = [binary for group in grouped for binary in group]
+        if self._by_production(binaries) == self._by_production(reordered):
+            return grouped
+        runs: List[List[_Binary]] = list()
+        for binary in binaries:
+            if runs and runs[-1][0][3] == binary[3]:
+                runs[-1].append(binary)
+            else:
+                runs.append([binary])
+        return runs
+
+    def _by_production(self, binaries: List[_Binary]) -> Dict[int, List[_Binary]]:
+        by_production: Dict[int, List[_Binary]] = dict()
+        for binary in binaries:
+            by_production.setdefault(binary[0], list()).append(binary)
+        return by_production
+
+    def _offset(self, base: str, a: int) -> str:
+        return "{} + {}".format(base, a) if a else base
+
+    def _get_binary_lines(self) -> List[str]:
+        lines: List[str] = list()
+        for group in self._group(self._get_binaries()):
+            lines.append("x = P[{}]".format(self._offset("left", group[0][3])))
+            lines.append("if x:")
+            for a, lhs, annotations, _, c, weight in group:
+                slot = self._offset("cell", a)
+                arguments = '"{}", x, y, annotations={}'.format(lhs, annotations)
+                if weight:
+                    arguments += ", weight={}".format(weight)
+                lines.extend(
+                    [
+                        "    y = P[{}]".format(self._offset("right", c)),
+                        "    if y:",
+                        "        old = P[{}]".format(slot),
+                        "        if old is None or old.weight <= {}:".format(weight),
+                        "            P[{}] = CykNode({})".format(slot, arguments),
+                    ]
+                )
+        return lines
+
+    def to_python(self) -> str:
+        """Generate the parse function.
+
+        Returns:
+            The source for a static method, `specialized_parse`, to
+            be placed in the grammar's class, followed by the
+            module-level tables it uses.  The imports it requires
+            are in `IMPORTS`.
+
+        """
+        r = len(self.productions)
+        indent = " " * 20
+        values = [
+            "",
+            "    @staticmethod",
+            "    def specialized_parse(tokens):",
+            "        if not tokens:",
+            "            return None",
+            "        n = len(tokens)",
+            "        row = [0, 0]",
+            "        for l in range(1, n):  # noqa: E741",
+            "            row.append(row[l] + n - l + 1)",
+            "        size = (row[n] + 1) * {}".format(r),
+            "        arena = checkout_arena()",
+            "        P = arena.acquire(size)",
+            "        try:",
+            "            for s, token in enumerate(tokens):",
+            "                for a, symbol, weight in _TERMINALS.get(",
+            "                    token.token_type, ()",
+            "                ):",
+            "                    P[s * {} + a] = CykNode(".format(r),
+            "                        symbol, value=token, weight=weight",
+            "                    )",
+            "            for l in range(2, n + 1):  # noqa: E741",
+            "                check_time()",
+            "                for s in range(n - l + 1):",
+            "                    cell = (row[l] + s) * {}".format(r),
+            "                    for p in range(1, l):",
+            "                        left = (row[p] + s) * {}".format(r),
+            "                        right = (row[l - p] + s + p) * {}".format(r),
+        ]
+        binaries = self._get_binary_lines()
+        if not binaries:
+            binaries = ["pass"]
+        values.extend(indent + "    " + line for line in binaries)
+        values.extend(
+            [
+                "            return P[{}]".format(
+                    self._offset("row[n] * {}".format(r), self.lookup[self.start])
+                ),
+                "        finally:",
+                "            arena.release(size)",
+                "            return_arena(arena)",
+                "",
+                "",
+            ]
+        )
+        for annotations, name in self.annotations.items():
+            values.append("{}: List[Any] = {}".format(name, annotations))
+        values.append("")
+        values.append("_TERMINALS = {")
+        for token_type, productions in self._get_terminals().items():
+            values.append("    {}: (".format(token_type))
+            for a, lhs, weight in productions:
+                values.append('        ({}, "{}", {}),'.format(a, lhs, weight))
+            values.append("    ),")
+        values.append("}")
+        return "\n".join(values)
@@ -37,9 +37,32 @@ def to_symbol(value: str, count: int = None) -> str:
     return ret + (str(count) if count is not None else "")
 
 
+def count_productions(tree: Node) -> int:
+    """Count the productions in the grammar.
+
+    This is the measure of a grammar's size used by
+    `integration_tests/grammar_size.py`, since the CYK
+    parser's work on every span grows with it.
+
+    Args:
+        tree: The grammar.
+
+    Returns:
+        The number of productions.
+
+    """
+    return len(list(tree.filter(Node.is_production)))
+
+
 class Translator(object):
     """Transforms a BNF tree to CNF."""
 
+    def __init__(self):
+        # The symbols in the grammar before it was translated.
+        # Symbols introduced by the translation aren't referred
+        # to by name outside of the grammar, so can be merged.
+        self.original_symbols: Set[str] = set()
+
     def _reassign_start(self, tree: Node, start_symbol: Optional[Node]):
         """Factor out the start symbol from the RHS.
 
@@ -620,7 +643,126 @@ class Translator(object):
                 )
             )
 
+    def _get_sequence_signature(self, sequence: Node, classes: Dict[str, int]) -> Tuple:
+        children = sequence.children
+        annotations: Tuple[str, ...] = tuple()
+        if children and Node.is_annotations(children[0]):
+            annotations = tuple(x.value or "" for x in children[0].children)
+            children = children[1:]
+        return (
+            annotations,
+            tuple(
+                (x.node_type, classes.get(x.value or "", x.value))
+                if Node.is_symbol(x)
+                else (x.node_type, x.value)
+                for x in children
+            ),
+            int(sequence.probability or 0),
+        )
+
+    def _get_unique_sequences(
+        self, production: Node, classes: Dict[str, int]
+    ) -> List[Tuple[Tuple, Node]]:
+        """Get the production's sequences, without duplicates.
+
+        When several derivations could build a node, the parser
+        keeps the last of the heaviest.  So, of any identical
+        sequences, it is the last which is kept.
+
+        Args:
+            production: The production whose sequences we want.
+            classes: The class of each symbol, to compare the
+                sequences by.
+
+        Returns:
+            The signature of each unique sequence, and the sequence,
+            in order.
+
+        """
+        expression = production.children[-1]
+        seen: Set[Tuple] = set()
+        unique = list()
+        for sequence in reversed(expression.children):
+            signature = self._get_sequence_signature(sequence, classes)
+            if signature not in seen:
+                seen.add(signature)
+                unique.append((signature, sequence))
+        unique.reverse()
+        return unique
+
+    def minimize(self, tree: Node, protected: Optional[Set[str]] = None) -> Node:
+        """Merge equivalent nonterminals and remove duplicate sequences.
+
+        Two nonterminals are equivalent if they have the same
+        sequences (with the same annotations and weights, in the
+        same order), once equivalent symbols are considered equal.
+        The classes are found by partition refinement: all symbols
+        start out in the same class, which is split by the symbols'
+        sequences until it stops changing.  This merges, for example,
+        the identical chains introduced by breaking up sequences
+        with the same tail in different productions.
+
+        Only symbols introduced by the translation are merged: the
+        others are referred to by name (e.g. when looking up the
+        sections of a docstring), so they are kept.  The parse trees
+        differ only in the names of the merged symbols.
+
+        Args:
+            tree: The translated grammar.
+            protected: The symbols which must be kept.  By default,
+                the symbols in the grammar before it was translated.
+
+        Returns:
+            The minimized grammar.
+
+        """
+        if protected is None:
+            protected = self.original_symbols
+        productions = list(tree.filter(Node.is_production))
+        symbols = [Node.get_symbol(x).value or "" for x in productions]
+        classes = {symbol: 0 for symbol in symbols}
+        while True:
+            signatures: Dict[Tuple, int] = dict()
+            refined: Dict[str, int] = dict()
+            for symbol, production in zip(symbols, productions):
+                # Productions with annotations of their own are
+                # left alone, as are protected symbols.
+                keep = symbol in protected or Node.is_annotations(
+                    production.children[0]
+                )
+                signature = (
+                    classes[symbol],
+                    symbol if keep else None,
+                    tuple(
+                        x for x, _ in self._get_unique_sequences(production, classes)
+                    ),
+                )
+                refined[symbol] = signatures.setdefault(signature, len(signatures))
+            if len(signatures) == len(set(classes.values())):
+                break
+            classes = refined
+
+        representatives: Dict[int, str] = dict()
+        renamed: Dict[str, str] = dict()
+        for symbol in symbols:
+            representative = representatives.setdefault(classes[symbol], symbol)
+            if representative != symbol:
+                renamed[symbol] = representative
+        for symbol in renamed:
+            tree.remove(Node._production_with_lhs(symbol))
+        for node in tree.filter(Node.is_symbol):
+            if node.value in renamed:
+                node.value = renamed[node.value]
+        for production in tree.filter(Node.is_production):
+            expression = production.children[-1]
+            expression.children = [
+                x for _, x in self._get_unique_sequences(production, dict())
+            ]
+        tree._invalidate_cache()
+        return tree
+
     def translate(self, tree: Node) -> Node:
+        self.original_symbols = {x.value or "" for x in tree.filter(Node.is_symbol)}
         start_symbol = self._remove_start_symbol(tree)
         self._remove_remaining_imports(tree)
         self._reassign_start(tree, start_symbol)
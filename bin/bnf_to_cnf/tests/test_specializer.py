@@ -0,0 +1,92 @@
+from unittest import TestCase
+
+from bnf_to_cnf.parser import Parser
+from bnf_to_cnf.specializer import IMPORTS, Specializer
+from bnf_to_cnf.translator import Translator
+
+
+def compile_specialized(source: str):
+    return compile(
+        "\n".join(IMPORTS + ["class Grammar:", source]), "<specialized>", "exec"
+    )
+
+
+class SpecializerTest(TestCase):
+    def test_generated_source_compiles(self):
+        productions = [
+            ("a", [("[]", "b", "c", 0), ("[ItemIndentationError]", "c", "b", 2)]),
+            ("b", [("TokenType.WORD", 0)]),
+            ("c", [("TokenType.COLON", 0), ("TokenType.WORD", 1)]),
+        ]
+        source = Specializer(productions, "a").to_python()
+        compile_specialized(source)
+        self.assertIn("_A1: List[Any] = [ItemIndentationError]", source)
+        self.assertIn("return P[row[n] * 3]", source)
+
+    def test_no_tuple_unpacking_per_derivation(self):
+        productions = [
+            ("a", [("[]", "b", "b", 0)]),
+            ("b", [("TokenType.WORD", 0)]),
+        ]
+        source = Specializer(productions, "a").to_python()
+        self.assertNotIn("len(derivation)", source)
+        self.assertIn('P[cell] = CykNode("a", x, y, annotations=_A0)', source)
+
+    def test_last_terminal_derivation_kept(self):
+        productions = [
+            ("a", [("TokenType.WORD", 0), ("TokenType.WORD", 2)]),
+        ]
+        source = Specializer(productions, "a").to_python()
+        self.assertIn('(0, "a", 2)', source)
+        self.assertNotIn('(0, "a", 0)', source)
+
+    def test_symbols_refer_to_last_production(self):
+        productions = [
+            ("b", [("TokenType.WORD", 0)]),
+            ("a", [("[]", "b", "b", 0)]),
+            ("b", [("TokenType.COLON", 0)]),
+        ]
+        source = Specializer(productions, "a").to_python()
+        self.assertIn("x = P[left + 2]", source)
+        self.assertIn("y = P[right + 2]", source)
+
+    def test_derivations_grouped_by_left_child(self):
+        productions = [
+            ("a", [("[]", "c", "c", 0), ("[]", "d", "c", 0)]),
+            ("b", [("[]", "c", "d", 0)]),
+            ("c", [("TokenType.WORD", 0)]),
+            ("d", [("TokenType.COLON", 0)]),
+        ]
+        source = Specializer(productions, "a").to_python()
+        self.assertEqual(source.count("x = P[left + 2]"), 1)
+        self.assertEqual(source.count("x = P[left + 3]"), 1)
+
+    def test_order_of_derivations_preserved(self):
+        productions = [
+            ("a", [("[]", "b", "c", 0), ("[]", "c", "c", 0), ("[]", "b", "b", 0)]),
+            ("b", [("TokenType.WORD", 0)]),
+            ("c", [("TokenType.COLON", 0)]),
+        ]
+        source = Specializer(productions, "a").to_python()
+        self.assertEqual(source.count("x = P[left + 1]"), 2)
+
+    def test_productions_from_translated_grammar(self):
+        grammar = r"""
+            Grammar: ArgumentsGrammar
+
+            start: <a>
+
+            <a> ::= <b> <c> | 2 <c> <b>
+            <b> ::= "TokenType\.WORD"
+            <c> ::= "TokenType\.COLON"
+        """
+        tree = Parser().parse(grammar)
+        Translator().translate(tree)
+        self.assertEqual(
+            tree.get_productions(),
+            [
+                ("a", [("[]", "b", "c", 0), ("[]", "c", "b", 2)]),
+                ("b", [("TokenType.WORD", 0)]),
+                ("c", [("TokenType.COLON", 0)]),
+            ],
+        )
@@ -424,3 +424,71 @@ class TranslatorTestCase(TestCase):
             [],
             "Found production which doesn't begin with a name:\n{}".format(python),
         )
+
+    def test_minimize_merges_equivalent_chains(self):
+        grammar = r"""
+            start: <a>
+
+            <a> ::= <x> <y> <z> | <w> <y> <z>
+            <x> ::= "x"
+            <y> ::= "y"
+            <z> ::= "z"
+            <w> ::= "w"
+        """
+        tree = Parser().parse(grammar)
+        translator = Translator()
+        translator.translate(tree)
+        node = translator.minimize(tree)
+        expected = (
+            "start: <a>\n"
+            "<a> ::= <x> <a1> | <w> <a1>\n"
+            '<x> ::= "x"\n'
+            '<y> ::= "y"\n'
+            '<z> ::= "z"\n'
+            '<w> ::= "w"\n'
+            "<a1> ::= <y> <z>"
+        )
+        self.assertEqual(str(node), expected)
+
+    def test_minimize_removes_duplicate_sequences(self):
+        grammar = r"""
+            start: <a>
+
+            <a> ::= <x> <y> <z> | 2 <x> <y> <z> | <x> <y> <z>
+            <x> ::= "x"
+            <y> ::= "y"
+            <z> ::= "z"
+        """
+        tree = Parser().parse(grammar)
+        translator = Translator()
+        translator.translate(tree)
+        node = translator.minimize(tree)
+        expected = (
+            "start: <a>\n"
+            "<a> ::= 2 <x> <a1> | <x> <a1>\n"
+            '<x> ::= "x"\n'
+            '<y> ::= "y"\n'
+            '<z> ::= "z"\n'
+            "<a1> ::= <y> <z>"
+        )
+        self.assertEqual(str(node), expected)
+
+    def test_minimize_keeps_original_symbols(self):
+        grammar = r"""
+            start: <a>
+
+            <a> ::= <b> <b> | <c> <c>
+            <b> ::= "x"
+            <c> ::= "x"
+        """
+        tree = Parser().parse(grammar)
+        translator = Translator()
+        translator.translate(tree)
+        node = translator.minimize(tree)
+        expected = (
+            "start: <a>\n" "<a> ::= <b> <b> | <c> <c>\n" '<b> ::= "x"\n' '<c> ::= "x"'
+        )
+        self.assertEqual(str(node), expected)
+        node = translator.minimize(tree, protected={"a"})
+        expected = "start: <a>\n" "<a> ::= <b> <b>\n" '<b> ::= "x"'
+        self.assertEqual(str(node), expected)
@@ -1 +1,3 @@
 __version__ = "1.8.2"
+
+from .pipeline import Record, check_sources  # noqa: E402, F401
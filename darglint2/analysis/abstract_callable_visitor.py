@@ -71,10 +71,13 @@ class AbstractCallableVisitor(ast.NodeVisitor):
 
         return False
 
-    def visit_FunctionDef(self, node: ast.FunctionDef) -> ast.AST:
+    def check_abstract(self, node: ast.AST) -> None:
         self.is_abstract = self.analyze_pure_abstract(node)
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> ast.AST:
+        self.check_abstract(node)
         return self.generic_visit(node)
 
     def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> ast.AST:
-        self.is_abstract = self.analyze_pure_abstract(node)
+        self.check_abstract(node)
         return self.generic_visit(node)
@@ -1,3 +1,7 @@
+import ast
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Type
+
 from .abstract_callable_visitor import AbstractCallableVisitor
 from .argument_visitor import ArgumentVisitor
 from .assert_visitor import AssertVisitor
@@ -24,3 +28,63 @@ class AnalysisVisitor(
     """Finds attributes which should be part of the function signature."""
 
     pass
+
+
+# The analysis passes, by name, in the order in which they're
+# mixed into the `AnalysisVisitor`.
+ANALYSIS_PASSES: Dict[str, Type[ast.NodeVisitor]] = {
+    "abstract": AbstractCallableVisitor,
+    "raises": RaiseVisitor,
+    "yields": YieldVisitor,
+    "arguments": ArgumentVisitor,
+    "variables": VariableVisitor,
+    "returns": ReturnVisitor,
+    "asserts": AssertVisitor,
+}
+
+ALL_ANALYSIS_PASSES: FrozenSet[str] = frozenset(ANALYSIS_PASSES)
+
+
+class _TryOrderVisitorMixin(ast.NodeVisitor):
+    """Visits try statements in the same order as the `RaiseVisitor`.
+
+    The order matters to passes which keep the first node they find
+    (e.g. the first return statement), so it shouldn't depend on
+    whether the raises are being analyzed.
+
+    """
+
+    def visit_Try(self, node: ast.Try) -> None:
+        for child in node.body:
+            self.visit(child)
+        for handler in node.handlers:
+            self.generic_visit(handler)
+        for child in node.finalbody:
+            self.visit(child)
+        for child in node.orelse:
+            self.visit(child)
+
+
+@lru_cache(maxsize=None)
+def get_analysis_visitor(passes: FrozenSet[str]) -> Type[ast.NodeVisitor]:
+    """Get a visitor which only runs the given analysis passes.
+
+    Args:
+        passes: The names of the passes to run.  (See
+            `ANALYSIS_PASSES`.)
+
+    Returns:
+        A visitor class, with the attributes of the given passes.
+
+    """
+    if passes >= ALL_ANALYSIS_PASSES:
+        return AnalysisVisitor
+    bases: List[type] = [FunctionScopedVisitorMixin]
+    bases.extend(visitor for name, visitor in ANALYSIS_PASSES.items() if name in passes)
+    if "raises" not in passes:
+        bases.append(_TryOrderVisitorMixin)
+    return type(
+        "AnalysisVisitor[{}]".format(",".join(sorted(passes))),
+        tuple(bases),
+        {"__doc__": AnalysisVisitor.__doc__},
+    )
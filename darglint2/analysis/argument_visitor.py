@@ -20,7 +20,7 @@ class ArgumentVisitor(ast.NodeVisitor):
         else:
             self.types.append(None)
 
-    def visit_arguments(self, node: ast.arguments) -> ast.AST:
+    def add_arguments(self, node: ast.arguments) -> None:
         if hasattr(node, "posonlyargs"):
             for arg in node.posonlyargs:
                 self.add_arg_by_name(arg.arg, arg)
@@ -39,4 +39,7 @@ class ArgumentVisitor(ast.NodeVisitor):
         if node.kwarg is not None:
             name = "**" + node.kwarg.arg
             self.add_arg_by_name(name, node.kwarg)
+
+    def visit_arguments(self, node: ast.arguments) -> ast.AST:
+        self.add_arguments(node)
         return self.generic_visit(node)
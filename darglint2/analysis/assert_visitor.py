@@ -10,6 +10,9 @@ class AssertVisitor(ast.NodeVisitor):
 
         self.asserts: List[ast.Assert] = list()
 
-    def visit_Assert(self, node: ast.Assert) -> ast.AST:
+    def add_assert(self, node: ast.Assert) -> None:
         self.asserts.append(node)
+
+    def visit_Assert(self, node: ast.Assert) -> ast.AST:
+        self.add_assert(node)
         return self.generic_visit(node)
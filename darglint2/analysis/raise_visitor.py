@@ -240,59 +240,71 @@ class RaiseVisitor(ast.NodeVisitor):
     def context(self) -> Context:
         return self.contexts[-1]
 
-    def visit_Raise(self, node: ast.Raise) -> ast.AST:
+    def add_raise(self, node: ast.Raise) -> None:
         bubbles = self.context.add_exception(node)
-        if bubbles:
-            if len(self.contexts) < 2:
-                return self.generic_visit(node)
+        if bubbles and len(self.contexts) >= 2:
             parent_context = self.contexts[-2]
             parent_context.exceptions |= bubbles
 
+    def enter_try(self) -> None:
+        self.contexts.append(Context())
+
+    def enter_handler(self, handler: ast.ExceptHandler) -> None:
+        if handler.type:
+            if handler.name and (
+                isinstance(handler.type, ast.Name)
+                or isinstance(handler.type, ast.Tuple)
+            ):
+                self.context.add_variable(handler.name, handler.type)
+            elif isinstance(handler.type, ast.Attribute):
+                self.context.set_handling(handler.type)
+            elif isinstance(handler.type, ast.Name):
+                self.context.set_handling(handler.type)
+            elif isinstance(handler.type, ast.Tuple):
+                self.context.set_handling(handler.type)
+            else:
+                logger.error(
+                    "While getting the types of exceptions in "
+                    "the handler, expected to find an ast.Name, "
+                    "ast.Tuple, or ast.Attribute, but got {}".format(handler.type)
+                )
+            id = getattr(handler.type, "id", None)
+            if id:
+                self.context.remove_exception(id)
+        else:
+            # Handle a bare except.
+            #
+            # Since the bare except handles all exceptions,
+            # we have to clear all exceptions from the context.
+            # However, exceptions could also be raised from
+            # this handler.  So we can't clear the exceptions
+            # first.  But if we clear the exceptions second,
+            # then remove any new exceptions raised in the handler.
+            # What we need, then, is to know which new exceptions
+            # are raised, and clear all but them.  For that,
+            # we use a temporary context.
+            self.context.set_in_bare_handler()
+
+    def exit_handler(self, handler: ast.ExceptHandler) -> None:
+        if handler.type:
+            self.context.finish_handling()
+
+    def exit_try(self) -> None:
+        context = self.contexts.pop()
+        self.context.extend(context)
+
+    def visit_Raise(self, node: ast.Raise) -> ast.AST:
+        self.add_raise(node)
         return self.generic_visit(node)
 
     def visit_Try(self, node: ast.Try) -> None:
-        self.contexts.append(Context())
+        self.enter_try()
         for child in node.body:
             self.visit(child)
         for handler in node.handlers:
-            if handler.type:
-                if handler.name and (
-                    isinstance(handler.type, ast.Name)
-                    or isinstance(handler.type, ast.Tuple)
-                ):
-                    self.context.add_variable(handler.name, handler.type)
-                elif isinstance(handler.type, ast.Attribute):
-                    self.context.set_handling(handler.type)
-                elif isinstance(handler.type, ast.Name):
-                    self.context.set_handling(handler.type)
-                elif isinstance(handler.type, ast.Tuple):
-                    self.context.set_handling(handler.type)
-                else:
-                    logger.error(
-                        "While getting the types of exceptions in "
-                        "the handler, expected to find an ast.Name, "
-                        "ast.Tuple, or ast.Attribute, but got {}".format(handler.type)
-                    )
-                id = getattr(handler.type, "id", None)
-                if id:
-                    self.context.remove_exception(id)
-
-                self.generic_visit(handler)
-                self.context.finish_handling()
-            else:
-                # Handle a bare except.
-                #
-                # Since the bare except handles all exceptions,
-                # we have to clear all exceptions from the context.
-                # However, exceptions could also be raised from
-                # this handler.  So we can't clear the exceptions
-                # first.  But if we clear the exceptions second,
-                # then remove any new exceptions raised in the handler.
-                # What we need, then, is to know which new exceptions
-                # are raised, and clear all but them.  For that,
-                # we use a temporary context.
-                self.context.set_in_bare_handler()
-                self.generic_visit(handler)
+            self.enter_handler(handler)
+            self.generic_visit(handler)
+            self.exit_handler(handler)
 
         for child in node.finalbody:
             self.visit(child)
@@ -300,5 +312,4 @@ class RaiseVisitor(ast.NodeVisitor):
         for child in node.orelse:
             self.visit(child)
 
-        context = self.contexts.pop()
-        self.context.extend(context)
+        self.exit_try()
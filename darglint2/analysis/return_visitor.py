@@ -13,6 +13,9 @@ class ReturnVisitor(ast.NodeVisitor):
         self.returns: List[Optional[ast.Return]] = list()
         self.return_types: List[Optional[ast.AST]] = list()
 
-    def visit_Return(self, node: ast.Return) -> ast.AST:
+    def add_return(self, node: ast.Return) -> None:
         self.returns.append(node)
+
+    def visit_Return(self, node: ast.Return) -> ast.AST:
+        self.add_return(node)
         return self.generic_visit(node)
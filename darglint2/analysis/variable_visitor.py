@@ -8,9 +8,12 @@ class VariableVisitor(ast.NodeVisitor):
         super(VariableVisitor, self).__init__(*args, **kwargs)  # type: ignore
         self.variables: List[ast.Name] = list()
 
-    def visit_Name(self, node: ast.Name) -> ast.AST:
+    def add_variable(self, node: ast.Name) -> None:
         # Only gather names during assignment.  Others are unnecessary,
         # and could be from a different context.
         if hasattr(node, "ctx") and isinstance(node.ctx, ast.Store):
             self.variables.append(node)
+
+    def visit_Name(self, node: ast.Name) -> ast.AST:
+        self.add_variable(node)
         return self.generic_visit(node)
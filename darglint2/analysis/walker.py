@@ -0,0 +1,161 @@
+"""An iterative walker which runs the analysis passes over a function.
+
+The `AnalysisVisitor` finds what it needs by recursing through
+`ast.NodeVisitor.visit`, which looks up the method for each node
+by name, and recurses again through `generic_visit` for the nodes
+it doesn't handle.  Most nodes aren't handled by any pass, so most
+of that time is spent dispatching.  The walker instead keeps its
+own stack, and looks up the handlers for each type of node in a
+table built once for each set of passes.
+
+The passes still keep their state on (and are run by the methods
+of) the visitors, so the results are the same as for the
+`AnalysisVisitor`:
+
+- Only the first function (or lambda) is analyzed; any function
+  nested in it is skipped.
+- A node's handlers are run before its children are walked, and
+  the children are walked in the order of their fields.
+- A try statement is walked in the order of the `RaiseVisitor`:
+  the body, the handlers, the finally block, and then the else
+  block.
+
+"""
+
+import ast
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, List, Tuple, Type, Union, cast
+
+from .analysis_visitor import ALL_ANALYSIS_PASSES, get_analysis_visitor
+
+# The method each pass runs on each type of node, by the name of the
+# pass.  (See `ANALYSIS_PASSES`.)  No two passes handle the same type
+# of node.
+PASS_HANDLERS: Dict[str, Dict[Type[ast.AST], str]] = {
+    "abstract": {
+        ast.FunctionDef: "check_abstract",
+        ast.AsyncFunctionDef: "check_abstract",
+    },
+    "raises": {
+        ast.Raise: "add_raise",
+    },
+    "yields": {
+        ast.Yield: "add_yield",
+        ast.YieldFrom: "add_yield",
+    },
+    "arguments": {
+        ast.arguments: "add_arguments",
+    },
+    "variables": {
+        ast.Name: "add_variable",
+    },
+    "returns": {
+        ast.Return: "add_return",
+    },
+    "asserts": {
+        ast.Assert: "add_assert",
+    },
+}
+
+_FUNCTIONS = (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda)
+
+# An action to take once the nodes before it have been walked: a
+# method of the visitor, and the argument to call it with.
+_Action = Tuple[Callable[..., None], Union[ast.AST, None]]
+
+
+@lru_cache(maxsize=None)
+def get_handlers(
+    passes: FrozenSet[str],
+) -> Dict[Type[ast.AST], Callable[[ast.NodeVisitor, ast.AST], None]]:
+    """Get the handlers for each type of node, for the given passes.
+
+    Args:
+        passes: The names of the passes to run.
+
+    Returns:
+        The (unbound) method of the visitor to call on each type
+        of node.  Types of nodes which no pass handles are absent.
+
+    """
+    visitor = get_analysis_visitor(passes)
+    handlers = dict()
+    for name, methods in PASS_HANDLERS.items():
+        if name in passes:
+            for node_type, method in methods.items():
+                handlers[node_type] = getattr(visitor, method)
+    return handlers
+
+
+def walk(
+    function: ast.AST, passes: FrozenSet[str] = ALL_ANALYSIS_PASSES
+) -> ast.NodeVisitor:
+    """Run the given analysis passes over the function.
+
+    Args:
+        function: The function (or lambda) to analyze.
+        passes: The names of the passes to run.
+
+    Returns:
+        A visitor of the class returned by `get_analysis_visitor`,
+        holding the results of the passes, as if it had visited
+        the function.
+
+    """
+    # The methods of the passes are mixed in, so aren't known here.
+    visitor: Any = get_analysis_visitor(passes)()
+    handlers = get_handlers(passes)
+    raises = "raises" in passes
+    in_function = False
+    stack: List[Union[ast.AST, _Action]] = [function]
+    push = stack.append
+    pop = stack.pop
+    while stack:
+        node = pop()
+        if isinstance(node, tuple):
+            action, argument = node
+            if argument is None:
+                action()
+            else:
+                action(argument)
+            continue
+
+        node_type = type(node)
+        if node_type in _FUNCTIONS:
+            if in_function:
+                continue
+            in_function = True
+        handler = handlers.get(node_type)
+        if handler is not None:
+            handler(visitor, node)
+
+        if node_type is ast.Try:
+            # Pushed in reverse, so that they're walked in the order
+            # of the `RaiseVisitor`.
+            try_node = cast(ast.Try, node)
+            if raises:
+                push((visitor.exit_try, None))
+            stack.extend(reversed(try_node.orelse))
+            stack.extend(reversed(try_node.finalbody))
+            for child in reversed(try_node.handlers):
+                if raises:
+                    push((visitor.exit_handler, child))
+                    push(child)
+                    push((visitor.enter_handler, child))
+                else:
+                    push(child)
+            stack.extend(reversed(try_node.body))
+            if raises:
+                visitor.enter_try()
+            continue
+
+        # The children, in reverse, so that the first is walked first.
+        for field in reversed(node._fields):
+            value = getattr(node, field, None)
+            if isinstance(value, list):
+                for item in reversed(value):
+                    if isinstance(item, ast.AST):
+                        push(item)
+            elif isinstance(value, ast.AST):
+                push(value)
+    return visitor
@@ -12,10 +12,13 @@ class YieldVisitor(ast.NodeVisitor):
         # A list of the return nodes encountered.
         self.yields: List[Union[ast.Yield, ast.YieldFrom]] = list()
 
-    def visit_Yield(self, node: ast.Yield) -> ast.AST:
+    def add_yield(self, node: Union[ast.Yield, ast.YieldFrom]) -> None:
         self.yields.append(node)
+
+    def visit_Yield(self, node: ast.Yield) -> ast.AST:
+        self.add_yield(node)
         return self.generic_visit(node)
 
     def visit_YieldFrom(self, node: ast.YieldFrom) -> ast.AST:
-        self.yields.append(node)
+        self.add_yield(node)
         return self.generic_visit(node)
@@ -5,15 +5,34 @@ be accessed only through their getter/setter methods.
 These instances are not threadsafe: they should be
 updated only prior to spawning any threads.
 
+A configuration can be frozen into a snapshot, which can't be
+changed, and applied to the current thread (or task) with
+`Configuration.context`.  Within the context, `get_config` returns
+the snapshot rather than the global instance, so checks with
+different configurations can run at the same time.
+
 """
 
 import configparser
+import copy
 import logging
 import os
 from contextlib import contextmanager
+from contextvars import ContextVar
 from enum import Enum
 from logging import Logger
-from typing import Iterable, List, Optional, Set
+from typing import (
+    AbstractSet,
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    cast,
+)
 
 from .docstring.style import DocstringStyle
 from .strictness import Strictness
@@ -38,6 +57,12 @@ POSSIBLE_CONFIG_FILENAMES = (
 
 DEFAULT_DISABLED = {"DAR104"}
 
+# Sections longer than this are not parsed by the CYK parser, whose
+# cost grows with the cube of the number of tokens.  (Sections in
+# their canonical form are parsed in linear time, regardless.)  By
+# default there is no limit, since a limited section isn't checked.
+DEFAULT_MAX_SECTION_TOKENS = 0
+
 
 class AssertStyle(Enum):
     """Describes how to handle assertions."""
@@ -99,9 +124,19 @@ class Configuration:
         assert_style: The assert style to use (e.g. log on failed
             assertions, or raise exception on failed assertions.)
         log_level: Minimum level to log. All other log entries will be filtered out.
+        max_section_tokens: The maximum number of tokens in a section
+            which will be parsed by the CYK parser, or 0 for no limit.
+        parse_time_budget: The maximum number of seconds to spend
+            parsing a single docstring, or 0 for no limit.
 
     """
 
+    # Whether this is a snapshot, which can't be changed.
+    frozen = False
+
+    # The errors to ignore, computed when the snapshot is taken.
+    _errors_to_ignore: FrozenSet[str]
+
     def __init__(
         self,
         *,
@@ -116,6 +151,8 @@ class Configuration:
         indentation: int = 4,
         assert_style: AssertStyle = AssertStyle.LOG,
         log_level: LogLevel = LogLevel.CRITICAL,
+        max_section_tokens: int = DEFAULT_MAX_SECTION_TOKENS,
+        parse_time_budget: float = 0,
     ):
         """
         Init.
@@ -136,6 +173,10 @@ class Configuration:
             assert_style: The assert style to use (e.g. log on failed
                 assertions, or raise exception on failed assertions.)
             log_level: Minimum level to log. All other log entries will be filtered out.
+            max_section_tokens: The maximum number of tokens in a section
+                which will be parsed by the CYK parser, or 0 for no limit.
+            parse_time_budget: The maximum number of seconds to spend
+                parsing a single docstring, or 0 for no limit.
         """
         self.enable = enable or []
         self.ignore = ignore or []
@@ -148,6 +189,56 @@ class Configuration:
         self.indentation = indentation
         self.assert_style = assert_style
         self.log_level = log_level
+        self.max_section_tokens = max_section_tokens
+        self.parse_time_budget = parse_time_budget
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if self.frozen:
+            raise AttributeError(
+                "Unable to set {}: the configuration is a frozen snapshot.".format(name)
+            )
+        super().__setattr__(name, value)
+
+    def snapshot(self) -> "Configuration":
+        """Get a frozen copy of the configuration.
+
+        The lists in the copy are made tuples, and the errors to
+        ignore are computed once.
+
+        Returns:
+            The copy, which raises an `AttributeError` if it's
+            changed.  A snapshot is its own snapshot.
+
+        """
+        if self.frozen:
+            return self
+        snapshot = copy.copy(self)
+        attributes = vars(snapshot)
+        for name in ("enable", "ignore", "ignore_raise"):
+            attributes[name] = tuple(attributes[name])
+        attributes["_errors_to_ignore"] = frozenset(self.errors_to_ignore)
+        attributes["frozen"] = True
+        return snapshot
+
+    def replace(self, **changes: Any) -> "Configuration":
+        """Get a snapshot of the configuration with some options changed.
+
+        Args:
+            changes: The new values of the options, by their
+                attribute names.
+
+        Returns:
+            A frozen copy with the changes.  The configuration
+            itself (which may be a snapshot) is left as it was.
+
+        """
+        replaced = copy.copy(self)
+        attributes = vars(replaced)
+        attributes.pop("frozen", None)
+        attributes.pop("_errors_to_ignore", None)
+        for name, value in changes.items():
+            setattr(replaced, name, value)
+        return replaced.snapshot()
 
     @property
     def log_level(self) -> LogLevel:
@@ -160,7 +251,7 @@ class Configuration:
         logger.setLevel(log_level.value)
 
     @property
-    def errors_to_ignore(self) -> Set[str]:
+    def errors_to_ignore(self) -> AbstractSet[str]:
         """
         Get the errors to ignore, accounting for defaults.
 
@@ -170,6 +261,8 @@ class Configuration:
         Returns:
             The error codes to ignore.
         """
+        if self.frozen:
+            return self._errors_to_ignore
         disabled = DEFAULT_DISABLED - set(self.enable)
         return set(self.ignore) | disabled
 
@@ -196,13 +289,22 @@ class Configuration:
         )
 
     @contextmanager
-    def context(self):
+    def context(self) -> Iterator["Configuration"]:
         """
-        Get a contextmanager for applying this configuration globally.
+        Get a contextmanager for applying a snapshot of this configuration.
+
+        The snapshot is only applied in the current thread (or task),
+        so other threads can use other configurations.
+
+        Yields:
+            The snapshot, which `get_config` returns in the context.
         """
-        old_config = set_config(self)
-        yield
-        set_config(old_config)
+        snapshot = self.snapshot()
+        token = _current_config.set(snapshot)
+        try:
+            yield snapshot
+        finally:
+            _current_config.reset(token)
 
 
 def load_config_file(filename: str) -> Configuration:
@@ -230,6 +332,8 @@ def load_config_file(filename: str) -> Configuration:
     strictness = Strictness.FULL_DESCRIPTION
     indentation = 4
     log_level = LogLevel.CRITICAL
+    max_section_tokens = DEFAULT_MAX_SECTION_TOKENS
+    parse_time_budget = 0.0
     if "darglint2" in config.sections():
         if "ignore" in config["darglint2"]:
             errors = config["darglint2"]["ignore"]
@@ -270,6 +374,28 @@ def load_config_file(filename: str) -> Configuration:
 
         if "log_level" in config["darglint2"]:
             log_level = LogLevel.from_string(config["darglint2"]["log_level"])
+
+        if "max_section_tokens" in config["darglint2"]:
+            try:
+                max_section_tokens = int(config["darglint2"]["max_section_tokens"])
+            except ValueError:
+                raise Exception(
+                    "Unrecognized value for max_section_tokens.  Expected "
+                    "a non-negative integer, but received {}".format(
+                        config["darglint2"]["max_section_tokens"]
+                    )
+                )
+
+        if "parse_time_budget" in config["darglint2"]:
+            try:
+                parse_time_budget = float(config["darglint2"]["parse_time_budget"])
+            except ValueError:
+                raise Exception(
+                    "Unrecognized value for parse_time_budget.  Expected "
+                    "a number of seconds, but received {}".format(
+                        config["darglint2"]["parse_time_budget"]
+                    )
+                )
     return Configuration(
         ignore=ignore,
         message_template=message_template,
@@ -281,6 +407,8 @@ def load_config_file(filename: str) -> Configuration:
         enable=enable,
         indentation=indentation,
         log_level=log_level,
+        max_section_tokens=max_section_tokens,
+        parse_time_budget=parse_time_budget,
     )
 
 
@@ -368,6 +496,12 @@ def get_config_from_file() -> Configuration:
 # The global instance of the config file to use.
 _config = get_config_from_file()
 
+# The snapshot applied in the current context, if any.  (See
+# `Configuration.context`.)
+_current_config: ContextVar[Optional[Configuration]] = ContextVar(
+    "darglint2_config", default=None
+)
+
 
 def set_config(config: Configuration) -> Configuration:
     """
@@ -387,17 +521,145 @@ def set_config(config: Configuration) -> Configuration:
     return old_config
 
 
-def get_config():
-    """Get the global instance of the configuration.
+def get_config() -> Configuration:
+    """Get the configuration for the current context.
 
-    This instance is not threadsafe, and should only
-    be updated in the initial launching script.
-    I considered adding a mutability option, to make
-    this more explicit, but I think it's obvious enough
-    that you shouldn't modify the configuration elsewhere.
+    The global instance is not threadsafe, and should only
+    be updated in the initial launching script.  Checks which
+    run concurrently should each apply a snapshot, instead.
+    (See `Configuration.context`.)
 
     Returns:
-        A global configuration instance.
+        The snapshot applied in the current context, or else
+        the global configuration instance.
 
     """
-    return _config
+    config = _current_config.get()
+    if config is None:
+        return _config
+    return config
+
+
+class ConfigResolver(object):
+    """Resolves the configuration for each file checked.
+
+    A file is checked with the configuration in the nearest config
+    file above it which has a `[darglint2]` section, so that the
+    projects in a monorepo can each have their own.  The contents of
+    each directory, and each config file, are remembered for as long
+    as their modification times don't change.
+
+    Every file with the same nearest config file shares the same
+    snapshot of its configuration.
+
+    """
+
+    def __init__(
+        self,
+        default: Optional[Configuration] = None,
+        overrides: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Create a resolver.
+
+        Args:
+            default: The configuration for files without a config
+                file of their own, which is used as it is.  By
+                default, the global instance.
+            overrides: The options given on the command line, by
+                their attribute names, which take precedence over
+                every config file.
+
+        """
+        self.default = (default or get_config()).snapshot()
+        self.overrides = overrides or dict()
+
+        # The config filenames in each directory, by the directory's
+        # modification time.
+        self._directories: Dict[str, Tuple[int, List[str]]] = dict()
+
+        # The snapshot of each config file, or None if it doesn't
+        # have a section for darglint2, by the file's modification
+        # time and size.
+        self._files: Dict[str, Tuple[Tuple[int, int], Optional[Configuration]]] = dict()
+
+    def _get_candidates(self, directory: str) -> List[str]:
+        try:
+            mtime = os.stat(directory).st_mtime_ns
+        except OSError:
+            return []
+        cached = self._directories.get(directory)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        candidates = [
+            os.path.join(directory, filename)
+            for filename in POSSIBLE_CONFIG_FILENAMES
+            if os.path.isfile(os.path.join(directory, filename))
+        ]
+        self._directories[directory] = (mtime, candidates)
+        return candidates
+
+    def _load(self, filename: str) -> Optional[Configuration]:
+        try:
+            stat = os.stat(filename)
+        except OSError:
+            return None
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = self._files.get(filename)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        config: Optional[Configuration] = None
+        parser = configparser.ConfigParser()
+        try:
+            parser.read(filename)
+        except configparser.Error:
+            get_logger().error("Unable to parse file {}".format(filename))
+        else:
+            if "darglint2" in parser.sections():
+                # Loading a configuration sets the level of the logger,
+                # which should stay as it was set for the run.
+                level = get_logger().level
+                config = load_config_file(filename)
+                get_logger().setLevel(level)
+                for name, value in self.overrides.items():
+                    setattr(config, name, value)
+                config = config.snapshot()
+        self._files[filename] = (stamp, config)
+        return config
+
+    def find_config_file(self, directory: str) -> Optional[str]:
+        """Find the nearest config file with a section for darglint2.
+
+        Args:
+            directory: The directory to search from.
+
+        Returns:
+            The path of the config file in the directory, or in
+            the nearest of its parents, or None if there isn't one.
+
+        """
+        directory = os.path.abspath(directory)
+        while True:
+            for candidate in self._get_candidates(directory):
+                if self._load(candidate) is not None:
+                    return candidate
+            parent = os.path.dirname(directory)
+            if parent == directory:
+                return None
+            directory = parent
+
+    def get_config(self, filename: str) -> Configuration:
+        """Get the configuration to check the file with.
+
+        Args:
+            filename: The path of the file.
+
+        Returns:
+            A snapshot of the configuration in the nearest config
+            file, with the overrides applied, or the default
+            configuration if there isn't one.
+
+        """
+        config_file = self.find_config_file(os.path.dirname(os.path.abspath(filename)))
+        if config_file is None:
+            return self.default
+        return cast(Configuration, self._load(config_file))
@@ -1,9 +1,26 @@
 from abc import ABC, abstractmethod
-from typing import Callable, ClassVar, Dict, Iterable, List, Optional, Tuple, Union
+from typing import Callable, ClassVar, Dict, Iterable, List, Optional, Set, Tuple, Union
 
+from ..errors import ParseBudgetExceededError
+from ..node import CykNode
 from ..strictness import Strictness
+from ..token import TokenType
 from .sections import Sections
 
+# The sections whose headers start with each type of token.  (In
+# Sphinx, after a colon.)
+_HEADERS = {
+    TokenType.ARGUMENTS: Sections.ARGUMENTS_SECTION,
+    TokenType.ARGUMENT_TYPE: Sections.ARGUMENTS_SECTION,
+    TokenType.VARIABLES: Sections.VARIABLES_SECTION,
+    TokenType.VARIABLE_TYPE: Sections.VARIABLES_SECTION,
+    TokenType.RAISES: Sections.RAISES_SECTION,
+    TokenType.RETURNS: Sections.RETURNS_SECTION,
+    TokenType.RETURN_TYPE: Sections.RETURNS_SECTION,
+    TokenType.YIELDS: Sections.YIELDS_SECTION,
+    TokenType.YIELD_TYPE: Sections.YIELDS_SECTION,
+}
+
 
 class BaseDocstring(ABC):
     """The interface for a docstring object which can be used with checkers.
@@ -114,6 +131,19 @@ class BaseDocstring(ABC):
     def ignore_all(self) -> bool:
         pass
 
+    @abstractmethod
+    def get_sections_over_budget(self) -> Set[Sections]:
+        """Get the sections which exceeded the parse budget.
+
+        Such a section is parsed as a long description, so its
+        items are missing from the docstring.
+
+        Returns:
+            The sections whose items are unknown.
+
+        """
+        pass
+
     def satisfies_strictness(self, strictness):
         # type(Strictness) -> bool
         """Return true if the docstring has no more than the min strictness.
@@ -141,3 +171,29 @@ class BaseDocstring(ABC):
             )
         else:
             return False
+
+
+def get_sections_over_budget(root: Optional[CykNode]) -> Set[Sections]:
+    """Get the sections in the tree which exceeded the parse budget.
+
+    Args:
+        root: The root of the docstring's tree.
+
+    Returns:
+        The sections whose nodes are annotated with a
+        `ParseBudgetExceededError`, going by their headers.
+
+    """
+    sections: Set[Sections] = set()
+    if root is None:
+        return sections
+    for node in root.in_order_traverse():
+        if ParseBudgetExceededError not in node.annotations:
+            continue
+        for leaf in node.in_order_traverse():
+            if leaf.value is None or leaf.value.token_type == TokenType.COLON:
+                continue
+            if leaf.value.token_type in _HEADERS:
+                sections.add(_HEADERS[leaf.value.token_type])
+            break
+    return sections
@@ -0,0 +1,113 @@
+"""Detects the style of a docstring, for the `auto` style.
+
+Each style has sections (or fields) which the others don't:
+
+- Sphinx fields start a line with a colon and a keyword, such as
+  `:param x:` or `:rtype:`.
+- Numpy sections are titles underlined with hyphens, such as
+  `Parameters` followed by a line of `----------`.
+- Google sections start a line with a keyword and a colon, such as
+  `Args:` or `Returns:`.
+
+The condensed tokens of the docstring are scanned once, and the
+style with the most of these wins.  A docstring with none of them
+(e.g. only a short description) reads the same in any style, and
+is treated as Google's.
+
+"""
+
+from typing import List
+
+from ..lex import condense, lex
+from ..token import Token, TokenType
+from .style import DocstringStyle
+
+# The keywords which can follow the colon starting a sphinx field.
+_SPHINX_FIELDS = {
+    TokenType.ARGUMENTS,
+    TokenType.ARGUMENT_TYPE,
+    TokenType.VARIABLES,
+    TokenType.VARIABLE_TYPE,
+    TokenType.RETURNS,
+    TokenType.RETURN_TYPE,
+    TokenType.YIELDS,
+    TokenType.YIELD_TYPE,
+    TokenType.RAISES,
+}
+
+# The shortest underline of a numpy section.  (A single hyphen
+# is more likely to be an item in a list.)
+_MIN_UNDERLINE = 3
+
+# The keywords which can start a google section.
+_GOOGLE_SECTIONS = {
+    TokenType.ARGUMENTS,
+    TokenType.RETURNS,
+    TokenType.YIELDS,
+    TokenType.RAISES,
+}
+
+
+def detect_style_of_tokens(tokens: List[Token]) -> DocstringStyle:
+    """Detect the style of a docstring from its tokens.
+
+    Args:
+        tokens: The condensed tokens of the docstring.
+
+    Returns:
+        The style with the most sections (or fields) in the
+        docstring.  Ties go to numpy, then sphinx, then google.
+
+    """
+    google = sphinx = numpy = 0
+    n = len(tokens)
+
+    # Whether the next token starts a line (ignoring indentation),
+    # and whether the previous line could be a numpy section title.
+    line_start = True
+    line_is_title = False
+    previous_is_title = False
+    for i, token in enumerate(tokens):
+        token_type = token.token_type
+        if token_type == TokenType.NEWLINE:
+            line_start = True
+            previous_is_title = line_is_title
+            line_is_title = False
+            continue
+        if token_type == TokenType.INDENT:
+            continue
+        following = tokens[i + 1].token_type if i + 1 < n else None
+        if line_start:
+            line_is_title = token_type != TokenType.COLON
+            if (
+                token_type == TokenType.HEADER
+                and previous_is_title
+                and len(token.value) >= _MIN_UNDERLINE
+            ):
+                numpy += 1
+            elif token_type == TokenType.COLON and following in _SPHINX_FIELDS:
+                sphinx += 1
+            elif token_type in _GOOGLE_SECTIONS and following == TokenType.COLON:
+                google += 1
+        elif token_type == TokenType.COLON:
+            line_is_title = False
+        line_start = False
+
+    if numpy and numpy >= sphinx and numpy >= google:
+        return DocstringStyle.NUMPY
+    if sphinx and sphinx >= google:
+        return DocstringStyle.SPHINX
+    return DocstringStyle.GOOGLE
+
+
+def detect_style(docstring: str) -> DocstringStyle:
+    """Detect the style of a docstring.
+
+    Args:
+        docstring: The docstring.
+
+    Returns:
+        The style the docstring is (most likely) written in.
+
+    """
+    return detect_style_of_tokens(condense(lex(docstring)))
@@ -1,3 +1,6 @@
+from typing import List, Union
+
+from ..token import Token
 from . import google, numpy, sphinx
 from .base import BaseDocstring
 
@@ -6,7 +9,7 @@ class Docstring(object):
     """A factory method for creating docstrings."""
 
     @staticmethod
-    def from_google(root: str) -> BaseDocstring:
+    def from_google(root: Union[str, List[Token]]) -> BaseDocstring:
         return google.Docstring(root)
 
     @staticmethod
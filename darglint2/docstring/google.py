@@ -12,6 +12,7 @@ from typing import (  # noqa: F401
 
 from ..custom_assert import Assert
 from ..errors import DarglintError
+from ..flat_tree import FlatNode, FlatTree
 from ..lex import condense, lex
 from ..node import CykNode
 from ..parse.google import parse
@@ -21,10 +22,11 @@ from ..parse.identifiers import (
     ArgumentTypeIdentifier,
     ExceptionIdentifier,
     ExceptionItemIdentifier,
-    Identifier,
     NoqaIdentifier,
 )
-from .base import BaseDocstring
+from ..profiling import note_tokens, timed
+from ..token import Token
+from .base import BaseDocstring, get_sections_over_budget
 from .sections import Sections
 from .style import DocstringStyle
 
@@ -69,6 +71,29 @@ class _CykVisitor(object):
         self.marks.append(mark)
 
 
+class _Lookup(Dict[str, List[FlatNode]]):
+    """The nodes in a flat tree, by symbol and by identifier.
+
+    This acts as a `defaultdict(list)`, but the lists of nodes are
+    only built from the tree's index when they're first used.
+
+    """
+
+    def __init__(self, tree: FlatTree) -> None:
+        super().__init__()
+        self.tree = tree
+
+    def __missing__(self, key: str) -> List[FlatNode]:
+        nodes = self[key] = self.tree.get_nodes(key)
+        return nodes
+
+    def __contains__(self, key: object) -> bool:
+        return super().__contains__(key) or key in self.tree.index
+
+    def get(self, key, default=None):  # type: ignore
+        return self[key] if key in self else default
+
+
 class Docstring(BaseDocstring):
     """The docstring class interprets the AST of a docstring."""
 
@@ -83,14 +108,16 @@ class Docstring(BaseDocstring):
     )
 
     def __init__(
-        self, root: Union[CykNode, str], style: DocstringStyle = DocstringStyle.GOOGLE
+        self,
+        root: Union[CykNode, str, List[Token]],
+        style: DocstringStyle = DocstringStyle.GOOGLE,
     ) -> None:
         """Create a new docstring from the AST.
 
         Args:
-            root: The root of the AST, or the docstring
-                (as a string.)  If it is a string, the
-                string will be parsed.
+            root: The root of the AST, the docstring (as a
+                string), or its condensed tokens.  A string or
+                tokens will be parsed.
             style: The style of the docstring.  Discarded,
                 since this Docstring is always the Google style.
 
@@ -98,24 +125,15 @@ class Docstring(BaseDocstring):
         if isinstance(root, CykNode):
             self.root = root
         else:
-            self.root = parse(condense(lex(root)))
-        self._lookup = self._discover()
-
-    def _discover(self) -> Dict[str, List[CykNode]]:
-        """Walk the tree, finding all non-terminal nodes.
-
-        Returns:
-            A lookup table for compound Nodes by their NodeType.
-
-        """
-        lookup: Dict[str, List[CykNode]] = defaultdict(lambda: list())
-        for node in self.root.in_order_traverse():
-            if node.annotations:
-                for annotation in node.annotations:
-                    if issubclass(annotation, Identifier):
-                        lookup[annotation.key].append(node)
-            lookup[node.symbol].append(node)
-        return lookup
+            if isinstance(root, list):
+                tokens = root
+            else:
+                with timed("lex/condense"):
+                    tokens = condense(lex(root))
+            note_tokens(len(tokens))
+            self.root = parse(tokens)
+        self._tree = FlatTree(self.root)
+        self._lookup = _Lookup(self._tree)
 
     def get_section(self, section: Sections) -> Optional[str]:
         nodes: Optional[List[CykNode]] = []
@@ -302,6 +320,15 @@ class Docstring(BaseDocstring):
 
         return {key: sorted(values) for key, values in noqas.items()}
 
+    def get_sections_over_budget(self) -> Set[Sections]:
+        """Get the sections which exceeded the parse budget.
+
+        Returns:
+            The sections whose items are unknown.
+
+        """
+        return get_sections_over_budget(self.root)
+
     def get_style_errors(self) -> Iterable[Tuple[Callable, Tuple[int, int]]]:
         """Get any style errors annotated on the tree.
 
@@ -311,10 +338,9 @@ class Docstring(BaseDocstring):
         # noqa: I302
 
         """
-        for node, _ in _CykVisitor(self.root):
-            for annotation in node.annotations:
-                if issubclass(annotation, DarglintError):
-                    yield annotation, node.line_numbers
+        tree = self._tree
+        for annotation, i in tree.get_annotated(DarglintError):
+            yield annotation, (tree.first_lines[i], tree.last_lines[i])
 
     def get_line_numbers(self, symbol: str) -> Optional[Tuple[int, int]]:
         """Get the line numbers for the first instance of the given section.
@@ -7,7 +7,7 @@ if it's proven more efficient or is much cleaner.
 """
 import copy
 from collections import defaultdict
-from typing import Callable, Dict, Iterable, List, Optional, Tuple, Type, Union
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, Type, Union
 
 from ..custom_assert import Assert
 from ..errors import DarglintError
@@ -23,7 +23,9 @@ from ..parse.identifiers import (
     YieldTypeIdentifier,
 )
 from ..parse.numpy import parse
-from .base import BaseDocstring
+from ..profiling import note_tokens, timed
+from ..token import Token
+from .base import BaseDocstring, get_sections_over_budget
 from .sections import Sections
 from .style import DocstringStyle
 
@@ -40,15 +42,17 @@ class Docstring(BaseDocstring):
     )
 
     def __init__(
-        self, root: Union[CykNode, str], style: DocstringStyle = DocstringStyle.SPHINX
+        self,
+        root: Union[CykNode, str, List[Token]],
+        style: DocstringStyle = DocstringStyle.SPHINX,
     ) -> None:
         # noqa: E501
         """Create a new docstring from the AST.
 
         Args:
-            root: The root of the AST, or the docstring
-                (as a string.)  If it is a string, the
-                string will be parsed.
+            root: The root of the AST, the docstring (as a
+                string), or its condensed tokens.  A string or
+                tokens will be parsed.
             style: The docstring style.  Discarded, since this
                 docstring always represents the Numpy style.
 
@@ -56,7 +60,13 @@ class Docstring(BaseDocstring):
         if isinstance(root, CykNode):
             self.root: Optional[CykNode] = root
         else:
-            self.root = parse(condense(lex(root)))
+            if isinstance(root, list):
+                tokens = root
+            else:
+                with timed("lex/condense"):
+                    tokens = condense(lex(root))
+            note_tokens(len(tokens))
+            self.root = parse(tokens)
         self._lookup = self._discover()
 
     def _discover(self, node: Optional[CykNode] = None) -> Dict[str, List[CykNode]]:
@@ -302,6 +312,15 @@ class Docstring(BaseDocstring):
         """
         return False
 
+    def get_sections_over_budget(self) -> Set[Sections]:
+        """Get the sections which exceeded the parse budget.
+
+        Returns:
+            The sections whose items are unknown.
+
+        """
+        return get_sections_over_budget(self.root)
+
     def get_style_errors(self) -> Iterable[Tuple[Callable, Tuple[int, int]]]:
         """Get any style errors annotated on the tree.
 
@@ -7,7 +7,9 @@ from ..lex import condense, lex
 from ..node import CykNode
 from ..parse.identifiers import Identifier, NoqaIdentifier
 from ..parse.sphinx import parse
-from .base import BaseDocstring
+from ..profiling import note_tokens, timed
+from ..token import Token
+from .base import BaseDocstring, get_sections_over_budget
 from .sections import Sections
 from .style import DocstringStyle
 
@@ -16,15 +18,17 @@ class Docstring(BaseDocstring):
     """The docstring class interprets the AST of a docstring."""
 
     def __init__(
-        self, root: Union[CykNode, str], style: DocstringStyle = DocstringStyle.SPHINX
+        self,
+        root: Union[CykNode, str, List[Token]],
+        style: DocstringStyle = DocstringStyle.SPHINX,
     ) -> None:
         # noqa: E501
         """Create a new docstring from the AST.
 
         Args:
-            root: The root of the AST, or the docstring
-                (as a string.)  If it is a string, the
-                string will be parsed.
+            root: The root of the AST, the docstring (as a
+                string), or its condensed tokens.  A string or
+                tokens will be parsed.
             style: The docstring style.  Discarded, since this
                 docstring always represents the Sphinx style.
 
@@ -32,7 +36,13 @@ class Docstring(BaseDocstring):
         if isinstance(root, CykNode):
             self.root = root
         else:
-            self.root = parse(condense(lex(root)))
+            if isinstance(root, list):
+                tokens = root
+            else:
+                with timed("lex/condense"):
+                    tokens = condense(lex(root))
+            note_tokens(len(tokens))
+            self.root = parse(tokens)
         self._lookup = self._discover()
 
     def _discover(self) -> Dict[str, List[CykNode]]:
@@ -278,6 +288,15 @@ class Docstring(BaseDocstring):
         """
         return False
 
+    def get_sections_over_budget(self) -> Set[Sections]:
+        """Get the sections which exceeded the parse budget.
+
+        Returns:
+            The sections whose items are unknown.
+
+        """
+        return get_sections_over_budget(self.root)
+
     def get_style_errors(self) -> Iterable[Tuple[Callable, Tuple[int, int]]]:
         """Get any style errors annotated on the tree.
 
@@ -6,6 +6,9 @@ class DocstringStyle(enum.Enum):
     SPHINX = 1
     NUMPY = 2
 
+    # Detected for each docstring.  (See `docstring.detect`.)
+    AUTO = 3
+
     @classmethod
     def from_string(cls, style):
         style = style.lower().strip()
@@ -15,6 +18,8 @@ class DocstringStyle(enum.Enum):
             return cls.SPHINX
         if style == "numpy":
             return cls.NUMPY
+        if style == "auto":
+            return cls.AUTO
 
         raise Exception(
             'Unrecognized style "{}".  Should be one of {}'.format(
@@ -1,19 +1,32 @@
 """Defines the command line interface for darglint2."""
 import argparse
-import ast
 import inspect
-import pathlib
+import os
 import sys
-from typing import List
+from typing import Any, Dict, List, Optional
 
 import darglint2.errors
-from darglint2.error_report import ErrorReport
 
-from . import __version__
-from .config import LogLevel, get_config, get_logger
+from . import __version__, profiling
+from .config import (
+    DEFAULT_MAX_SECTION_TOKENS,
+    ConfigResolver,
+    LogLevel,
+    get_config,
+    get_logger,
+)
 from .docstring.style import DocstringStyle
-from .function_description import get_function_descriptions, read_program
-from .integrity_checker import IntegrityChecker
+from .output import WRITERS
+from .parse.ordering import grammar_statistics
+from .pipeline import (
+    analyze,
+    check,
+    check_files,
+    get_error_reports,
+    parse,
+    read,
+    render,
+)
 from .strictness import Strictness
 
 # ---------------------- ARGUMENT PARSER -----------------------------
@@ -33,6 +46,18 @@ parser.add_argument(
         "    path: The relative file path.\n"
     ),
 )
+parser.add_argument(
+    "--format",
+    "-f",
+    type=str,
+    default="text",
+    choices=["text"] + sorted(WRITERS),
+    help=(
+        "The output format.  `text` formats each error with the "
+        "message template.  `jsonl` writes each error as a JSON "
+        "object on its own line, and `sarif` writes a SARIF log."
+    ),
+)
 parser.add_argument(
     "--ignore-regex",
     "-i",
@@ -106,10 +131,11 @@ parser.add_argument(
     "-s",
     "--docstring-style",
     default=None,
-    choices=["google", "sphinx", "numpy"],
+    choices=["google", "sphinx", "numpy", "auto"],
     help=(
         "The docstring style used in the given project. Currently, "
-        "only google, sphinx, and numpy styles are supported."
+        "only google, sphinx, and numpy styles are supported.  With "
+        "auto, the style of each docstring is detected."
     ),
 )
 parser.add_argument(
@@ -168,6 +194,71 @@ parser.add_argument(
         "ERROR level."
     ),
 )
+parser.add_argument(
+    "--max-section-tokens",
+    type=int,
+    default=None,
+    help=(
+        "The maximum number of tokens in a section which will be "
+        "parsed in full.  Longer sections which aren't in the "
+        "canonical form are only parsed as a description, and "
+        "reported with DAR006.  Defaults to {} (no limit).".format(
+            DEFAULT_MAX_SECTION_TOKENS
+        )
+    ),
+)
+parser.add_argument(
+    "--parse-time-budget",
+    type=float,
+    default=None,
+    help=(
+        "The maximum number of seconds to spend parsing a single "
+        "docstring.  Sections which can't be parsed in time are "
+        "reported with DAR006.  Use 0 (the default) for no limit."
+    ),
+)
+parser.add_argument(
+    "--grammar-statistics",
+    type=str,
+    default=None,
+    help=(
+        "A file to keep the number of times each grammar parsed the "
+        "sections it was tried on, which decides the order grammars "
+        "are tried in, and the number of docstrings detected in each "
+        "style with `--docstring-style auto`.  It's read (if it exists) "
+        "before the run, and written after it."
+    ),
+)
+
+parser.add_argument(
+    "--profile",
+    nargs="?",
+    const="text",
+    default=None,
+    choices=["text", "json"],
+    help=(
+        "Time each phase of the run (parsing the module, lexing and "
+        "parsing the docstrings, and each check), and report the "
+        "totals along with the slowest docstrings at the end of the "
+        "run.  The report is a table by default, or JSON if `json` "
+        "is given."
+    ),
+)
+parser.add_argument(
+    "--profile-output",
+    type=str,
+    default=None,
+    help=(
+        "The file to write the profiling report to.  By default, "
+        "the report is written to stderr."
+    ),
+)
+parser.add_argument(
+    "--profile-top",
+    type=int,
+    default=profiling.DEFAULT_TOP,
+    help="The number of slowest docstrings to include in the profile.",
+)
 
 # ---------------------- MAIN SCRIPT ---------------------------------
 
@@ -191,23 +282,65 @@ def get_error_report(
         An error report for the file.
 
     """
-    program = read_program(filename)
-    try:
-        tree = ast.parse(program)
-        functions = get_function_descriptions(tree)
-        checker = IntegrityChecker(
-            raise_errors=raise_errors_for_syntax,
-        )
-        for function in functions:
-            checker.schedule(function)
-        return checker.get_error_report_string(
-            verbosity,
-            filename,
-        )
-    except SyntaxError as e:
-        error = darglint2.errors.PythonSyntaxError(e)
-        report = ErrorReport([error], filename, verbosity)
-        return str(report)
+    modules = parse(read([filename]))
+    reports = check(analyze(modules), verbosity, raise_errors_for_syntax)
+    return next(render(reports))
+
+
+def get_overrides(args: argparse.Namespace) -> Dict[str, Any]:
+    """Get the options given on the command line.
+
+    Args:
+        args: The parsed arguments.
+
+    Returns:
+        The values of the options which were given, by the names
+        of their attributes in the `Configuration`.
+
+    """
+    overrides: Dict[str, Any] = dict()
+
+    # Only override enable if explicitly passed.
+    if args.enable:
+        overrides["enable"] = [x.strip() for x in args.enable.split(",")]
+
+    if args.indentation:
+        overrides["indentation"] = args.indentation
+
+    if args.docstring_style == "sphinx":
+        overrides["style"] = DocstringStyle.SPHINX
+    elif args.docstring_style == "google":
+        overrides["style"] = DocstringStyle.GOOGLE
+    elif args.docstring_style == "numpy":
+        overrides["style"] = DocstringStyle.NUMPY
+    elif args.docstring_style == "auto":
+        overrides["style"] = DocstringStyle.AUTO
+
+    if args.strictness == "short":
+        overrides["strictness"] = Strictness.SHORT_DESCRIPTION
+    elif args.strictness == "long":
+        overrides["strictness"] = Strictness.LONG_DESCRIPTION
+    elif args.strictness == "full":
+        overrides["strictness"] = Strictness.FULL_DESCRIPTION
+
+    if args.log_level:
+        overrides["log_level"] = LogLevel.from_string(args.log_level)
+
+    if args.ignore_regex:
+        overrides["ignore_regex"] = args.ignore_regex
+    if args.ignore_raise:
+        overrides["ignore_raise"] = [x.strip() for x in args.ignore_raise.split(",")]
+    if args.ignore_properties:
+        overrides["ignore_properties"] = args.ignore_properties
+
+    if args.message_template:
+        overrides["message_template"] = args.message_template
+
+    if args.max_section_tokens is not None:
+        overrides["max_section_tokens"] = args.max_section_tokens
+    if args.parse_time_budget is not None:
+        overrides["parse_time_budget"] = args.parse_time_budget
+    return overrides
 
 
 def print_error_list():
@@ -226,6 +359,27 @@ def print_version():
     print(__version__)
 
 
+def write_profile(
+    profiler: profiling.Profiler, kind: str, output: Optional[str] = None
+):
+    """Write the profiling report for the run.
+
+    Args:
+        profiler: The profiler which timed the run.
+        kind: The format of the report: `json`, or `text` for
+            a table.
+        output: The file to write the report to.  By default,
+            it's written to stderr.
+
+    """
+    report = profiler.to_json() if kind == "json" else profiler.summary()
+    if output:
+        with open(output, "w") as fout:
+            fout.write(report + "\n")
+    else:
+        print(report, file=sys.stderr)
+
+
 def main() -> None:
     """Run darglint2.
 
@@ -243,66 +397,56 @@ def main() -> None:
     if args.version:
         print_version()
 
-    # Expand directories.
-    files = []
-    for f in args.files:
-        p = pathlib.Path(f)
-        if not p.is_dir() and p.suffix == ".py":
-            files.append(f)
-        # Convert back to strings to not require modifications of any
-        # subsequent code.
-        files.extend(str(i) for i in p.glob("**/*.py"))
-
     try:
         config = get_config()
-
-        # Only override enable if explicitly passed.
-        if args.enable:
-            config.enable = [x.strip() for x in args.enable.split(",")]
+        overrides = get_overrides(args)
+        for name, value in overrides.items():
+            setattr(config, name, value)
 
         if "*" in config.ignore:
             sys.exit(0)
 
-        if args.indentation:
-            config.indentation = args.indentation
-
-        if args.docstring_style == "sphinx":
-            config.style = DocstringStyle.SPHINX
-        elif args.docstring_style == "google":
-            config.style = DocstringStyle.GOOGLE
-        elif args.docstring_style == "numpy":
-            config.style = DocstringStyle.NUMPY
+        # Each file is checked with its nearest config file, with
+        # the options given on the command line.
+        configs = ConfigResolver(config, overrides)
 
-        if args.strictness == "short":
-            config.strictness = Strictness.SHORT_DESCRIPTION
-        elif args.strictness == "long":
-            config.strictness = Strictness.LONG_DESCRIPTION
-        elif args.strictness == "full":
-            config.strictness = Strictness.FULL_DESCRIPTION
+        if args.profile:
+            profiling.enable(args.profile_top)
 
-        if args.log_level:
-            config.log_level = LogLevel.from_string(args.log_level)
-
-        if args.ignore_regex:
-            config.ignore_regex = args.ignore_regex
-        if args.ignore_raise:
-            config.ignore_raise = [x.strip() for x in args.ignore_raise.split(",")]
-        if args.ignore_properties:
-            config.ignore_properties = args.ignore_properties
-
-        if args.message_template:
-            config.message_template = args.message_template
+        if args.grammar_statistics and os.path.exists(args.grammar_statistics):
+            grammar_statistics.load(args.grammar_statistics)
 
         raise_errors_for_syntax = args.raise_syntax or False
-        for filename in files:
-            error_report = get_error_report(
-                filename,
+        if args.format == "text":
+            for error_report in check_files(
+                args.files,
+                args.verbosity,
+                raise_errors_for_syntax,
+                configs=configs,
+            ):
+                if error_report:
+                    print(error_report + "\n")
+                    encountered_errors = True
+        else:
+            writer = WRITERS[args.format](sys.stdout, args.verbosity)
+            writer.start()
+            for report in get_error_reports(
+                args.files,
                 args.verbosity,
                 raise_errors_for_syntax,
-            )
-            if error_report:
-                print(error_report + "\n")
-                encountered_errors = True
+                configs=configs,
+            ):
+                if report.errors:
+                    writer.write(report)
+                    encountered_errors = True
+            writer.finish()
+
+        if args.grammar_statistics:
+            grammar_statistics.save(args.grammar_statistics)
+
+        profiler = profiling.disable()
+        if profiler:
+            write_profile(profiler, args.profile, args.profile_output)
     except Exception as exc:
         # Exit with status 129 regardless of whether user wants a
         # exit code or not -- darglint2 failed, and it should
@@ -1,13 +1,12 @@
 """The error reporting classes."""
 
-import ast  # noqa
 from collections import OrderedDict
-from typing import Dict, Iterator, List, Tuple, Union
+from typing import Dict, Iterator, List, Optional, Tuple
 
-from darglint2.config import get_config  # noqa
+from darglint2.config import Configuration, get_config  # noqa
 
 from .errors import DarglintError  # noqa
-from .function_description import get_line_number_from_function
+from .function_description import FunctionLocation
 
 
 class ErrorReport(object):
@@ -18,6 +17,7 @@ class ErrorReport(object):
         errors: List[DarglintError],
         filename: str,
         verbosity: int = 2,
+        config: Optional[Configuration] = None,
     ) -> None:
         """Create a new error report.
 
@@ -26,24 +26,27 @@ class ErrorReport(object):
             filename: The name of the file the error came from.
             verbosity: A number in the set, {1, 2}, representing low
                 and high verbosity.
+            config: The configuration the errors were found with.
+                By default, the configuration for the current context
+                when the errors are formatted.
 
         """
         self.filename = filename
+        self.config = config
         self.verbosity = verbosity
         self.errors = errors
         self.error_dict = self._group_errors_by_function()
 
     def _sort(self) -> None:
-        self.errors.sort(key=lambda x: x.function.lineno)
+        self.errors.sort(key=lambda x: x.function)
 
     def _group_errors_by_function(
         self,
-    ) -> Dict[Union[ast.FunctionDef, ast.AsyncFunctionDef], List[DarglintError]]:
-        # noqa: E501
+    ) -> Dict[FunctionLocation, List[DarglintError]]:
         """Sort the current errors by function, and put into an OrderedDict.
 
         Returns:
-            An ordered dictionary of functions and their errors.
+            An ordered dictionary of function locations and their errors.
 
         """
         self._sort()
@@ -67,6 +70,37 @@ class ErrorReport(object):
 
         return error_dict
 
+    def _get_line_number(self, error: DarglintError) -> int:
+        # TODO: Shouldn't the signature's line number already account
+        # for the decorators?  Why do we have to handle them here?
+        _, line_number = error.function.line_numbers
+        return line_number + error.function.decorators
+
+    def get_line_number(self, error: DarglintError) -> int:
+        """Get the line number where the error is reported.
+
+        Args:
+            error: The error to locate.
+
+        Returns:
+            The line number, as given to the message template.
+
+        """
+        line_number = self._get_line_number(error)
+        if error.line_numbers:
+            line_number += error.line_numbers[0] + 1
+        return line_number
+
+    def __iter__(self) -> Iterator[DarglintError]:
+        """Iterate over the errors in the order they are reported.
+
+        Yields:
+            The errors, grouped by function.
+
+        """
+        for function in self.error_dict:
+            yield from self.error_dict[function]
+
     def _get_error_description(self, error: DarglintError) -> str:
         """Get the error description.
 
@@ -77,17 +111,13 @@ class ErrorReport(object):
             A string representing the error.
 
         """
-        line_number = get_line_number_from_function(error.function)
-        if hasattr(error.function, "decorator_list") and error.function.decorator_list:
-            line_number += len(error.function.decorator_list)
-        if error.line_numbers:
-            line_number += error.line_numbers[0] + 1
-        return get_config().message_template.format(
+        config = self.config or get_config()
+        return config.message_template.format(
             msg_id=error.error_code,
             msg=error.message(verbosity=self.verbosity),
             path=self.filename,
             obj=error.function.name,
-            line=line_number,  # error.function.lineno,
+            line=self.get_line_number(error),
         )
 
     def __str__(self) -> str:
@@ -109,15 +139,7 @@ class ErrorReport(object):
         # line, col, message
         for function in self.error_dict:
             for error in self.error_dict[function]:
-                # TODO: Shouldn't get_line_number (here and above) return
-                # the correct line number?  Why do we have to handle decorators
-                # here?
-                line_number = get_line_number_from_function(error.function)
-                if (
-                    hasattr(error.function, "decorator_list")
-                    and error.function.decorator_list
-                ):
-                    line_number += len(error.function.decorator_list)
+                line_number = self._get_line_number(error)
                 if error.line_numbers:
                     line_number += error.line_numbers[0] + 1
                 else:
@@ -21,7 +21,19 @@ DAR101.
 
 """
 import ast  # noqa: F401
-from typing import Tuple, Union
+from typing import Optional, Tuple, Union
+
+from .function_description import (
+    FunctionDescription,
+    FunctionLocation,
+    get_function_location,
+)
+
+# Anything an error can be located by.  The error only keeps
+# the function's location.
+Function = Union[
+    ast.FunctionDef, ast.AsyncFunctionDef, FunctionDescription, FunctionLocation
+]
 
 
 class DarglintError(BaseException):
@@ -43,6 +55,9 @@ class DarglintError(BaseException):
     # See the description of error code groups above.
     error_code: str = None
 
+    # Where the function containing the error is defined.
+    function: FunctionLocation
+
     # The first and last line numbers where the error occurs.
     line_numbers: Tuple[int, int] = None
 
@@ -75,8 +90,8 @@ class DarglintError(BaseException):
 
     def __init__(
         self,
-        function: Union[ast.FunctionDef, ast.AsyncFunctionDef],
-        line_numbers: Tuple[int, int] = None,
+        function: Function,
+        line_numbers: Optional[Tuple[int, int]] = None,
     ) -> None:
         """Create a new exception with a message and line number.
 
@@ -85,11 +100,11 @@ class DarglintError(BaseException):
                 base class have not been implemented.
 
         Args:
-            function: An ast node for the function.
+            function: The function, or its location.
             line_numbers: The line numbers where this error occurs.
 
         """
-        self.function = function
+        self.function = get_function_location(function)
 
         if line_numbers:
             self.line_numbers = line_numbers
@@ -120,7 +135,18 @@ class PythonSyntaxError(DarglintError):
         """
         self.general_message = "Python syntax error"
         self.terse_message = "s {}".format(source)
-        self.line_numbers = (source.lineno or 0, source.lineno or 0)
+
+        # Other errors are numbered relative to the line after the
+        # function's signature, so locate this one just before the
+        # start of the module.
+        self.function = FunctionLocation(
+            lineno=0,
+            name="",
+            line_numbers=(-1, -1),
+            decorators=0,
+        )
+        lineno = source.lineno or 0
+        self.line_numbers = (lineno, lineno)
 
 
 class GenericSyntaxError(DarglintError):
@@ -131,7 +157,7 @@ class GenericSyntaxError(DarglintError):
 
     def __init__(
         self,
-        function: Union[ast.FunctionDef, ast.AsyncFunctionDef],
+        function: Function,
         message: str,
         line_numbers: Tuple[int, int] = None,
     ) -> None:
@@ -139,7 +165,7 @@ class GenericSyntaxError(DarglintError):
         """Instantiate the error's message.
 
         Args:
-            function: An ast node for the function.
+            function: The function, or its location.
             message: The parser error's message.
             line_numbers: The line numbers where this error occurs.
 
@@ -161,7 +187,7 @@ class EmptyDescriptionError(DarglintError):
 
     def __init__(
         self,
-        function: Union[ast.FunctionDef, ast.AsyncFunctionDef],
+        function: Function,
         message: str,
         line_numbers: Tuple[int, int] = None,
     ) -> None:
@@ -169,7 +195,7 @@ class EmptyDescriptionError(DarglintError):
         """Instantiate the error's message.
 
         Args:
-            function: An ast node for the function.
+            function: The function, or its location.
             message: The parser error's message.
             line_numbers: The line numbers where this error occurs.
                 Unused.
@@ -191,12 +217,12 @@ class IndentError(DarglintError):
     description = "A line is under-indented or over-indented."
 
     def __init__(
-        self, function: ast.FunctionDef, line_numbers: Tuple[int, int] = None
+        self, function: Function, line_numbers: Tuple[int, int] = None
     ) -> None:
         """Instantiate the eror's message.
 
         Args:
-            function: An ast node for the function.
+            function: The function, or its location.
             line_numbers: The line numbers where this error occurs.
 
         """
@@ -216,7 +242,7 @@ class ExcessNewlineError(DarglintError):
     description = "The docstring contains an extra newline where it shouldn't."
 
     def __init__(
-        self, function: ast.FunctionDef, line_numbers: Tuple[int, int] = None
+        self, function: Function, line_numbers: Tuple[int, int] = None
     ) -> None:
         self.general_message = "Excess newline."
         self.terse_message = "+>"
@@ -234,7 +260,7 @@ class EmptyTypeError(DarglintError):
 
     def __init__(
         self,
-        function: Union[ast.FunctionDef, ast.AsyncFunctionDef],
+        function: Function,
         message: str,
         line_numbers: Tuple[int, int] = None,
     ) -> None:
@@ -242,7 +268,7 @@ class EmptyTypeError(DarglintError):
         """Instantiate the error's message.
 
         Args:
-            function: An ast node for the function.
+            function: The function, or its location.
             message: The parser error's message.
             line_numbers: The line numbers where this error occurs.
                 Unused.
@@ -257,6 +283,33 @@ class EmptyTypeError(DarglintError):
         )
 
 
+class ParseBudgetExceededError(DarglintError):
+    """Describes when a section was too costly to parse fully."""
+
+    error_code = "DAR006"
+    description = (
+        "A section exceeded the parse budget, so the docstring "
+        "was not fully analyzed."
+    )
+
+    def __init__(
+        self, function: Function, line_numbers: Optional[Tuple[int, int]] = None
+    ) -> None:
+        """Instantiate the error's message.
+
+        Args:
+            function: The function, or its location.
+            line_numbers: The line numbers where this error occurs.
+
+        """
+        self.general_message = "Not fully analyzed"
+        self.terse_message = "~budget"
+        super(ParseBudgetExceededError, self).__init__(
+            function,
+            line_numbers=line_numbers,
+        )
+
+
 class MissingParameterError(DarglintError):
     """Describes when a docstring is missing a parameter in the definition."""
 
@@ -265,14 +318,14 @@ class MissingParameterError(DarglintError):
 
     def __init__(
         self,
-        function: Union[ast.FunctionDef, ast.AsyncFunctionDef],
+        function: Function,
         name: str,
         line_numbers: Tuple[int, int] = None,
     ) -> None:
         """Instantiate the error's message.
 
         Args:
-            function: An ast node for the function.
+            function: The function, or its location.
             name: The name of the argument that is missing.
             line_numbers: The line numbers where this error occurs.
 
@@ -293,14 +346,14 @@ class ExcessParameterError(DarglintError):
 
     def __init__(
         self,
-        function: Union[ast.FunctionDef, ast.AsyncFunctionDef],
+        function: Function,
         name: str,
         line_numbers: Tuple[int, int] = None,
     ) -> None:
         """Instantiate the error's message.
 
         Args:
-            function: An ast node for the function.
+            function: The function, or its location.
             name: The name of the argument that is excess.
             line_numbers: The line numbers where this error occurs.
 
@@ -321,7 +374,7 @@ class ParameterTypeMismatchError(DarglintError):
 
     def __init__(
         self,
-        function: Union[ast.FunctionDef, ast.AsyncFunctionDef],
+        function: Function,
         name: str,
         expected: str,
         actual: str,
@@ -330,7 +383,7 @@ class ParameterTypeMismatchError(DarglintError):
         """Instantiate the error's message.
 
         Args:
-            function: An ast node for the function.
+            function: The function, or its location.
             name: The name of the parameter.
             expected: The type defined in the function.
             actual: The type described in the docstring.
@@ -360,14 +413,14 @@ class ParameterTypeMissingError(DarglintError):
 
     def __init__(
         self,
-        function: Union[ast.FunctionDef, ast.AsyncFunctionDef],
+        function: Function,
         name: str,
         line_numbers: Tuple[int, int] = None,
     ) -> None:
         """Instantiate the error's message.
 
         Args:
-            function: An ast node for the function.
+            function: The function, or its location.
             name: The name of the parameter.
             line_numbers: The line numbers where this error occurs.
 
@@ -394,7 +447,7 @@ class ParameterMalformedError(DarglintError):
 
     def __init__(
         self,
-        function: Union[ast.FunctionDef, ast.AsyncFunctionDef],
+        function: Function,
         name: str,
         line_numbers: Tuple[int, int] = None,
     ) -> None:
@@ -415,13 +468,13 @@ class MissingReturnError(DarglintError):
 
     def __init__(
         self,
-        function: Union[ast.FunctionDef, ast.AsyncFunctionDef],
+        function: Function,
         line_numbers: Tuple[int, int] = None,
     ) -> None:
         """Instantiate the error's message.
 
         Args:
-            function: An ast node for the function.
+            function: The function, or its location.
             line_numbers: The line numbers where this error occurs.
 
         """
@@ -442,13 +495,13 @@ class ExcessReturnError(DarglintError):
 
     def __init__(
         self,
-        function: Union[ast.FunctionDef, ast.AsyncFunctionDef],
+        function: Function,
         line_numbers: Tuple[int, int] = None,
     ) -> None:
         """Instantiate the error's message.
 
         Args:
-            function: An ast node for the function.
+            function: The function, or its location.
             line_numbers: The line numbers where this error occurs.
 
         """
@@ -469,7 +522,7 @@ class ReturnTypeMismatchError(DarglintError):
 
     def __init__(
         self,
-        function: Union[ast.FunctionDef, ast.AsyncFunctionDef],
+        function: Function,
         expected: str,
         actual: str,
         line_numbers: Tuple[int, int] = None,
@@ -477,7 +530,7 @@ class ReturnTypeMismatchError(DarglintError):
         """Instantiate the error's message.
 
         Args:
-            function: An ast node for the function.
+            function: The function, or its location.
             expected: The type defined in the function.
             actual: The type described in the docstring.
             line_numbers: The line numbers where this error occurs.
@@ -504,13 +557,13 @@ class MissingYieldError(DarglintError):
 
     def __init__(
         self,
-        function: Union[ast.FunctionDef, ast.AsyncFunctionDef],
+        function: Function,
         line_numbers: Tuple[int, int] = None,
     ) -> None:
         """Instantiate the error's message.
 
         Args:
-            function: An ast node for the function.
+            function: The function, or its location.
             line_numbers: The line numbers where this error occurs.
 
         """
@@ -531,13 +584,13 @@ class ExcessYieldError(DarglintError):
 
     def __init__(
         self,
-        function: Union[ast.FunctionDef, ast.AsyncFunctionDef],
+        function: Function,
         line_numbers: Tuple[int, int] = None,
     ) -> None:
         """Instantiate the error's message.
 
         Args:
-            function: An ast node for the function.
+            function: The function, or its location.
             line_numbers: The line numbers where this error occurs.
 
         """
@@ -558,14 +611,14 @@ class MissingRaiseError(DarglintError):
 
     def __init__(
         self,
-        function: Union[ast.FunctionDef, ast.AsyncFunctionDef],
+        function: Function,
         name: str,
         line_numbers: Tuple[int, int] = None,
     ) -> None:
         """Instantiate the error's message.
 
         Args:
-            function: An ast node for the function.
+            function: The function, or its location.
             name: The name of the exception that is missing.
             line_numbers: The line numbers where this error occurs.
 
@@ -594,14 +647,14 @@ class ExcessRaiseError(DarglintError):
 
     def __init__(
         self,
-        function: Union[ast.FunctionDef, ast.AsyncFunctionDef],
+        function: Function,
         name: str,
         line_numbers: Tuple[int, int] = None,
     ) -> None:
         """Instantiate the error's message.
 
         Args:
-            function: An ast node for the function.
+            function: The function, or its location.
             name: The name of the exception that is surplus.
             line_numbers: The line numbers where this error occurs.
 
@@ -623,14 +676,14 @@ class ExcessVariableError(DarglintError):
 
     def __init__(
         self,
-        function: Union[ast.FunctionDef, ast.AsyncFunctionDef],
+        function: Function,
         name: str,
         line_numbers: Tuple[int, int] = None,
     ) -> None:
         """Instantiate the error's message.
 
         Args:
-            function: The ast node for the function.
+            function: The function, or its location.
             name: The name of the variable which is in excess.
             line_numbers: The first and last line numbers where this
                 error occurs.
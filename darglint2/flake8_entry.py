@@ -1,23 +1,111 @@
 """The entry point for flake8."""
 
-from typing import Iterator, Tuple
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Iterator, List, Optional, Tuple
 
 from . import __version__
-from .config import get_config
+from .config import Configuration, get_config
 from .docstring.style import DocstringStyle
-from .function_description import get_function_descriptions
+from .function_description import FunctionDescription, get_function_descriptions
 from .integrity_checker import IntegrityChecker
+from .result_cache import ResultCache, get_cache_directory, get_key
 from .strictness import Strictness
 
+# The number of functions a file must have before its docstrings
+# are checked in a worker pool, by default.
+DEFAULT_JOBS_THRESHOLD = 100
+
+# The number of chunks given to each worker, so that a chunk with
+# slow docstrings doesn't leave the other workers idle.
+CHUNKS_PER_JOB = 4
+
+# The worker processes, which are started for the first large file
+# and kept for the rest of the files checked in this process, since
+# starting them can take longer than checking the file.  (They're
+# shut down when the interpreter exits.)
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_jobs = 0
+_executor_lock = threading.Lock()
+
+
+def _get_executor(jobs: int) -> ProcessPoolExecutor:
+    """Get the pool of worker processes, starting it if need be.
+
+    Args:
+        jobs: The number of worker processes.
+
+    Returns:
+        The pool, with the given number of workers.
+
+    """
+    global _executor, _executor_jobs
+    with _executor_lock:
+        if _executor is None or _executor_jobs != jobs:
+            if _executor is not None:
+                _executor.shutdown()
+            _executor = ProcessPoolExecutor(max_workers=jobs)
+            _executor_jobs = jobs
+        return _executor
+
+
+def _discard_executor(executor: ProcessPoolExecutor) -> None:
+    """Forget a pool whose workers died, so the next file starts another.
+
+    Args:
+        executor: The broken pool.
+
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is executor:
+            _executor = None
+
+
+def _check_functions(
+    config: Configuration,
+    functions: List[FunctionDescription],
+    verbosity: int,
+    filename: str,
+) -> List[Tuple[int, int, str]]:
+    """Check the functions, in a worker process.
+
+    Args:
+        config: The configuration to check the functions with.
+        functions: The functions to check.
+        verbosity: The verbosity of the messages.
+        filename: The file the functions are in.
+
+    Returns:
+        The errors, as flake8 reports them.
+
+    """
+    checker = IntegrityChecker(raise_errors=False, config=config)
+    for function in functions:
+        checker.run_checks(function)
+    error_report = checker.get_error_report(verbosity, filename)
+    return list(error_report.flake8_report())
+
 
 class DarglintChecker(object):
     name = "flake8-darglint2"
     version = __version__
     config = get_config()
 
-    def __init__(self, tree, filename):
+    # The number of worker processes to check a large file with, and
+    # the number of functions which makes a file large.
+    jobs = 1
+    jobs_threshold = DEFAULT_JOBS_THRESHOLD
+
+    # The cache of the errors reported for each file, if it's enabled.
+    result_cache: Optional[ResultCache] = None
+
+    def __init__(self, tree, filename, lines=None):
         self.tree = tree
         self.filename = filename
+        self.lines = lines
         self.verbosity = 2
 
     def run(self) -> Iterator[Tuple[int, int, str, type]]:
@@ -28,17 +116,39 @@ class DarglintChecker(object):
         # exception raised by Darglint2, we can at least give a decent
         # idea of where it was raised.
         last_line = 1
+        cache = self.result_cache
+        key = self._get_cache_key()
+        if cache is not None and key is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                for line, col, msg in cached:
+                    yield (line, col, msg, type(self))
+                return
+
         try:
-            functions = get_function_descriptions(self.tree)
             checker = IntegrityChecker(
                 raise_errors=False,
+                config=self.config,
             )
-            checker.config = self.config
-            for function in functions:
-                checker.run_checks(function)
-
-            error_report = checker.get_error_report(self.verbosity, self.filename)
-            for line, col, msg in error_report.flake8_report():
+            # The functions are grouped by kind (properties, methods,
+            # then functions), so they're put in the order the errors
+            # are reported in, which lets the workers' reports be
+            # joined without changing the order.
+            functions = sorted(
+                get_function_descriptions(self.tree, passes=checker.analysis_passes),
+                key=lambda function: function.location,
+            )
+            report: List[Tuple[int, int, str]]
+            if self._use_workers(functions):
+                report = self._check_in_workers(functions)
+            else:
+                for function in functions:
+                    checker.run_checks(function)
+                error_report = checker.get_error_report(self.verbosity, self.filename)
+                report = list(error_report.flake8_report())
+            if cache is not None and key is not None:
+                cache.set(key, report)
+            for line, col, msg in report:
                 last_line = line
                 yield (line, col, msg, type(self))
 
@@ -50,6 +160,65 @@ class DarglintChecker(object):
                 type(self),
             )
 
+    def _get_cache_key(self) -> Optional[str]:
+        # With a time budget, whether a docstring is fully parsed
+        # depends on how busy the machine is, so it isn't cached.
+        if (
+            self.result_cache is None
+            or self.lines is None
+            or self.config.parse_time_budget
+        ):
+            return None
+        return get_key(self.lines, self.config, self.verbosity)
+
+    def _use_workers(self, functions: List[FunctionDescription]) -> bool:
+        # Worker processes can't be started from flake8's own workers,
+        # which are daemons, so those files are checked serially.
+        return (
+            self.jobs > 1
+            and len(functions) >= self.jobs_threshold
+            and not multiprocessing.current_process().daemon
+        )
+
+    def _check_in_workers(
+        self, functions: List[FunctionDescription]
+    ) -> List[Tuple[int, int, str]]:
+        """Check the functions in a pool of worker processes.
+
+        Args:
+            functions: The functions in the file, sorted by location.
+
+        Returns:
+            The errors, as flake8 reports them, in the order the
+            serial check reports them.
+
+        Raises:
+            BrokenProcessPool: If a worker died.  The pool is
+                discarded, so that the next file starts another.
+
+        """
+        size = -(-len(functions) // (self.jobs * CHUNKS_PER_JOB))
+        chunks = [functions[i : i + size] for i in range(0, len(functions), size)]
+        report: List[Tuple[int, int, str]] = list()
+        executor = _get_executor(self.jobs)
+        futures = [
+            executor.submit(
+                _check_functions,
+                self.config,
+                chunk,
+                self.verbosity,
+                self.filename,
+            )
+            for chunk in chunks
+        ]
+        try:
+            for future in futures:
+                report.extend(future.result())
+        except BrokenProcessPool:
+            _discard_executor(executor)
+            raise
+        return report
+
     @classmethod
     def add_options(cls, option_manager):
         defaults = cls.config
@@ -78,8 +247,55 @@ class DarglintChecker(object):
             ),
         )
 
+        option_manager.add_option(
+            "--darglint2-jobs",
+            type=int,
+            default=cls.jobs,
+            parse_from_config=True,
+            help=(
+                "The number of worker processes Darglint2 checks the "
+                "docstrings of a large file with.  (Default: 1, which "
+                "checks them serially.)"
+            ),
+        )
+
+        option_manager.add_option(
+            "--darglint2-jobs-threshold",
+            type=int,
+            default=cls.jobs_threshold,
+            parse_from_config=True,
+            help=(
+                "The number of functions a file must have for Darglint2 "
+                "to check it with worker processes.  (Default: {})".format(
+                    DEFAULT_JOBS_THRESHOLD
+                )
+            ),
+        )
+
+        option_manager.add_option(
+            "--darglint2-cache",
+            action="store_true",
+            parse_from_config=True,
+            help=(
+                "Cache the errors Darglint2 reports for each file.  "
+                "(The cache is stored in $DARGLINT2_CACHE_DIR, or in "
+                "$XDG_CACHE_HOME/darglint2.  It isn't pruned, and can be "
+                "deleted at any time.)"
+            ),
+        )
+
     @classmethod
     def parse_options(cls, options):
-        cls.config.style = DocstringStyle.from_string(options.docstring_style)
-        cls.config.strictness = Strictness.from_string(options.strictness)
-        cls.config.ignore_regex = options.darglint2_ignore_regex
+        # The options are applied to a snapshot, rather than to the
+        # global configuration, which other checks may be reading.
+        cls.config = cls.config.replace(
+            style=DocstringStyle.from_string(options.docstring_style),
+            strictness=Strictness.from_string(options.strictness),
+            ignore_regex=options.darglint2_ignore_regex,
+        )
+        cls.jobs = options.darglint2_jobs
+        cls.jobs_threshold = options.darglint2_jobs_threshold
+        if options.darglint2_cache:
+            cls.result_cache = ResultCache(get_cache_directory())
+        else:
+            cls.result_cache = None
@@ -0,0 +1,255 @@
+"""A parse tree stored as parallel arrays.
+
+The parser builds a tree of `CykNode`s, which is convenient to build,
+but slow to query: finding every node with a given symbol, or the
+lines a node spans, means chasing pointers through the whole tree.
+Once the tree is built, it's only read, so it can be flattened into
+arrays, indexed by the position of each node in a pre-order walk:
+
+- The symbol of each node (as an id into the list of symbols.)
+- The token of each leaf (as an index into the list of tokens.)
+- The left and right children, and the end of the subtree.  (A
+  node's subtree is contiguous, from the node up to its end.)
+- The first and last line spanned by the node.
+
+The nodes are indexed by symbol, and by the keys of the identifiers
+annotating them, in the order of an in-order walk.  `FlatNode` is a
+view of a node with the interface of a `CykNode`, for the code which
+follows paths through the tree.
+
+"""
+
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .node import CykNode
+from .parse.identifiers import Identifier
+from .token import Token
+
+
+class FlatTree(object):
+    """A read-only parse tree, stored as parallel arrays."""
+
+    def __init__(self, root: CykNode) -> None:
+        """Flatten the tree.
+
+        Args:
+            root: The root of the tree to flatten.
+
+        """
+        symbol_names: List[str] = list()
+        symbols: List[int] = list()
+        tokens: List[Token] = list()
+        token_indices: List[int] = list()
+        annotations: List[List[Any]] = list()
+        lefts: List[int] = list()
+        rights: List[int] = list()
+        in_order: List[int] = list()
+        in_order_positions: List[int] = list()
+        annotated: List[int] = list()
+
+        # The nodes with each symbol, by the symbol's id, and the
+        # nodes with each identifier, by its key.
+        by_symbol: List[List[int]] = list()
+        by_identifier: Dict[str, List[int]] = dict()
+
+        # An iterative in-order walk reaches the nodes in pre-order
+        # (as it descends) and visits them in order (as it returns),
+        # so the arrays, the in-order walk and the index can all be
+        # built in one pass.  A left child is always the node after
+        # its parent, and a right child is the next node reached
+        # after its parent is visited.
+        symbol_ids: Dict[str, int] = dict()
+        nodes: List[CykNode] = list()
+        indices: List[int] = list()
+        curr: Optional[CykNode] = root
+        i = 0
+        while nodes or curr:
+            while curr:
+                symbol = symbol_ids.get(curr.symbol)
+                if symbol is None:
+                    symbol = symbol_ids[curr.symbol] = len(symbol_names)
+                    symbol_names.append(curr.symbol)
+                    by_symbol.append(list())
+                symbols.append(symbol)
+                if curr.value:
+                    token_indices.append(len(tokens))
+                    tokens.append(curr.value)
+                else:
+                    token_indices.append(-1)
+                annotations.append(curr.annotations)
+                if curr.annotations:
+                    annotated.append(i)
+                rights.append(-1)
+                nodes.append(curr)
+                indices.append(i)
+                in_order_positions.append(-1)
+                i += 1
+                curr = curr.lchild
+                lefts.append(i if curr else -1)
+            curr = nodes.pop()
+            j = indices.pop()
+            in_order_positions[j] = len(in_order)
+            in_order.append(j)
+            by_symbol[symbols[j]].append(j)
+            for annotation in curr.annotations:
+                if issubclass(annotation, Identifier):
+                    by_identifier.setdefault(annotation.key, list()).append(j)
+            curr = curr.rchild
+            if curr:
+                rights[j] = i
+
+        # The children come after their parent, so the subtrees
+        # and line spans are found in one pass, backwards.
+        n = len(symbols)
+        ends = [0] * n
+        first_lines = [-1] * n
+        last_lines = [-1] * n
+        for i in range(n - 1, -1, -1):
+            left = lefts[i]
+            right = rights[i]
+            if right >= 0:
+                ends[i] = ends[right]
+            elif left >= 0:
+                ends[i] = ends[left]
+            else:
+                ends[i] = i + 1
+            token = token_indices[i]
+            if token >= 0:
+                first_lines[i] = last_lines[i] = tokens[token].line_number
+                continue
+            if left >= 0:
+                first_lines[i] = first_lines[left]
+            last_lines[i] = last_lines[right] if right >= 0 else first_lines[i]
+
+        self.symbol_names = symbol_names
+        self.symbols = symbols
+        self.tokens = tokens
+        self.token_indices = token_indices
+        self.annotations = annotations
+        self.lefts = lefts
+        self.rights = rights
+        self.ends = ends
+        self.first_lines = first_lines
+        self.last_lines = last_lines
+        self.in_order = in_order
+        self.in_order_positions = in_order_positions
+        self.annotated = annotated
+        # Symbols are kebab-case, and the keys of identifiers are
+        # prefixed with "id_", so they share an index.
+        self.index = dict(zip(symbol_names, by_symbol))
+        self.index.update(by_identifier)
+
+        self._views: List[Optional[FlatNode]] = [None] * n
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def get_node(self, i: int) -> "FlatNode":
+        """Get a view of a node.
+
+        Args:
+            i: The index of the node.
+
+        Returns:
+            The view.  There is only one view for each node.
+
+        """
+        view = self._views[i]
+        if view is None:
+            view = self._views[i] = FlatNode(self, i)
+        return view
+
+    def get_nodes(self, key: str) -> List["FlatNode"]:
+        """Get the nodes with the given symbol or identifier.
+
+        Args:
+            key: The symbol, or the key of an identifier.
+
+        Returns:
+            Views of the nodes, in order.
+
+        """
+        return [self.get_node(i) for i in self.index.get(key, [])]
+
+    def get_in_order(self, i: int) -> List[int]:
+        """Get the indices of the subtree's nodes, in order.
+
+        Args:
+            i: The index of the root of the subtree.
+
+        Returns:
+            The indices, in the order of an in-order walk.
+
+        """
+        first = i
+        while self.lefts[first] >= 0:
+            first = self.lefts[first]
+        start = self.in_order_positions[first]
+        return self.in_order[start : start + self.ends[i] - i]
+
+    def get_annotated(self, annotation_type: type) -> Iterator[Tuple[Any, int]]:
+        """Get the annotations of the given type, with their nodes.
+
+        Args:
+            annotation_type: The base class of the annotations.
+
+        Yields:
+            Each annotation, and the index of the node it's on.  The
+            nodes are visited parents first, and right to left.
+
+        """
+        # A node comes before the nodes beneath it, and a subtree
+        # comes before any subtree to its left (which ends first.)
+        for i in sorted(self.annotated, key=lambda i: (-self.ends[i], i)):
+            for annotation in self.annotations[i]:
+                if issubclass(annotation, annotation_type):
+                    yield annotation, i
+
+
+class FlatNode(CykNode):
+    """A view of a node in a `FlatTree`, which acts as a `CykNode`."""
+
+    def __init__(self, tree: FlatTree, index: int) -> None:
+        """Create a view of the node.
+
+        Args:
+            tree: The tree the node is in.
+            index: The index of the node.
+
+        """
+        self.tree = tree
+        self.index = index
+
+    @property  # type: ignore
+    def symbol(self) -> str:  # type: ignore
+        return self.tree.symbol_names[self.tree.symbols[self.index]]
+
+    @property  # type: ignore
+    def value(self) -> Optional[Token]:  # type: ignore
+        token = self.tree.token_indices[self.index]
+        return self.tree.tokens[token] if token >= 0 else None
+
+    @property  # type: ignore
+    def annotations(self) -> List[Any]:  # type: ignore
+        return self.tree.annotations[self.index]
+
+    @property  # type: ignore
+    def lchild(self) -> Optional["FlatNode"]:  # type: ignore
+        left = self.tree.lefts[self.index]
+        return self.tree.get_node(left) if left >= 0 else None
+
+    @property  # type: ignore
+    def rchild(self) -> Optional["FlatNode"]:  # type: ignore
+        right = self.tree.rights[self.index]
+        return self.tree.get_node(right) if right >= 0 else None
+
+    @property
+    def line_numbers(self) -> Tuple[int, int]:
+        return (
+            self.tree.first_lines[self.index],
+            self.tree.last_lines[self.index],
+        )
+
+    def in_order_traverse(self) -> Iterator[CykNode]:
+        for i in self.tree.get_in_order(self.index):
+            yield self.tree.get_node(i)
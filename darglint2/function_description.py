@@ -2,11 +2,23 @@
 import ast
 import sys
 from enum import Enum
-from typing import Any, Iterator, List, Optional, Tuple, Type, Union
+from typing import (
+    Any,
+    FrozenSet,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 
 from .analysis.analysis_helpers import _has_decorator
-from .analysis.analysis_visitor import AnalysisVisitor
+from .analysis.analysis_visitor import ALL_ANALYSIS_PASSES
 from .analysis.function_and_method_visitor import FunctionAndMethodVisitor
+from .analysis.walker import walk
 from .config import get_logger
 
 logger = get_logger()
@@ -97,6 +109,51 @@ def get_line_number_from_function(
     return line_number
 
 
+class FunctionLocation(NamedTuple):
+    """Where a function is defined, as reported in errors.
+
+    Errors hold on to this rather than to the function's node, so
+    that a module's tree can be collected once it has been checked.
+    The fields are ordered so that locations sort by line.
+
+    """
+
+    # The line of the `def` statement.
+    lineno: int
+
+    name: str
+
+    # The first and last lines of the signature.  The last line
+    # is the one given by `get_line_number_from_function`.
+    line_numbers: Tuple[int, int]
+
+    # The number of decorators applied to the function.
+    decorators: int
+
+
+def get_function_location(function: Any) -> FunctionLocation:
+    """Get the location of the given function.
+
+    Args:
+        function: The function's node, its description, or
+            its location.
+
+    Returns:
+        The location of the function.
+
+    """
+    if isinstance(function, FunctionLocation):
+        return function
+    if isinstance(function, FunctionDescription):
+        return function.location
+    return FunctionLocation(
+        lineno=function.lineno,
+        name=function.name,
+        line_numbers=(function.lineno, get_line_number_from_function(function)),
+        decorators=len(getattr(function, "decorator_list", None) or []),
+    )
+
+
 class FunctionType(Enum):
     FUNCTION = 1
     METHOD = 2
@@ -116,49 +173,56 @@ class FunctionDescription(object):
         self,
         function_type: FunctionType,
         function: Union[ast.FunctionDef, ast.AsyncFunctionDef],
+        passes: FrozenSet[str] = ALL_ANALYSIS_PASSES,
     ) -> None:
         """Create a new FunctionDescription.
 
         Args:
             function_type: Type of the function.
             function: The base node of the function.
+            passes: The analysis passes to run on the function.  The
+                attributes of any other pass are left empty.
 
         """
         self.is_method = function_type == FunctionType.METHOD
         self.is_property = function_type == FunctionType.PROPERTY
         self.function = function
-        self.line_number = get_line_number_from_function(function)
+        self.location = get_function_location(function)
+        self.line_number = self.location.line_numbers[1]
         self.name = function.name
-        visitor = AnalysisVisitor()
         try:
-            visitor.visit(function)
+            visitor = walk(function, passes)
         except Exception as ex:
             msg = "Failed to visit in {}: {}".format(self.name, ex)
             logger.debug(msg)
             return
-        self.argument_names = visitor.arguments
-        self.argument_types = visitor.types
+        # The visitor only has the attributes of the passes it ran.
+        self.argument_names = getattr(visitor, "arguments", [])
+        self.argument_types = getattr(visitor, "types", [])
         if function_type != FunctionType.FUNCTION and len(self.argument_names) > 0:
             if not _has_decorator(function, "staticmethod"):
                 self.argument_names.pop(0)
                 self.argument_types.pop(0)
-        self.has_return = bool(visitor.returns)
+        returns = getattr(visitor, "returns", [])
+        self.has_return = bool(returns)
         self.has_empty_return = False
         if self.has_return:
-            return_value = visitor.returns[0]
+            return_value = returns[0]
             self.has_empty_return = (
                 return_value is not None and return_value.value is None
             )
         self.return_type = _get_return_type(function)
-        self.has_yield = bool(visitor.yields)
-        self.raises = visitor.exceptions
+        self.has_yield = bool(getattr(visitor, "yields", []))
+        self.raises: Set[str] = getattr(visitor, "exceptions", set())
         self.docstring = _get_docstring(function)
-        self.variables = [x.id for x in visitor.variables]
-        self.raises_assert = bool(visitor.asserts)
-        self.is_abstract = visitor.is_abstract
+        self.variables = [x.id for x in getattr(visitor, "variables", [])]
+        self.raises_assert = bool(getattr(visitor, "asserts", []))
+        self.is_abstract = getattr(visitor, "is_abstract", None)
 
 
-def get_function_descriptions(program: ast.AST) -> List[FunctionDescription]:
+def get_function_descriptions(
+    program: ast.AST, passes: FrozenSet[str] = ALL_ANALYSIS_PASSES
+) -> List[FunctionDescription]:
     """Get function name, args, return presence and docstrings.
 
     This function should be called on the top level of the
@@ -166,6 +230,7 @@ def get_function_descriptions(program: ast.AST) -> List[FunctionDescription]:
 
     Args:
         program: The tree representing the entire program.
+        passes: The analysis passes to run on each function.
 
     Returns:
         A list of function descriptions pulled from the ast.
@@ -177,17 +242,23 @@ def get_function_descriptions(program: ast.AST) -> List[FunctionDescription]:
     visitor.visit(program)
     for prop in visitor.properties:
         ret.append(
-            FunctionDescription(function_type=FunctionType.PROPERTY, function=prop)
+            FunctionDescription(
+                function_type=FunctionType.PROPERTY, function=prop, passes=passes
+            )
         )
 
     for method in visitor.methods:
         ret.append(
-            FunctionDescription(function_type=FunctionType.METHOD, function=method)
+            FunctionDescription(
+                function_type=FunctionType.METHOD, function=method, passes=passes
+            )
         )
 
     for function in visitor.functions:
         ret.append(
-            FunctionDescription(function_type=FunctionType.FUNCTION, function=function)
+            FunctionDescription(
+                function_type=FunctionType.FUNCTION, function=function, passes=passes
+            )
         )
 
     return ret
@@ -2,10 +2,22 @@
 
 import concurrent.futures
 import re
-from typing import Any, List, Optional, Set, cast  # noqa: F401
+import time
+from typing import (  # noqa: F401
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Union,
+    cast,
+)
 
-from .config import get_config
+from .config import Configuration, get_config
 from .docstring.base import BaseDocstring
+from .docstring.detect import detect_style_of_tokens
 from .docstring.docstring import Docstring
 from .docstring.sections import Sections
 from .docstring.style import DocstringStyle
@@ -26,30 +38,90 @@ from .errors import (  # noqa: F401
     ReturnTypeMismatchError,
 )
 from .function_description import FunctionDescription  # noqa: F401
+from .lex import condense, lex
+from .parse.ordering import grammar_statistics
+from .profiling import count, get_profiler, timed
 from .strictness import Strictness
+from .token import Token
 
 SYNTAX_NOQA = re.compile(r"#\s*noqa:\sS001")
 EXPLICIT_GLOBAL_NOQA = re.compile(r"#\s*noqa:\s*\*")
 BARE_NOQA = re.compile(r"#\s*noqa([^:]|$)")
 
+# The analysis passes (see `ANALYSIS_PASSES`) whose results are
+# consumed by the check for each error.
+ANALYSIS_PASSES_BY_ERROR: Dict[str, FrozenSet[str]] = {
+    MissingParameterError.error_code: frozenset({"arguments"}),
+    ExcessParameterError.error_code: frozenset({"arguments"}),
+    ParameterTypeMismatchError.error_code: frozenset({"arguments"}),
+    ParameterTypeMissingError.error_code: frozenset({"arguments"}),
+    MissingReturnError.error_code: frozenset({"abstract", "returns"}),
+    ExcessReturnError.error_code: frozenset({"abstract", "returns"}),
+    ReturnTypeMismatchError.error_code: frozenset({"abstract"}),
+    MissingYieldError.error_code: frozenset({"abstract", "yields"}),
+    ExcessYieldError.error_code: frozenset({"abstract", "yields"}),
+    MissingRaiseError.error_code: frozenset({"abstract", "asserts", "raises"}),
+    ExcessRaiseError.error_code: frozenset({"abstract", "asserts", "raises"}),
+    ExcessVariableError.error_code: frozenset({"variables"}),
+}
+
+# The errors which are only checked for some docstring styles.
+STYLES_BY_ERROR: Dict[str, FrozenSet[DocstringStyle]] = {
+    ExcessVariableError.error_code: frozenset({DocstringStyle.SPHINX}),
+}
+
+
+def get_analysis_passes(
+    style: DocstringStyle, errors_to_ignore: Iterable[str]
+) -> FrozenSet[str]:
+    """Get the analysis passes which the checks will consume.
+
+    Args:
+        style: The docstring style being checked.
+        errors_to_ignore: The error codes which won't be reported.
+
+    Returns:
+        The names of the passes needed to report the other errors.
+
+    """
+    ignored = set(errors_to_ignore)
+    passes: Set[str] = set()
+    for error_code, required in ANALYSIS_PASSES_BY_ERROR.items():
+        if error_code in ignored:
+            continue
+        # Any style may be detected, so every error may be reported.
+        if style != DocstringStyle.AUTO and style not in STYLES_BY_ERROR.get(
+            error_code, (style,)
+        ):
+            continue
+        passes |= required
+    return frozenset(passes)
+
 
 class IntegrityChecker(object):
     """Checks the integrity of the docstring compared to the definition."""
 
-    def __init__(self, raise_errors: bool = False) -> None:
+    def __init__(
+        self,
+        raise_errors: bool = False,
+        config: Optional[Configuration] = None,
+    ) -> None:
         """Create a new checker for the given function and docstring.
 
         Args:
             raise_errors: If true, we will allow ParserExceptions to
                 propagate, crashing darglint2.  This is mostly useful
                 for development.
+            config: The configuration to check with.  By default, the
+                configuration for the current context.  The checker
+                keeps a snapshot of it, so changing it later has no
+                effect on the checker.
 
         """
         self.errors: List[DarglintError] = list()
         self._sorted = True
-        self.config = get_config()
+        self.config = config or get_config()
         self.raise_errors = raise_errors
-        self.errors_to_ignore = self.config.errors_to_ignore
 
         # TODO: Move max workers into a configuration option.
         # A thread pool for handling checks.  Tasks are added to the
@@ -57,6 +129,31 @@ class IntegrityChecker(object):
         # The pool is collected when `get_error_report_string` is called.
         self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=4)
 
+    @property
+    def config(self) -> Configuration:
+        """Get the snapshot of the configuration the checker uses.
+
+        Returns:
+            The frozen configuration.
+
+        """
+        return self._config
+
+    @config.setter
+    def config(self, config: Configuration) -> None:
+        self._config = config.snapshot()
+        self.errors_to_ignore = self._config.errors_to_ignore
+
+    @property
+    def analysis_passes(self) -> FrozenSet[str]:
+        """Get the analysis passes which the checks will consume.
+
+        Returns:
+            The names of the passes to run on the functions checked.
+
+        """
+        return get_analysis_passes(self.config.style, self.errors_to_ignore)
+
     def schedule(self, function: FunctionDescription) -> None:
         if self._skip_checks(function):
             return
@@ -66,6 +163,32 @@ class IntegrityChecker(object):
     def run_checks(self, function: FunctionDescription) -> None:
         """Run checks on the given function.
 
+        Args:
+            function: A function whose docstring we are verifying.
+
+        """
+        # The checks may run on the executor's threads, so the
+        # configuration is applied to the thread for the lexer and
+        # the parser.
+        with self.config.context():
+            self._run_checks_with_profile(function)
+
+    def _run_checks_with_profile(self, function: FunctionDescription) -> None:
+        profiler = get_profiler()
+        if profiler is None:
+            self._run_checks(function)
+            return
+        start = time.perf_counter()
+        self._run_checks(function)
+        profiler.record_docstring(
+            function.name,
+            function.location.lineno,
+            time.perf_counter() - start,
+        )
+
+    def _run_checks(self, function: FunctionDescription) -> None:
+        """Run checks on the given function.
+
         Args:
             function: A function whose docstring we are verifying.
 
@@ -76,17 +199,30 @@ class IntegrityChecker(object):
         if self._skip_checks(function):
             return
 
+        function_docstring: Union[str, List[Token]]
         function_docstring = cast(str, function.docstring)
-        if self.config.style == DocstringStyle.GOOGLE:
+        style = self.config.style
+        if style == DocstringStyle.AUTO:
+            # The tokens the style was detected from are parsed,
+            # rather than lexing the docstring again.
+            with timed("lex/condense"):
+                function_docstring = condense(lex(function_docstring))
+            with timed("detect_style"):
+                style = detect_style_of_tokens(function_docstring)
+            count("style.{}".format(style.name.lower()))
+            grammar_statistics.record_style(style.name.lower())
+        if style == DocstringStyle.GOOGLE:
             docstring = Docstring.from_google(
                 function_docstring,
             )
-        elif self.config.style == DocstringStyle.SPHINX:
+        elif style == DocstringStyle.SPHINX:
             docstring = Docstring.from_sphinx(
                 function_docstring,
             )
-            self._check_variables(docstring, function)
-        elif self.config.style == DocstringStyle.NUMPY:
+            if Sections.VARIABLES_SECTION not in docstring.get_sections_over_budget():
+                with timed("_check_variables"):
+                    self._check_variables(docstring, function)
+        elif style == DocstringStyle.NUMPY:
             docstring = Docstring.from_numpy(
                 function_docstring,
             )
@@ -97,14 +233,24 @@ class IntegrityChecker(object):
                 return
         if docstring.ignore_all:
             return
-        self._check_parameters(docstring, function)
-        self._check_parameter_types(docstring, function)
-        self._check_parameter_types_missing(docstring, function)
-        self._check_return(docstring, function)
-        self._check_return_type(docstring, function)
-        self._check_yield(docstring, function)
-        self._check_raises(docstring, function)
-        self._check_style(docstring, function)
+        # The items in a section which wasn't fully parsed would be
+        # reported as missing, so skip the checks which read them.
+        over_budget = docstring.get_sections_over_budget()
+        checks = [
+            (self._check_parameters, Sections.ARGUMENTS_SECTION),
+            (self._check_parameter_types, Sections.ARGUMENTS_SECTION),
+            (self._check_parameter_types_missing, Sections.ARGUMENTS_SECTION),
+            (self._check_return, Sections.RETURNS_SECTION),
+            (self._check_return_type, Sections.RETURNS_SECTION),
+            (self._check_yield, Sections.YIELDS_SECTION),
+            (self._check_raises, Sections.RAISES_SECTION),
+            (self._check_style, None),
+        ]
+        for check, section in checks:
+            if section in over_budget:
+                continue
+            with timed(check.__name__):
+                check(docstring, function)
         self._sorted = False
 
     def _skip_checks(self, function: FunctionDescription) -> bool:
@@ -156,7 +302,7 @@ class IntegrityChecker(object):
                 )
                 self.errors.append(
                     ParameterTypeMismatchError(
-                        function.function,
+                        function.location,
                         name=name,
                         expected=expected,
                         actual=actual,
@@ -195,7 +341,7 @@ class IntegrityChecker(object):
                 )
                 self.errors.append(
                     ParameterTypeMissingError(
-                        function.function,
+                        function.location,
                         name=name,
                         line_numbers=line_numbers,
                     )
@@ -221,7 +367,7 @@ class IntegrityChecker(object):
                 )
                 self.errors.append(
                     ReturnTypeMismatchError(
-                        function.function,
+                        function.location,
                         expected=fun_type,
                         actual=doc_type,
                         line_numbers=line_numbers,
@@ -239,14 +385,14 @@ class IntegrityChecker(object):
         ignore_missing = self._ignore_error(docstring, MissingYieldError)
         ignore_excess = self._ignore_error(docstring, ExcessYieldError)
         if fun_yield and not doc_yield and not ignore_missing:
-            self.errors.append(MissingYieldError(function.function))
+            self.errors.append(MissingYieldError(function.location))
         elif doc_yield and not fun_yield and not ignore_excess:
             line_numbers = docstring.get_line_numbers(
                 "yields-section",
             )
             self.errors.append(
                 ExcessYieldError(
-                    function.function,
+                    function.location,
                     line_numbers=line_numbers,
                 )
             )
@@ -268,14 +414,14 @@ class IntegrityChecker(object):
         ignore_missing = self._ignore_error(docstring, MissingReturnError)
         ignore_excess = self._ignore_error(docstring, ExcessReturnError)
         if fun_return and not doc_return and not ignore_missing:
-            self.errors.append(MissingReturnError(function.function))
+            self.errors.append(MissingReturnError(function.location))
         elif doc_return and not fun_return and not ignore_excess:
             line_numbers = docstring.get_line_numbers(
                 "returns-section",
             )
             self.errors.append(
                 ExcessReturnError(
-                    function.function,
+                    function.location,
                     line_numbers=line_numbers,
                 )
             )
@@ -311,7 +457,7 @@ class IntegrityChecker(object):
             # parameter, by definition, will not have line numbers.
             self.errors.append(
                 MissingParameterError(
-                    function.function, missing, line_numbers=default_line_numbers
+                    function.location, missing, line_numbers=default_line_numbers
                 )
             )
 
@@ -336,7 +482,7 @@ class IntegrityChecker(object):
             )
             self.errors.append(
                 ExcessParameterError(
-                    function.function,
+                    function.location,
                     missing,
                     line_numbers=line_numbers,
                 )
@@ -345,6 +491,9 @@ class IntegrityChecker(object):
     def _check_variables(
         self, docstring: BaseDocstring, function: FunctionDescription
     ) -> None:
+        if self._ignore_error(docstring, ExcessVariableError):
+            return
+
         described_variables: Set[str] = set(
             docstring.get_items(Sections.VARIABLES_SECTION) or []
         )
@@ -366,7 +515,7 @@ class IntegrityChecker(object):
             )
             self.errors.append(
                 ExcessVariableError(
-                    function.function,
+                    function.location,
                     excess,
                     line_numbers=line_numbers,
                 )
@@ -430,7 +579,7 @@ class IntegrityChecker(object):
                 continue
             self.errors.append(
                 StyleError(
-                    function.function,
+                    function.location,
                     line_numbers,
                 )
             )
@@ -454,7 +603,7 @@ class IntegrityChecker(object):
         )
 
         for missing in missing_in_doc:
-            self.errors.append(MissingRaiseError(function.function, missing))
+            self.errors.append(MissingRaiseError(function.location, missing))
 
         # TODO: Disable by default.
         #
@@ -487,7 +636,7 @@ class IntegrityChecker(object):
             )
             self.errors.append(
                 ExcessRaiseError(
-                    function.function,
+                    function.location,
                     missing,
                     line_numbers=line_numbers,
                 )
@@ -504,6 +653,7 @@ class IntegrityChecker(object):
             errors=self.errors,
             filename=filename,
             verbosity=verbosity,
+            config=self.config,
         )
 
     def get_error_report_string(self, verbosity: int, filename: str) -> str:
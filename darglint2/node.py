@@ -6,13 +6,14 @@ from .token import Token, TokenType
 WHITESPACE = {TokenType.INDENT, TokenType.NEWLINE}
 
 
-# A best guess at the maximum height of a docstring tree,
-# for use in recursion bounds checking.
-MAX_TREE_HEIGHT = 300
+class CykNode(object):
+    """A node for use in a cyk parse.
 
+    Some trees are as deep as the section is long (a long
+    description is a chain with a node for each token), so the
+    walks over the tree are all iterative.
 
-class CykNode(object):
-    """A node for use in a cyk parse."""
+    """
 
     def __init__(
         self,
@@ -57,29 +58,38 @@ class CykNode(object):
         return "<{}>".format(self.value)
 
     def __str__(self, indent=0):
-        if self.value:
-            ret = (
-                " " * indent
-                + str(self.value.token_type)
-                + ": "
-                + repr(self.value.value)
-            )
-        else:
-            ret = " " * indent + self.symbol
-        if self.annotations:
-            ret += ": " + ", ".join([str(x) for x in self.annotations])
-        if self.lchild:
-            ret += "\n" + self.lchild.__str__(indent + 2)
-        if self.rchild:
-            ret += "\n" + self.rchild.__str__(indent + 2)
-        return ret
+        lines = list()
+        stack: List[Tuple[CykNode, int]] = [(self, indent)]
+        while stack:
+            node, depth = stack.pop()
+            if node.value:
+                line = (
+                    " " * depth
+                    + str(node.value.token_type)
+                    + ": "
+                    + repr(node.value.value)
+                )
+            else:
+                line = " " * depth + node.symbol
+            if node.annotations:
+                line += ": " + ", ".join([str(x) for x in node.annotations])
+            lines.append(line)
+            if node.rchild:
+                stack.append((node.rchild, depth + 2))
+            if node.lchild:
+                stack.append((node.lchild, depth + 2))
+        return "\n".join(lines)
 
     def in_order_traverse(self) -> Iterator["CykNode"]:
-        if self.lchild:
-            yield from self.lchild.in_order_traverse()
-        yield self
-        if self.rchild:
-            yield from self.rchild.in_order_traverse()
+        stack: List[CykNode] = list()
+        curr: Optional[CykNode] = self
+        while stack or curr:
+            while curr:
+                stack.append(curr)
+                curr = curr.lchild
+            curr = stack.pop()
+            yield curr
+            curr = curr.rchild
 
     def breadth_first_walk(self):
         queue = deque([self])
@@ -101,16 +111,19 @@ class CykNode(object):
         yield from self.in_order_traverse()
 
     def equals(self, other: Optional["CykNode"]) -> bool:
-        if other is None:
-            return False
-        if self.symbol != other.symbol:
-            return False
-        if self.value != other.value:
-            return False
-        if self.lchild and not self.lchild.equals(other.lchild):
-            return False
-        if self.rchild and not self.rchild.equals(other.rchild):
-            return False
+        stack: List[Tuple[CykNode, Optional[CykNode]]] = [(self, other)]
+        while stack:
+            node, other = stack.pop()
+            if other is None:
+                return False
+            if node.symbol != other.symbol:
+                return False
+            if node.value != other.value:
+                return False
+            if node.lchild:
+                stack.append((node.lchild, other.lchild))
+            if node.rchild:
+                stack.append((node.rchild, other.rchild))
         return True
 
     def reconstruct_string(self, strictness: int = 0) -> str:
@@ -183,21 +196,37 @@ class CykNode(object):
 
         return ret
 
-    def _get_line_numbers_cached(self, recurse: int = 0) -> Tuple[int, int]:
-        if recurse > MAX_TREE_HEIGHT:
-            return (-1, -1)
+    def _get_known_line_numbers(self) -> Optional[Tuple[int, int]]:
         if self.value:
             return (self.value.line_number, self.value.line_number)
-        elif self._line_number_cache:
-            return self._line_number_cache
-        leftmost = -1
-        if self.lchild:
-            leftmost = self.lchild._get_line_numbers_cached(recurse + 1)[0]
-        rightmost = leftmost
-        if self.rchild:
-            rightmost = self.rchild._get_line_numbers_cached(recurse + 1)[1]
-        self._line_number_cache = (leftmost, rightmost)
-        return self._line_number_cache or (-1, -1)
+        return self._line_number_cache
+
+    def _get_line_numbers_cached(self) -> Tuple[int, int]:
+        # The line numbers of each node beneath this one are found
+        # (and cached) in post-order, children first.
+        stack: List[CykNode] = [self]
+        while stack:
+            node = stack[-1]
+            if node._get_known_line_numbers():
+                stack.pop()
+                continue
+            pending = [
+                child
+                for child in (node.lchild, node.rchild)
+                if child and not child._get_known_line_numbers()
+            ]
+            if pending:
+                stack.extend(pending)
+                continue
+            stack.pop()
+            leftmost = -1
+            if node.lchild:
+                leftmost = node.lchild._get_known_line_numbers()[0]  # type: ignore
+            rightmost = leftmost
+            if node.rchild:
+                rightmost = node.rchild._get_known_line_numbers()[1]  # type: ignore
+            node._line_number_cache = (leftmost, rightmost)
+        return self._get_known_line_numbers() or (-1, -1)
 
     @property
     def line_numbers(self) -> Tuple[int, int]:
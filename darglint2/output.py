@@ -0,0 +1,206 @@
+"""Writers for structured output formats.
+
+Rather than formatting each error with the message template,
+these writers emit one record per error, so that the results
+can be consumed by other tools without parsing the text back
+out.  Records are written as soon as a file's report is ready,
+one buffered write per file.
+
+"""
+
+import inspect
+import json
+import pathlib
+import urllib.parse
+from typing import Any, Dict, List, TextIO, Type
+
+import darglint2.errors
+
+from . import __version__
+from .error_report import ErrorReport
+from .errors import DarglintError
+
+SARIF_VERSION = "2.1.0"
+
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+
+INFORMATION_URI = "https://github.com/akaihola/darglint2"
+
+
+def get_error_classes() -> List[Type[DarglintError]]:
+    """Get every error which darglint2 can report.
+
+    Returns:
+        The subclasses of `DarglintError`, sorted by error code.
+
+    """
+    classes = [
+        obj
+        for _, obj in inspect.getmembers(darglint2.errors, inspect.isclass)
+        if issubclass(obj, DarglintError) and obj is not DarglintError
+    ]
+    return sorted(classes, key=lambda x: x.error_code)
+
+
+class ReportWriter(object):
+    """Writes error reports to a stream."""
+
+    def __init__(self, stream: TextIO, verbosity: int = 1) -> None:
+        """Create a new writer.
+
+        Args:
+            stream: The stream to write to.
+            verbosity: The verbosity of the error messages, in
+                the set {1, 2}.
+
+        """
+        self.stream = stream
+        self.verbosity = verbosity
+
+    def start(self) -> None:
+        """Write anything which precedes the reports."""
+
+    def write(self, report: ErrorReport) -> None:
+        """Write the errors in the report.
+
+        Args:
+            report: The report for a single file.
+
+        Raises:
+            NotImplementedError: Always, unless overridden.
+
+        """
+        raise NotImplementedError
+
+    def finish(self) -> None:
+        """Write anything which follows the reports, and flush."""
+        self.stream.flush()
+
+    def _get_record(self, report: ErrorReport, error: DarglintError) -> Dict[str, Any]:
+        return {
+            "path": report.filename,
+            "line": report.get_line_number(error),
+            "code": error.error_code,
+            "message": error.message(verbosity=self.verbosity),
+            "function": error.function.name,
+        }
+
+
+class JsonLinesWriter(ReportWriter):
+    """Writes each error as a JSON object on its own line."""
+
+    def write(self, report: ErrorReport) -> None:
+        """Write the errors in the report.
+
+        Args:
+            report: The report for a single file.
+
+        """
+        lines = [json.dumps(self._get_record(report, error)) + "\n" for error in report]
+        if lines:
+            self.stream.write("".join(lines))
+
+
+class SarifWriter(ReportWriter):
+    """Writes the errors as a SARIF log.
+
+    The log is streamed: the tool's rules are written first, and
+    then each result is appended to the run's list of results.
+    The log is only valid JSON once `finish` has been called.
+
+    """
+
+    def __init__(self, stream: TextIO, verbosity: int = 1) -> None:
+        """Create a new writer.
+
+        Args:
+            stream: The stream to write to.
+            verbosity: The verbosity of the error messages, in
+                the set {1, 2}.
+
+        """
+        super(SarifWriter, self).__init__(stream, verbosity)
+        self.rules = get_error_classes()
+        self.rule_indices = {rule.error_code: i for i, rule in enumerate(self.rules)}
+        self.count = 0
+
+    def start(self) -> None:
+        """Write the log's header and the rule metadata."""
+        driver = {
+            "name": "darglint2",
+            "version": __version__,
+            "informationUri": INFORMATION_URI,
+            "rules": [
+                {
+                    "id": rule.error_code,
+                    "name": rule.__name__,
+                    "shortDescription": {"text": rule.description},
+                }
+                for rule in self.rules
+            ],
+        }
+        header = json.dumps(
+            {
+                "version": SARIF_VERSION,
+                "$schema": SARIF_SCHEMA,
+                "runs": [{"tool": {"driver": driver}, "results": []}],
+            }
+        )
+
+        # Leave the list of results open, so that results can
+        # be appended as they are found.
+        self.stream.write(header[: -len("]}]}")])
+
+    def write(self, report: ErrorReport) -> None:
+        """Write the errors in the report as results.
+
+        Args:
+            report: The report for a single file.
+
+        """
+        chunks = list()
+        for error in report:
+            if self.count:
+                chunks.append(",")
+            chunks.append(json.dumps(self._get_result(report, error)))
+            self.count += 1
+        if chunks:
+            self.stream.write("".join(chunks))
+
+    def finish(self) -> None:
+        """Close the list of results, and the log."""
+        self.stream.write("]}]}\n")
+        super(SarifWriter, self).finish()
+
+    def _get_result(self, report: ErrorReport, error: DarglintError) -> Dict[str, Any]:
+        record = self._get_record(report, error)
+        location: Dict[str, Any] = {
+            "physicalLocation": {
+                "artifactLocation": {"uri": _get_uri(record["path"])},
+                "region": {"startLine": max(1, record["line"])},
+            },
+        }
+        if record["function"]:
+            location["logicalLocations"] = [
+                {"name": record["function"], "kind": "function"},
+            ]
+        return {
+            "ruleId": record["code"],
+            "ruleIndex": self.rule_indices[record["code"]],
+            "level": "warning",
+            "message": {"text": record["message"]},
+            "locations": [location],
+        }
+
+
+def _get_uri(path: str) -> str:
+    p = pathlib.PurePath(path)
+    if p.is_absolute():
+        return pathlib.Path(p).as_uri()
+    return urllib.parse.quote(p.as_posix())
+
+
+WRITERS: Dict[str, Type[ReportWriter]] = {
+    "jsonl": JsonLinesWriter,
+    "sarif": SarifWriter,
+}
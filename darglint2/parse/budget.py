@@ -0,0 +1,122 @@
+"""Limits on the cost of parsing a single docstring.
+
+The CYK parser is cubic in the number of tokens in a section, so one
+pathological docstring (say, a generated table of hundreds of
+arguments, which isn't quite in the canonical form) can stall the
+whole run.  A budget caps the number of tokens in a section which
+may be handed to the CYK parser, and the time spent parsing a
+docstring.  A section which exceeds the budget is instead parsed by
+the next parser in line -- ultimately, the linear long description
+parser -- and is marked as not having been fully analyzed.
+
+The budget is kept per thread, since docstrings are parsed on
+several threads at once.
+
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
+
+from ..token import Token
+
+# The reasons a budget can be exceeded.
+TOKENS = "tokens"
+TIME = "time"
+
+
+class BudgetExceeded(Exception):
+    """Parsing the section would exceed the docstring's budget."""
+
+    def __init__(self, reason: str) -> None:
+        """Create a new exception.
+
+        Args:
+            reason: Which limit was exceeded, either `TOKENS`
+                or `TIME`.
+
+        """
+        super(BudgetExceeded, self).__init__(reason)
+        self.reason = reason
+
+
+class Budget(object):
+    """The limits for parsing a single docstring."""
+
+    def __init__(self, max_section_tokens: int = 0, time_limit: float = 0) -> None:
+        """Start a new budget.
+
+        Args:
+            max_section_tokens: The maximum number of tokens in a
+                section parsed by CYK, or 0 for no limit.
+            time_limit: The number of seconds, from now, which may
+                be spent parsing, or 0 for no limit.
+
+        """
+        self.max_section_tokens = max_section_tokens
+        self.deadline: Optional[float] = None
+        if time_limit > 0:
+            self.deadline = time.perf_counter() + time_limit
+
+    def check_section(self, tokens: List[Token]) -> None:
+        """Make sure the section can be parsed within the budget.
+
+        Args:
+            tokens: The tokens in the section.
+
+        Raises:
+            BudgetExceeded: If the section is too long, or the
+                time has run out.
+
+        """
+        if self.max_section_tokens and len(tokens) > self.max_section_tokens:
+            raise BudgetExceeded(TOKENS)
+        self.check_time()
+
+    def check_time(self) -> None:
+        """Make sure there is time left to keep parsing.
+
+        Raises:
+            BudgetExceeded: If the time has run out.
+
+        """
+        if self.deadline is not None and time.perf_counter() > self.deadline:
+            raise BudgetExceeded(TIME)
+
+
+_local = threading.local()
+
+
+@contextmanager
+def limit(max_section_tokens: int = 0, time_limit: float = 0) -> Iterator[Budget]:
+    """Apply a budget to the parsing done in the enclosed block.
+
+    Args:
+        max_section_tokens: The maximum number of tokens in a
+            section parsed by CYK, or 0 for no limit.
+        time_limit: The number of seconds which may be spent
+            parsing, or 0 for no limit.
+
+    Yields:
+        The budget.
+
+    """
+    previous = getattr(_local, "budget", None)
+    _local.budget = Budget(max_section_tokens, time_limit)
+    try:
+        yield _local.budget
+    finally:
+        _local.budget = previous
+
+
+def check_section(tokens: List[Token]) -> None:
+    budget = getattr(_local, "budget", None)
+    if budget is not None:
+        budget.check_section(tokens)
+
+
+def check_time() -> None:
+    budget = getattr(_local, "budget", None)
+    if budget is not None:
+        budget.check_time()
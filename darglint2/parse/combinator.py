@@ -24,10 +24,229 @@ The probem, it seems, is that some of the sections take much
 longer than others, and so threading does nothing to improve
 speed. (It actually made it worse.)
 
+The same sections turn up again and again across a project (think
+of `Returns:\n    None` or `Args:\n    self: ...`), so the trees
+built for sections parsed by a grammar are kept in a bounded, least
+recently used cache.  A repeated section is then cloned from the
+cache, with its line numbers moved to where the section now is,
+rather than being parsed again.
+
+The parsers for a section are tried in the order which is most
+likely to succeed first, given how they fared on the sections
+before it, so long as that can't change which parser builds the
+section's tree.  (See `ordering`.)
+
 """
 
+import inspect
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple, Type
+
+from ..config import get_config
+from ..errors import ParseBudgetExceededError
+from ..node import CykNode
+from ..profiling import count, timed
+from ..token import Token
+from .budget import BudgetExceeded, limit
+from .fast_path import FastPath, parse_section
+from .grammar import BaseGrammar
+from .ordering import grammar_statistics
+
+# The maximum number of section trees kept in the cache.
+DEFAULT_SECTION_CACHE_SIZE = 1024
+
+
+class SectionCache(object):
+    """A least recently used cache of parsed sections.
+
+    The cache is shared by the threads checking docstrings, so
+    it is guarded by a lock.
+
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_SECTION_CACHE_SIZE) -> None:
+        """Create an empty cache.
+
+        Args:
+            maxsize: The maximum number of sections to keep.  If
+                zero, nothing is cached.
+
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, Tuple[Optional[CykNode], int]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Tuple[Optional[CykNode], int]]:
+        """Get the section stored under the key.
+
+        Args:
+            key: The key of the section.
+
+        Returns:
+            The section's tree (or None, if the grammar didn't match
+            the section), and the line number of the section's first
+            token when it was stored.  None if the key is missing.
+
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+        count("section cache: " + ("miss" if entry is None else "hit"))
+        return entry
+
+    def put(self, key: Hashable, node: Optional[CykNode], line_number: int) -> None:
+        """Store a parsed section, evicting the oldest if full.
+
+        Args:
+            key: The key of the section.
+            node: The tree for the section.  It must not be changed
+                afterwards, since only clones are handed out.
+            line_number: The line number of the section's first token.
+
+        """
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (node, line_number)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove every section, and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get the counters, for tuning the size of the cache.
+
+        Returns:
+            The number of hits and misses, and the current and
+            maximum number of entries.
+
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
+
+
+section_cache = SectionCache()
+
+
+def clone(node: CykNode, offset: int = 0) -> CykNode:
+    """Copy the tree, moving its tokens down by the given lines.
+
+    Args:
+        node: The root of the tree to copy.
+        offset: The number of lines to add to each token's
+            line number.
+
+    Returns:
+        The root of the copy.
+
+    """
+
+    def copy(old: CykNode) -> CykNode:
+        value = old.value
+        if value is not None and offset:
+            value = Token(value.value, value.token_type, value.line_number + offset)
+        return CykNode(
+            old.symbol,
+            value=value,
+            annotations=old.annotations,
+            weight=old.weight,
+        )
+
+    # Iterative, since sections can be arbitrarily long.
+    root = copy(node)
+    stack = [(node, root)]
+    while stack:
+        old, new = stack.pop()
+        if old.lchild:
+            new.lchild = copy(old.lchild)
+            stack.append((old.lchild, new.lchild))
+        if old.rchild:
+            new.rchild = copy(old.rchild)
+            stack.append((old.rchild, new.rchild))
+    return root
+
+
+def _parse_grammar(
+    grammar: Type[BaseGrammar],
+    section: List[Token],
+    fast_paths: Dict[Type[BaseGrammar], FastPath],
+    config: Any,
+) -> Optional[CykNode]:
+    if not section:
+        return parse_section(grammar, section, fast_paths)
+
+    # The tree depends only on the grammar and the types and values
+    # of the tokens.  The indentation and the budget decide how the
+    # tokens were lexed, and whether CYK could be used at all.
+    key = (
+        grammar,
+        tuple((token.token_type, token.value) for token in section),
+        config.indentation,
+        config.max_section_tokens,
+    )
+    entry = section_cache.get(key)
+    if entry is None:
+        # Sections which exceed the budget raise, so are never stored.
+        node = parse_section(grammar, section, fast_paths)
+        section_cache.put(key, node, section[0].line_number)
+        return clone(node) if node else None
+    node, line_number = entry
+    return clone(node, section[0].line_number - line_number) if node else None
+
+
+def join_balanced(symbol: str, nodes: Sequence[CykNode]) -> CykNode:
+    """Join the nodes into one tree.
+
+    The nodes are paired off, level by level, so the tree is
+    balanced, rather than a chain as deep as the number of nodes.
+
+    Args:
+        symbol: The symbol for the joining nodes.
+        nodes: The nodes to join, in order.
+
+    Returns:
+        The root of the tree.  If there is only one node, it's
+        the node itself; if there are none, an empty node.
+
+    """
+    if not nodes:
+        return CykNode(symbol=symbol)
+    level = list(nodes)
+    while len(level) > 1:
+        paired = [
+            CykNode(symbol=symbol, lchild=lchild, rchild=rchild)
+            for lchild, rchild in zip(level[::2], level[1::2])
+        ]
+        if len(level) % 2:
+            paired.append(level[-1])
+        level = paired
+    return level[0]
+
 
-def parser_combinator(top, lookup, combinator, tokens):
+def parser_combinator(top, lookup, combinator, tokens, fast_paths=None):
     """Parse the given tokens, combining in the given fashion.
 
     Args:
@@ -35,24 +254,55 @@ def parser_combinator(top, lookup, combinator, tokens):
             sections which can be consumed by the parsers in the
             lookup function.
         lookup: For a given section from the top-level parser,
-            returns a list of possible parsers.
+            returns a list of possible parsers, in the order to
+            try them.  A parser is either a function, or a grammar,
+            whose trees are cached.  Grammars may be tried ahead of
+            their turn, where that gives the same tree.
         combinator: Combines the resultant nodes from parsing
             each section from the top-level parser.
         tokens: The tokens to be parsed.
+        fast_paths: The fast paths for the grammars in the lookup.
 
     Returns:
-        The top-level node from the combinator.
+        The top-level node from the combinator.  If a section
+        exceeded the parse budget, it's parsed by the next parser
+        in its lookup, and its node is annotated with a
+        `ParseBudgetExceededError`.
 
     """
-    sections = top(tokens)
+    config = get_config()
+    with timed("top_parse"):
+        sections = top(tokens)
     parsed_sections = list()
-    for i, section in enumerate(sections):
-        parsed = None
-        for parse in lookup(section, i):
-            parsed = parse(section)
-            if parsed:
-                break
-        if not parsed:
-            return None
-        parsed_sections.append(parsed)
+    with limit(config.max_section_tokens, config.parse_time_budget):
+        for i, section in enumerate(sections):
+            parsed = None
+            exceeded = None
+            parsers = lookup(section, i)
+            if config.max_section_tokens and len(section) > config.max_section_tokens:
+                # The parsers jumped over would have exceeded the
+                # budget, which is only reported in the fixed order.
+                ordered = parsers
+            else:
+                ordered = grammar_statistics.order(parsers)
+            for parse in ordered:
+                try:
+                    if inspect.isclass(parse):
+                        parsed = _parse_grammar(
+                            parse, section, fast_paths or {}, config
+                        )
+                    else:
+                        parsed = parse(section)
+                except BudgetExceeded as ex:
+                    exceeded = ex
+                    continue
+                grammar_statistics.record(parsers, parse, bool(parsed))
+                if parsed:
+                    break
+            if not parsed:
+                return None
+            if exceeded:
+                count("parse budget exceeded: " + exceeded.reason)
+                parsed.annotations = parsed.annotations + [ParseBudgetExceededError]
+            parsed_sections.append(parsed)
     return combinator(*parsed_sections)
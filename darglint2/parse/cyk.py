@@ -14,62 +14,230 @@ to find examples of.)
 This representation was based directly on the wikipedia
 article, https://en.wikipedia.org/wiki/CYK_algorithm.
 
+The chart is only ever filled for spans which fit in the
+section, so rather than a square n×n table (half of which
+would be empty), it's stored as a flat triangle: each row
+holds the spans of one length, and each span has a slot for
+every production.  The chart is taken from an arena, which is
+reset and reused between parses, rather than being allocated anew
+for each section.  The arenas are shared by the whole process:
+a parse checks one out of the pool, and returns it when it's done,
+so they outlive the threads (and the checkers) which use them.
+
 """
 
-from typing import List, Optional
+import threading
+from typing import Dict, List, Optional, Tuple
 
 from ..node import CykNode
+from ..profiling import profiled
 from ..token import Token
+from .budget import check_time
 from .grammar import BaseGrammar
 
+# Charts of up to this many slots are kept for the next parse.  A
+# larger chart (for an unusually long section) is released as soon
+# as the parse is done, so one outlier doesn't pin its memory.
+MAX_RETAINED_SLOTS = 1 << 21
+
+# A non-terminal derivation: the index of the production, its
+# symbol, the annotations, the indices of the two symbols on the
+# right-hand side, and the weight.
+_Derivation = Tuple[int, str, List, int, int, int]
+
+
+class ChartArena(object):
+    """A chart which can be reused across parses.
+
+    The arena is not thread-safe: it's used by one parse at a time.
+
+    """
+
+    def __init__(self, max_retained: int = MAX_RETAINED_SLOTS) -> None:
+        """Create an empty arena.
+
+        Args:
+            max_retained: The largest chart, in slots, to keep
+                between parses.
+
+        """
+        self.max_retained = max_retained
+        self.slots: List[Optional[CykNode]] = list()
+
+    def acquire(self, size: int) -> List[Optional[CykNode]]:
+        """Get a chart with at least the given number of empty slots.
+
+        The chart grows geometrically, so a run of slightly longer
+        sections doesn't cause a reallocation for each.
+
+        Args:
+            size: The number of slots required.
+
+        Returns:
+            The chart.  Every slot is empty.
+
+        """
+        capacity = len(self.slots)
+        if capacity < size:
+            self.slots.extend([None] * (max(size, 2 * capacity) - capacity))
+        return self.slots
+
+    def release(self, size: int) -> None:
+        """Reset the slots used by a parse.
+
+        Args:
+            size: The number of slots which were acquired.
+
+        """
+        if len(self.slots) > self.max_retained:
+            self.slots = list()
+        else:
+            # Drop the nodes, so the discarded parts of the
+            # chart can be collected.
+            self.slots[:size] = [None] * size
+
+
+# The arenas which aren't in use.  The most recently returned is
+# checked out first, since its chart is the most likely to be large
+# enough already.
+_pool: List[ChartArena] = list()
+_pool_lock = threading.Lock()
+
+
+def checkout_arena() -> ChartArena:
+    """Take an arena from the pool.
+
+    Returns:
+        An arena which no other parse is using.  It should be
+        given back with `return_arena` when the parse is done.
+
+    """
+    with _pool_lock:
+        if _pool:
+            return _pool.pop()
+    return ChartArena()
+
 
+def return_arena(arena: ChartArena) -> None:
+    """Give an arena back to the pool.
+
+    Args:
+        arena: The arena, which was checked out with
+            `checkout_arena`, and released.
+
+    """
+    with _pool_lock:
+        _pool.append(arena)
+
+
+_compiled: Dict[BaseGrammar, Tuple[Dict[str, int], List[_Derivation]]] = dict()
+
+
+def _compile(grammar: BaseGrammar) -> Tuple[Dict[str, int], List[_Derivation]]:
+    compiled = _compiled.get(grammar)
+    if compiled is None:
+        lookup = grammar.get_symbol_lookup()
+        derivations: List[_Derivation] = list()
+        for a, production in enumerate(grammar.productions):
+            for derivation in production.rhs:
+                if len(derivation) <= 2:
+                    continue
+
+                # TODO: Cast the derivation to a NonTerminalDerivation?
+                annotations, B, C, weight = derivation  # type: ignore
+                derivations.append(
+                    (a, production.lhs, annotations, lookup[B], lookup[C], weight)
+                )
+        compiled = _compiled[grammar] = (lookup, derivations)
+    return compiled
+
+
+def _get_phase(grammar: BaseGrammar, tokens: List[Token]) -> str:
+    return "cyk: " + getattr(grammar, "__name__", type(grammar).__name__)
+
+
+@profiled(_get_phase)
 def parse(grammar: BaseGrammar, tokens: List[Token]) -> Optional[CykNode]:
     if not tokens:
         return None
     n = len(tokens)
     r = len(grammar.productions)
-    P: List[List[List[Optional[CykNode]]]] = [
-        [[None for _ in range(r)] for _ in range(n)] for _ in range(n)
-    ]
-    lookup = grammar.get_symbol_lookup()
-    for s, token in enumerate(tokens):
-        for v, production in enumerate(grammar.productions):
-            for rhs in production.rhs:
-                if len(rhs) > 2:
-                    continue
+    lookup, derivations = _compile(grammar)
+
+    # The span of length l (from 1) starting at token s (from 0)
+    # is at cell `row[l] + s`, and production a's slot in it is
+    # at `cell * r + a`.
+    row = [0, 0]
+    for l in range(1, n):  # noqa: E741
+        row.append(row[l] + n - l + 1)
+    size = (row[n] + 1) * r
+    arena = checkout_arena()
+    P = arena.acquire(size)
+    try:
+        for s, token in enumerate(tokens):
+            for v, production in enumerate(grammar.productions):
+                for rhs in production.rhs:
+                    if len(rhs) > 2:
+                        continue
 
-                # TODO: Cast to a TerminalDerivation?
-                token_type, weight = rhs  # type: ignore
-                if token.token_type == token_type:
-                    P[0][s][v] = CykNode(
-                        production.lhs,
-                        value=token,
-                        weight=weight,
-                    )
-    for l in range(2, n + 1):  # noqa: E741
-        for s in range(n - l + 2):
-            for p in range(l):
-                for a, production in enumerate(grammar.productions):
-                    for derivation in production.rhs:
-                        is_terminal_derivation = len(derivation) <= 2
-                        if is_terminal_derivation:
+                    # TODO: Cast to a TerminalDerivation?
+                    token_type, weight = rhs  # type: ignore
+                    if token.token_type == token_type:
+                        P[s * r + v] = CykNode(
+                            production.lhs,
+                            value=token,
+                            weight=weight,
+                        )
+        for l in range(2, n + 1):  # noqa: E741
+            check_time()
+            for s in range(n - l + 1):
+                cell = (row[l] + s) * r
+                for p in range(1, l):
+                    left = (row[p] + s) * r
+                    right = (row[l - p] + s + p) * r
+                    for a, lhs, annotations, b, c, weight in derivations:
+                        lchild = P[left + b]
+                        if not lchild:
+                            continue
+                        rchild = P[right + c]
+                        if not rchild:
                             continue
+                        old = P[cell + a]
+                        if old and old.weight > weight:
+                            continue
+                        P[cell + a] = CykNode(
+                            lhs,
+                            lchild,
+                            rchild,
+                            annotations=annotations,
+                            weight=weight,
+                        )
+        return P[row[n] * r + lookup[grammar.start]]
+    finally:
+        arena.release(size)
+        return_arena(arena)
+
+
+def _get_specialized_phase(grammar: BaseGrammar, tokens: List[Token]) -> str:
+    return "specialized: " + getattr(grammar, "__name__", type(grammar).__name__)
+
+
+@profiled(_get_specialized_phase)
+def parse_specialized(grammar: BaseGrammar, tokens: List[Token]) -> Optional[CykNode]:
+    """Parse with the function generated for the grammar.
+
+    The generated function fills the chart just as `parse` does,
+    but with the grammar unrolled into its code.
+
+    Args:
+        grammar: The grammar to parse with.
+        tokens: The tokens to parse.
+
+    Returns:
+        The same tree as `parse`.  If the grammar wasn't generated
+        with a specialized parse function, it's parsed by `parse`.
 
-                        # TODO: Cast the derivation to a NonTerminalDerivation?
-                        annotations, B, C, weight = derivation  # type: ignore
-                        b = lookup[B]
-                        c = lookup[C]
-                        lchild = P[p - 1][s - 1][b]
-                        rchild = P[l - p - 1][s + p - 1][c]
-                        if lchild and rchild:
-                            old = P[l - 1][s - 1][a]
-                            if old and old.weight > weight:
-                                continue
-                            P[l - 1][s - 1][a] = CykNode(
-                                production.lhs,
-                                lchild,
-                                rchild,
-                                annotations=annotations,
-                                weight=weight,
-                            )
-    return P[n - 1][0][lookup[grammar.start]]
+    """
+    if grammar.specialized_parse is None:
+        return parse(grammar, tokens)
+    return grammar.specialized_parse(tokens)
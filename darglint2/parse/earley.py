@@ -0,0 +1,218 @@
+"""A predictive chart parser, as an alternative to CYK.
+
+The CYK parser fills in every cell of its chart: for every span of
+the section, it tries every derivation of every symbol in the
+grammar.  Most of that work is wasted, since a symbol can only
+matter at a position if some derivation of the start symbol could
+use it there.  This parser processes the spans in the order of an
+Earley parser -- by their end, left to right -- and only computes
+the symbols which were predicted at the start of a span:
+
+- The start symbol is predicted at the first token.
+- If a symbol is predicted at a position, so is the left child of
+  each of its derivations (and so on, down the left corner.)
+- If the left child of a derivation was completed over a span, and
+  the derivation's symbol was predicted at the start of the span,
+  then its right child is predicted at the end of the span.
+
+Predictions are also filtered by the tokens which each symbol can
+start with and end with.
+
+Every cell which the CYK parser could use to build the tree for the
+start symbol is predicted, and the derivations in each cell are
+folded in the same order (by the split point, then in the order of
+the grammar), so the trees produced are identical to the CYK
+parser's.  (They're the same CNF grammars, after all.)
+
+Whether this is faster than CYK depends on how much of the grammar
+is predicted at each position: see `integration_tests/engines.py`.
+
+"""
+
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
+
+from ..node import CykNode
+from ..profiling import profiled
+from ..token import BaseTokenType, Token
+from .budget import check_time
+from .grammar import BaseGrammar
+
+# The annotations, left child, right child, and weight of a
+# non-terminal derivation.  The children are the indices of the
+# productions.
+_Derivation = Tuple[List[Any], int, int, int]
+
+
+class _Compiled(object):
+    """The tables the parser needs for a grammar."""
+
+    def __init__(self, grammar: BaseGrammar) -> None:
+        """Build the tables for the grammar.
+
+        Args:
+            grammar: The grammar to parse with.
+
+        """
+        lookup = grammar.get_symbol_lookup()
+        self.start = lookup[grammar.start]
+        self.symbols = [production.lhs for production in grammar.productions]
+        self.terminals: List[Dict[BaseTokenType, int]] = list()
+        self.derivations: List[List[_Derivation]] = list()
+
+        # The derivations in which each symbol is the left child, as
+        # pairs of the derivation's symbol and its right child.
+        self.after: Dict[int, List[Tuple[int, int]]] = dict()
+
+        for a, production in enumerate(grammar.productions):
+            terminals: Dict[BaseTokenType, int] = dict()
+            derivations: List[_Derivation] = list()
+            for derivation in production.rhs:
+                if len(derivation) <= 2:
+                    # The last matching terminal derivation wins.
+                    token_type, weight = derivation  # type: ignore
+                    terminals[token_type] = weight
+                    continue
+                annotations, B, C, weight = derivation  # type: ignore
+                b, c = lookup[B], lookup[C]
+                derivations.append((annotations, b, c, weight))
+                self.after.setdefault(b, list()).append((a, c))
+            self.terminals.append(terminals)
+            self.derivations.append(derivations)
+
+        # Only the last production for a symbol is ever read by the
+        # CYK parser, so the others are never predicted.
+        live = set(lookup.values())
+        self.left_corners = [
+            self._close(a, lambda x: [b for _, b, _, _ in self.derivations[x]]) & live
+            for a in range(len(self.symbols))
+        ]
+        self.starts_with = self._invert(lambda x: [b for _, b, _, _ in x])
+        self.ends_with = self._invert(lambda x: [c for _, _, c, _ in x])
+
+    def _close(self, a: int, children) -> FrozenSet[int]:
+        closure = {a}
+        stack = [a]
+        while stack:
+            for child in children(stack.pop()):
+                if child not in closure:
+                    closure.add(child)
+                    stack.append(child)
+        return frozenset(closure)
+
+    def _invert(self, children) -> Dict[BaseTokenType, FrozenSet[int]]:
+        """Find the symbols which can start (or end) with each token type.
+
+        Args:
+            children: Gives the children on the relevant side of
+                a list of derivations.
+
+        Returns:
+            The symbols, by token type.
+
+        """
+        by_type: Dict[BaseTokenType, Set[int]] = dict()
+        for a, terminals in enumerate(self.terminals):
+            for token_type in terminals:
+                by_type.setdefault(token_type, set()).add(a)
+        changed = True
+        while changed:
+            changed = False
+            for a, derivations in enumerate(self.derivations):
+                for child in children(derivations):
+                    for symbols in by_type.values():
+                        if child in symbols and a not in symbols:
+                            symbols.add(a)
+                            changed = True
+        return {key: frozenset(value) for key, value in by_type.items()}
+
+
+_compiled: Dict[BaseGrammar, _Compiled] = dict()
+
+
+def _compile(grammar: BaseGrammar) -> _Compiled:
+    compiled = _compiled.get(grammar)
+    if compiled is None:
+        compiled = _compiled[grammar] = _Compiled(grammar)
+    return compiled
+
+
+def _get_phase(grammar: BaseGrammar, tokens: List[Token]) -> str:
+    return "earley: " + getattr(grammar, "__name__", type(grammar).__name__)
+
+
+@profiled(_get_phase)
+def parse(grammar: BaseGrammar, tokens: List[Token]) -> Optional[CykNode]:
+    """Parse the tokens, building the same tree as the CYK parser.
+
+    Args:
+        grammar: The grammar to parse with.
+        tokens: The tokens to parse.
+
+    Returns:
+        The tree for the start symbol over all of the tokens, or
+        None if the grammar doesn't derive them.
+
+    """
+    if not tokens:
+        return None
+    g = _compile(grammar)
+    n = len(tokens)
+    empty: FrozenSet[int] = frozenset()
+    starts = [g.starts_with.get(token.token_type, empty) for token in tokens]
+    ends = [g.ends_with.get(token.token_type, empty) for token in tokens]
+
+    # The completed symbols, by the start and end of their span.
+    chart: List[Dict[int, Dict[int, CykNode]]] = [dict() for _ in range(n + 1)]
+    predicted: List[Set[int]] = [set() for _ in range(n)]
+    predicted[0].update(g.left_corners[g.start] & starts[0])
+    for j in range(1, n + 1):
+        check_time()
+        for i in range(j - 1, -1, -1):
+            symbols = predicted[i] & ends[j - 1]
+            if not symbols:
+                continue
+            cell: Dict[int, CykNode] = dict()
+            if j == i + 1:
+                token = tokens[i]
+                for a in symbols:
+                    weight = g.terminals[a].get(token.token_type)
+                    if weight is not None:
+                        cell[a] = CykNode(g.symbols[a], value=token, weight=weight)
+            else:
+                splits = [
+                    (left, chart[k][j])
+                    for k, left in chart[i].items()
+                    if k < j and j in chart[k]
+                ]
+                if not splits:
+                    continue
+                for a in symbols:
+                    current: Optional[CykNode] = None
+                    for left, right in splits:
+                        for annotations, b, c, weight in g.derivations[a]:
+                            lchild = left.get(b)
+                            if not lchild:
+                                continue
+                            rchild = right.get(c)
+                            if not rchild:
+                                continue
+                            if current and current.weight > weight:
+                                continue
+                            current = CykNode(
+                                g.symbols[a],
+                                lchild,
+                                rchild,
+                                annotations=annotations,
+                                weight=weight,
+                            )
+                    if current:
+                        cell[a] = current
+            if not cell:
+                continue
+            chart[i][j] = cell
+            if j < n:
+                for b in cell:
+                    for a, c in g.after.get(b, []):
+                        if a in predicted[i]:
+                            predicted[j].update(g.left_corners[c] & starts[j])
+    return chart[0].get(n, {}).get(g.start)
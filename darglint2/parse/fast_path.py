@@ -0,0 +1,485 @@
+"""Support for building CYK-identical trees without running CYK.
+
+Most sections in real docstrings are in their canonical form, e.g.
+`name (type): description`.  For those, a hand-written recognizer
+can find the structure of the section in a single pass.  Given that
+structure, a `TreeBuilder` builds the tree which the CYK parser would
+have produced for the same tokens: the derivations, annotations and
+weights are all looked up in the grammar, and where several
+derivations could produce a node from the same children, the same
+choice is made as the CYK parser would make.  (See `TreeBuilder.node`.)
+
+The sections can be long (say, a table of hundreds of arguments), so
+the builders never recurse once per token or line.  A right-nested
+list, such as a line of words or the items of a section, is built
+bottom-up from its end.  (See `TreeBuilder.chain`.)
+
+The recognizers decide the spans of the nodes.  They only accept
+sections whose structure is unambiguous under the grammar, and reject
+everything else by raising `Rejected`, in which case the section is
+parsed by CYK.  The differential tests in `tests/test_fast_path.py`
+check that, for every section accepted, the trees are identical.
+
+"""
+
+from typing import (
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+
+from ..node import CykNode
+from ..profiling import timed
+from ..token import Token, TokenType
+from .budget import check_section
+from .cyk import parse as cyk_parse
+from .cyk import parse_specialized
+from .earley import parse as earley_parse
+from .grammar import CYK, EARLEY, SPECIALIZED, BaseGrammar
+
+# A child of a node being built.  Either the node itself, or a
+# function which builds the node, given the symbol it must have.
+# Functions are used when the symbol depends on where the node ends
+# up in the tree (for example, because the grammar inlined a unit
+# production.)
+Child = Union[CykNode, Callable[[str], CykNode]]
+
+# The tokens which can appear in a line of a description, in
+# a canonical section.  Notably, this excludes hashes, which could
+# start a noqa statement, and keywords, which could start a section.
+LINE_TOKENS = {
+    TokenType.WORD,
+    TokenType.COLON,
+    TokenType.LPAREN,
+    TokenType.RPAREN,
+}
+
+
+class Rejected(Exception):
+    """The section is not in a form the recognizer accepts."""
+
+
+class TreeBuilder(object):
+    """Builds nodes using the derivations of a grammar."""
+
+    def __init__(self, grammar: Type[BaseGrammar]) -> None:
+        """Index the grammar's derivations.
+
+        Args:
+            grammar: The grammar whose trees we are building.
+
+        """
+        self.grammar = grammar
+        self.start: str = grammar.start  # type: ignore
+        self.terminals: Dict[Tuple[str, TokenType], int] = dict()
+        self.derivations: Dict[str, List[Tuple[List, str, str, int]]] = dict()
+        for production in grammar.productions:  # type: ignore
+            for derivation in production.rhs:
+                if len(derivation) <= 2:
+                    token_type, weight = derivation  # type: ignore
+
+                    # The last matching terminal derivation wins.
+                    self.terminals[(production.lhs, token_type)] = weight
+                    continue
+                self.derivations.setdefault(production.lhs, list()).append(
+                    derivation  # type: ignore
+                )
+
+        # The symbols which can be the right child of any of the
+        # given symbols.  (See `_nest`.)
+        self._right_symbols: Dict[FrozenSet[str], FrozenSet[str]] = dict()
+
+    def leaf(self, symbol: str, token: Token) -> CykNode:
+        """Build a terminal node.
+
+        Args:
+            symbol: The symbol of the node.
+            token: The token the node derives.
+
+        Raises:
+            Rejected: If the symbol cannot derive the token.
+
+        Returns:
+            The node.
+
+        """
+        weight = self.terminals.get((symbol, token.token_type))
+        if weight is None:
+            raise Rejected
+        return CykNode(symbol, value=token, weight=weight)
+
+    def node(self, symbol: str, lchild: Child, rchild: Child) -> CykNode:
+        """Build a non-terminal node from its children.
+
+        If there are several derivations of the symbol from these
+        children, they are considered in the grammar's order, and a
+        derivation replaces the previous one unless the previous node
+        is heavier.  This is the rule used by the CYK parser.
+
+        Args:
+            symbol: The symbol of the node.
+            lchild: The left child, or a function which builds
+                it given its symbol.
+            rchild: The right child, or a function which builds
+                it given its symbol.
+
+        Raises:
+            Rejected: If the symbol has no derivation from the
+                children.
+
+        Returns:
+            The node.
+
+        """
+        lefts: Dict[str, Optional[CykNode]] = dict()
+        rights: Dict[str, Optional[CykNode]] = dict()
+        current = self._derive(
+            symbol,
+            lambda B: _build(lchild, B, lefts),
+            lambda C: _build(rchild, C, rights),
+        )
+        if current is None:
+            raise Rejected
+        return current
+
+    def _derive(
+        self,
+        symbol: str,
+        left: Callable[[str], Optional[CykNode]],
+        right: Callable[[str], Optional[CykNode]],
+    ) -> Optional[CykNode]:
+        current: Optional[CykNode] = None
+        for annotations, B, C, weight in self.derivations.get(symbol, []):
+            lnode = left(B)
+            if lnode is None:
+                continue
+            rnode = right(C)
+            if rnode is None:
+                continue
+            if current and current.weight > weight:
+                continue
+            current = CykNode(
+                symbol,
+                lnode,
+                rnode,
+                annotations=annotations,
+                weight=weight,
+            )
+        return current
+
+    def _get_right_symbols(self, symbols: FrozenSet[str]) -> FrozenSet[str]:
+        right_symbols = self._right_symbols.get(symbols)
+        if right_symbols is None:
+            right_symbols = frozenset(
+                C
+                for symbol in symbols
+                for _, _, C, _ in self.derivations.get(symbol, [])
+            )
+            self._right_symbols[symbols] = right_symbols
+        return right_symbols
+
+    def _nest(self, symbol: str, lefts: Sequence[Child], last: Child) -> CykNode:
+        """Build a right-nested list of children.
+
+        The list is built bottom-up: first the last child, for each
+        symbol it could have, then each node above it, for each
+        symbol it could have.  This builds the same node for each
+        symbol as building the list top-down would, without
+        recursing once per child.
+
+        Args:
+            symbol: The symbol of the list's root.
+            lefts: The left child at each level of the list.
+            last: The right child at the bottom of the list.
+
+        Raises:
+            Rejected: If the symbol has no derivation of the list.
+
+        Returns:
+            The list's root.
+
+        """
+        # The symbols each level of the list could have.
+        levels = [frozenset([symbol])]
+        for _ in range(len(lefts)):
+            levels.append(self._get_right_symbols(levels[-1]))
+
+        memo: Dict[str, Optional[CykNode]] = dict()
+        built = {x: _build(last, x, memo) for x in levels[-1]}
+        for i in range(len(lefts) - 1, -1, -1):
+            memo = dict()
+            lchild = lefts[i]
+            below = built
+            built = dict()
+            for x in levels[i]:
+                built[x] = self._derive(x, lambda B: _build(lchild, B, memo), below.get)
+        node = built[symbol]
+        if node is None:
+            raise Rejected
+        return node
+
+    def chain(self, symbol: str, children: Sequence[Child]) -> CykNode:
+        """Build a node from a sequence of children.
+
+        The grammar is in Chomsky normal form, so a production with
+        more than two symbols on its right-hand side is split into
+        a right-nested chain of intermediate symbols.  This rebuilds
+        that chain.  A list of any length (e.g. the lines of a
+        paragraph) is built by passing all of its children here,
+        rather than by nesting calls.
+
+        Args:
+            symbol: The symbol of the node.
+            children: The children, in order.
+
+        Returns:
+            The node.
+
+        """
+        if len(children) == 2:
+            return self.node(symbol, children[0], children[1])
+        left, right = children[-2], children[-1]
+        return self._nest(symbol, children[:-2], lambda s: self.node(s, left, right))
+
+    def terminal(self, token: Token) -> Child:
+        """Defer building a terminal node until its symbol is known.
+
+        Args:
+            token: The token the node derives.
+
+        Returns:
+            A function which builds the node, given its symbol.
+
+        """
+        return lambda symbol: self.leaf(symbol, token)
+
+    def line(self, symbol: str, tokens: Sequence[Token]) -> CykNode:
+        """Build a line of words.
+
+        Args:
+            symbol: The symbol of the line's root.
+            tokens: The tokens in the line.
+
+        Returns:
+            The line, as a right-nested list of words.
+
+        """
+        return self._nest(
+            symbol,
+            [self.terminal(token) for token in tokens[:-1]],
+            self.terminal(tokens[-1]),
+        )
+
+    def run(self, symbol: str, tokens: Sequence[Token]) -> CykNode:
+        """Build a run of tokens of the same type, such as indents.
+
+        Args:
+            symbol: The symbol of the run's root.
+            tokens: The tokens in the run.
+
+        Returns:
+            The run, as a right-nested list of tokens.
+
+        """
+        return self._nest(
+            symbol,
+            [self.terminal(token) for token in tokens[:-1]],
+            self.terminal(tokens[-1]),
+        )
+
+    def paragraph(self, symbol: str, lines: Sequence["Line"]) -> CykNode:
+        """Build a paragraph of indented lines.
+
+        Args:
+            symbol: The symbol of the paragraph's root.
+            lines: The lines in the paragraph.  Each line must be
+                indented.
+
+        Raises:
+            Rejected: If a line is not plain, or not indented.
+
+        Returns:
+            The paragraph, as a right-nested list of lines.
+
+        """
+        children: List[Child] = list()
+        for i, line in enumerate(lines):
+            if not line.indents or not is_plain(line.tokens):
+                raise Rejected
+            if i:
+                newline = lines[i - 1].newline
+                assert newline is not None
+                children.append(self.terminal(newline))
+            children.append(self._run_builder(line.indents))
+            children.append(self._line_builder(line.tokens))
+        return self.chain(symbol, children)
+
+    def _run_builder(self, tokens: Sequence[Token]) -> Child:
+        return lambda s: self.run(s, tokens)
+
+    def _line_builder(self, tokens: Sequence[Token]) -> Child:
+        return lambda s: self.line(s, tokens)
+
+    def description(
+        self,
+        symbol: str,
+        tokens: Sequence[Token],
+        newline: Optional[Token],
+        rest: Sequence["Line"],
+        continuation: Optional[Child] = None,
+    ) -> CykNode:
+        """Build a description, and any indented lines continuing it.
+
+        Args:
+            symbol: The symbol of the description's root.
+            tokens: The tokens in the first line of the description.
+            newline: The newline ending the first line.
+            rest: The lines continuing the description.
+            continuation: Builds the lines continuing the description.
+                By default, they are built as a single paragraph.
+
+        Raises:
+            Rejected: If the description is empty, or any of
+                its lines are not plain.
+
+        Returns:
+            The description.
+
+        """
+        if not tokens or not is_plain(tokens):
+            raise Rejected
+        if not rest:
+            return self.line(symbol, tokens)
+        assert newline is not None
+        return self.chain(
+            symbol,
+            [
+                lambda s: self.line(s, tokens),
+                self.terminal(newline),
+                continuation or (lambda s: self.paragraph(s, rest)),
+            ],
+        )
+
+
+def _build(
+    child: Child, symbol: str, built: Dict[str, Optional[CykNode]]
+) -> Optional[CykNode]:
+    if symbol not in built:
+        if isinstance(child, CykNode):
+            built[symbol] = child if child.symbol == symbol else None
+        else:
+            try:
+                built[symbol] = child(symbol)
+            except Rejected:
+                built[symbol] = None
+    return built[symbol]
+
+
+class Line(object):
+    """A line in a canonical section."""
+
+    __slots__ = ("indents", "tokens", "newline")
+
+    def __init__(
+        self,
+        indents: List[Token],
+        tokens: List[Token],
+        newline: Optional[Token],
+    ) -> None:
+        self.indents = indents
+        self.tokens = tokens
+
+        # The newline which ends this line, if any.
+        self.newline = newline
+
+
+def split_lines(tokens: Sequence[Token], start: int = 0) -> List[Line]:
+    """Split the tokens into lines.
+
+    Args:
+        tokens: The tokens in the section.
+        start: The index of the first token to split.
+
+    Raises:
+        Rejected: If there is an empty line.
+
+    Returns:
+        The lines, with their leading indents separated.
+
+    """
+    lines = list()
+    i = start
+    n = len(tokens)
+    while i < n:
+        indents = list()
+        while i < n and tokens[i].token_type == TokenType.INDENT:
+            indents.append(tokens[i])
+            i += 1
+        j = i
+        while j < n and tokens[j].token_type != TokenType.NEWLINE:
+            j += 1
+        if j == i:
+            raise Rejected
+        newline = tokens[j] if j < n else None
+        lines.append(Line(indents, list(tokens[i:j]), newline))
+        i = j + 1
+    if lines and lines[-1].newline is not None:
+        # A trailing newline is left to CYK.
+        raise Rejected
+    return lines
+
+
+def is_plain(tokens: Sequence[Token], allowed=LINE_TOKENS) -> bool:
+    return all(token.token_type in allowed for token in tokens)
+
+
+FastPath = Callable[[List[Token]], CykNode]
+
+# The parsers which sections are left to, by the grammar's engine.
+ENGINES = {
+    CYK: cyk_parse,
+    EARLEY: earley_parse,
+    SPECIALIZED: parse_specialized,
+}
+
+
+def parse_section(
+    grammar: Type[BaseGrammar],
+    tokens: List[Token],
+    fast_paths: Dict[Type[BaseGrammar], FastPath],
+) -> Optional[CykNode]:
+    """Parse the section, using the grammar's fast path if it has one.
+
+    Args:
+        grammar: The grammar to parse the section with.
+        tokens: The tokens in the section.
+        fast_paths: The fast paths, by the grammar they build
+            trees for.
+
+    Raises:
+        BudgetExceeded: If the section has to be parsed by the
+            grammar's engine, but doing so would exceed the
+            docstring's budget.
+
+    Returns:
+        The tree the CYK parser builds for the section, if
+        the section matches the grammar.
+
+    # noqa: DAR402 BudgetExceeded
+
+    """
+    fast_path = fast_paths.get(grammar)
+    if fast_path is not None and tokens:
+        try:
+            with timed("fast: " + grammar.__name__):  # type: ignore
+                return fast_path(tokens)
+        except Rejected:
+            pass
+    check_section(tokens)
+    return ENGINES[grammar.engine](grammar, tokens)  # type: ignore
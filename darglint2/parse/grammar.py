@@ -1,16 +1,25 @@
 """Defines a base class far describing grammars."""
 
 import abc
-from typing import Any, Dict, List, Optional, Tuple, Union  # noqa: F401
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union  # noqa: F401
 
 from ..custom_assert import Assert
-from ..token import TokenType
+from ..node import CykNode
+from ..token import Token, TokenType
 
 Annotation = Any  # TODO(000): This should actually be Union[Identifier, DarglintError]
 NonTerminalDerivation = Tuple[List[Annotation], str, str, int]
 TerminalDerivation = Tuple[TokenType, int]
 Derivation = Union[NonTerminalDerivation, TerminalDerivation]
 
+# The engines which can parse a grammar.  All build the same trees.
+CYK = "cyk"
+EARLEY = "earley"
+
+# The parse function generated for the grammar by `bnf_to_cnf -f
+# specialized`, or CYK for a grammar which doesn't have one.
+SPECIALIZED = "specialized"
+
 
 class Production(object):
     """Represents a production in a grammar."""
@@ -43,6 +52,16 @@ P = Production
 
 
 class BaseGrammar(abc.ABC):
+    # The engine used to parse sections with this grammar, when
+    # they aren't handled by a fast path.  One of `CYK`, `EARLEY`
+    # or `SPECIALIZED`.  Grammars opt in to the other engines in
+    # their style's module.
+    engine = CYK
+
+    # The parse function generated for the grammar, if it was
+    # generated in the specialized format.
+    specialized_parse: Optional[Callable[[List[Token]], Optional[CykNode]]] = None
+
     @property
     @abc.abstractmethod
     def productions(self) -> List[Production]:
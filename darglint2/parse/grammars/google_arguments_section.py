@@ -1,4 +1,6 @@
-# Generated on 2023-02-05 17:17:11.854917
+# Generated on 2026-10-19 17:43:15.126804
+
+from typing import Any, List
 
 from darglint2.errors import (
     EmptyDescriptionError,
@@ -6,6 +8,9 @@ from darglint2.errors import (
     IndentError,
     ParameterMalformedError,
 )
+from darglint2.node import CykNode
+from darglint2.parse.budget import check_time
+from darglint2.parse.cyk import checkout_arena, return_arena
 from darglint2.parse.grammar import BaseGrammar, P
 from darglint2.parse.identifiers import (
     ArgumentIdentifier,
@@ -569,3 +574,1162 @@ class ArgumentsGrammar(BaseGrammar):
         ),
     ]
     start = "arguments-section"
+
+    @staticmethod
+    def specialized_parse(tokens):
+        if not tokens:
+            return None
+        n = len(tokens)
+        row = [0, 0]
+        for l in range(1, n):  # noqa: E741
+            row.append(row[l] + n - l + 1)
+        size = (row[n] + 1) * 60
+        arena = checkout_arena()
+        P = arena.acquire(size)
+        try:
+            for s, token in enumerate(tokens):
+                for a, symbol, weight in _TERMINALS.get(token.token_type, ()):
+                    P[s * 60 + a] = CykNode(symbol, value=token, weight=weight)
+            for l in range(2, n + 1):  # noqa: E741
+                check_time()
+                for s in range(n - l + 1):
+                    cell = (row[l] + s) * 60
+                    for p in range(1, l):
+                        left = (row[p] + s) * 60
+                        right = (row[l - p] + s + p) * 60
+                        x = P[left + 13]
+                        if x:
+                            y = P[right + 29]
+                            if y:
+                                old = P[cell]
+                                if old is None or old.weight <= 0:
+                                    P[cell] = CykNode(
+                                        "arguments-section", x, y, annotations=_A0
+                                    )
+                        x = P[left + 2]
+                        if x:
+                            y = P[right + 32]
+                            if y:
+                                old = P[cell + 1]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 1] = CykNode(
+                                        "items-argument", x, y, annotations=_A0
+                                    )
+                        x = P[left + 3]
+                        if x:
+                            y = P[right + 4]
+                            if y:
+                                old = P[cell + 1]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 1] = CykNode(
+                                        "items-argument", x, y, annotations=_A1
+                                    )
+                        x = P[left + 16]
+                        if x:
+                            y = P[right + 33]
+                            if y:
+                                old = P[cell + 1]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 1] = CykNode(
+                                        "items-argument", x, y, annotations=_A2
+                                    )
+                            y = P[right + 34]
+                            if y:
+                                old = P[cell + 1]
+                                if old is None or old.weight <= 2:
+                                    P[cell + 1] = CykNode(
+                                        "items-argument",
+                                        x,
+                                        y,
+                                        annotations=_A3,
+                                        weight=2,
+                                    )
+                            y = P[right + 37]
+                            if y:
+                                old = P[cell + 1]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 1] = CykNode(
+                                        "items-argument", x, y, annotations=_A4
+                                    )
+                            y = P[right + 39]
+                            if y:
+                                old = P[cell + 1]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 1] = CykNode(
+                                        "items-argument", x, y, annotations=_A4
+                                    )
+                            y = P[right + 42]
+                            if y:
+                                old = P[cell + 1]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 1] = CykNode(
+                                        "items-argument", x, y, annotations=_A2
+                                    )
+                        x = P[left + 3]
+                        if x:
+                            y = P[right + 4]
+                            if y:
+                                old = P[cell + 2]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 2] = CykNode(
+                                        "item-argument", x, y, annotations=_A1
+                                    )
+                        x = P[left + 16]
+                        if x:
+                            y = P[right + 33]
+                            if y:
+                                old = P[cell + 2]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 2] = CykNode(
+                                        "item-argument", x, y, annotations=_A2
+                                    )
+                            y = P[right + 34]
+                            if y:
+                                old = P[cell + 2]
+                                if old is None or old.weight <= 2:
+                                    P[cell + 2] = CykNode(
+                                        "item-argument", x, y, annotations=_A3, weight=2
+                                    )
+                            y = P[right + 37]
+                            if y:
+                                old = P[cell + 2]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 2] = CykNode(
+                                        "item-argument", x, y, annotations=_A4
+                                    )
+                            y = P[right + 39]
+                            if y:
+                                old = P[cell + 2]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 2] = CykNode(
+                                        "item-argument", x, y, annotations=_A4
+                                    )
+                            y = P[right + 42]
+                            if y:
+                                old = P[cell + 2]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 2] = CykNode(
+                                        "item-argument", x, y, annotations=_A2
+                                    )
+                            y = P[right + 33]
+                            if y:
+                                old = P[cell + 3]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 3] = CykNode(
+                                        "head-argument", x, y, annotations=_A5
+                                    )
+                            y = P[right + 34]
+                            if y:
+                                old = P[cell + 3]
+                                if old is None or old.weight <= 2:
+                                    P[cell + 3] = CykNode(
+                                        "head-argument", x, y, annotations=_A6, weight=2
+                                    )
+                            y = P[right + 37]
+                            if y:
+                                old = P[cell + 3]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 3] = CykNode(
+                                        "head-argument", x, y, annotations=_A7
+                                    )
+                            y = P[right + 39]
+                            if y:
+                                old = P[cell + 3]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 3] = CykNode(
+                                        "head-argument", x, y, annotations=_A7
+                                    )
+                            y = P[right + 42]
+                            if y:
+                                old = P[cell + 3]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 3] = CykNode(
+                                        "head-argument", x, y, annotations=_A5
+                                    )
+                        x = P[left + 7]
+                        if x:
+                            y = P[right + 44]
+                            if y:
+                                old = P[cell + 4]
+                                if old is None or old.weight <= 2:
+                                    P[cell + 4] = CykNode(
+                                        "item-body", x, y, annotations=_A0, weight=2
+                                    )
+                            y = P[right + 45]
+                            if y:
+                                old = P[cell + 4]
+                                if old is None or old.weight <= 2:
+                                    P[cell + 4] = CykNode(
+                                        "item-body", x, y, annotations=_A0, weight=2
+                                    )
+                            y = P[right + 18]
+                            if y:
+                                old = P[cell + 4]
+                                if old is None or old.weight <= 2:
+                                    P[cell + 4] = CykNode(
+                                        "item-body", x, y, annotations=_A0, weight=2
+                                    )
+                        x = P[left + 11]
+                        if x:
+                            y = P[right + 7]
+                            if y:
+                                old = P[cell + 4]
+                                if old is None or old.weight <= 2:
+                                    P[cell + 4] = CykNode(
+                                        "item-body", x, y, annotations=_A0, weight=2
+                                    )
+                            y = P[right + 21]
+                            if y:
+                                old = P[cell + 4]
+                                if old is None or old.weight <= 2:
+                                    P[cell + 4] = CykNode(
+                                        "item-body", x, y, annotations=_A0, weight=2
+                                    )
+                        x = P[left + 15]
+                        if x:
+                            y = P[right + 20]
+                            if y:
+                                old = P[cell + 4]
+                                if old is None or old.weight <= 2:
+                                    P[cell + 4] = CykNode(
+                                        "item-body", x, y, annotations=_A8, weight=2
+                                    )
+                        x = P[left + 22]
+                        if x:
+                            y = P[right + 56]
+                            if y:
+                                old = P[cell + 4]
+                                if old is None or old.weight <= 2:
+                                    P[cell + 4] = CykNode(
+                                        "item-body", x, y, annotations=_A8, weight=2
+                                    )
+                        x = P[left + 7]
+                        if x:
+                            y = P[right + 47]
+                            if y:
+                                old = P[cell + 4]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 4] = CykNode(
+                                        "item-body", x, y, annotations=_A9
+                                    )
+                            y = P[right + 48]
+                            if y:
+                                old = P[cell + 4]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 4] = CykNode(
+                                        "item-body", x, y, annotations=_A9
+                                    )
+                        x = P[left + 8]
+                        if x:
+                            y = P[right + 50]
+                            if y:
+                                old = P[cell + 5]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 5] = CykNode(
+                                        "paragraph-indented-two", x, y, annotations=_A0
+                                    )
+                            y = P[right + 7]
+                            if y:
+                                old = P[cell + 5]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 5] = CykNode(
+                                        "paragraph-indented-two", x, y, annotations=_A0
+                                    )
+                        x = P[left + 9]
+                        if x:
+                            y = P[right + 52]
+                            if y:
+                                old = P[cell + 6]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 6] = CykNode(
+                                        "paragraph", x, y, annotations=_A0
+                                    )
+                            y = P[right + 7]
+                            if y:
+                                old = P[cell + 6]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 6] = CykNode(
+                                        "paragraph", x, y, annotations=_A0
+                                    )
+                        x = P[left + 7]
+                        if x:
+                            y = P[right + 54]
+                            if y:
+                                old = P[cell + 6]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 6] = CykNode(
+                                        "paragraph", x, y, annotations=_A0
+                                    )
+                        x = P[left + 11]
+                        if x:
+                            y = P[right + 7]
+                            if y:
+                                old = P[cell + 6]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 6] = CykNode(
+                                        "paragraph", x, y, annotations=_A0
+                                    )
+                            y = P[right + 21]
+                            if y:
+                                old = P[cell + 6]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 6] = CykNode(
+                                        "paragraph", x, y, annotations=_A0
+                                    )
+                        x = P[left + 15]
+                        if x:
+                            y = P[right + 20]
+                            if y:
+                                old = P[cell + 6]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 6] = CykNode(
+                                        "paragraph", x, y, annotations=_A8
+                                    )
+                        x = P[left + 22]
+                        if x:
+                            y = P[right + 56]
+                            if y:
+                                old = P[cell + 6]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 6] = CykNode(
+                                        "paragraph", x, y, annotations=_A8
+                                    )
+                        x = P[left + 7]
+                        if x:
+                            y = P[right + 53]
+                            if y:
+                                old = P[cell + 6]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 6] = CykNode(
+                                        "paragraph", x, y, annotations=_A0
+                                    )
+                        x = P[left + 11]
+                        if x:
+                            y = P[right + 7]
+                            if y:
+                                old = P[cell + 7]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 7] = CykNode("line", x, y, annotations=_A0)
+                            y = P[right + 21]
+                            if y:
+                                old = P[cell + 7]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 7] = CykNode("line", x, y, annotations=_A0)
+                        x = P[left + 15]
+                        if x:
+                            y = P[right + 20]
+                            if y:
+                                old = P[cell + 7]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 7] = CykNode("line", x, y, annotations=_A8)
+                        x = P[left + 22]
+                        if x:
+                            y = P[right + 56]
+                            if y:
+                                old = P[cell + 7]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 7] = CykNode("line", x, y, annotations=_A8)
+                        x = P[left + 16]
+                        if x:
+                            y = P[right + 55]
+                            if y:
+                                old = P[cell + 8]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 8] = CykNode(
+                                        "indented-two", x, y, annotations=_A0
+                                    )
+                            y = P[right + 9]
+                            if y:
+                                old = P[cell + 9]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 9] = CykNode(
+                                        "indents", x, y, annotations=_A0
+                                    )
+                        x = P[left + 18]
+                        if x:
+                            y = P[right + 10]
+                            if y:
+                                old = P[cell + 10]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 10] = CykNode(
+                                        "newlines", x, y, annotations=_A0
+                                    )
+                        x = P[left + 15]
+                        if x:
+                            y = P[right + 20]
+                            if y:
+                                old = P[cell + 21]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 21] = CykNode(
+                                        "noqa-maybe", x, y, annotations=_A8
+                                    )
+                        x = P[left + 22]
+                        if x:
+                            y = P[right + 56]
+                            if y:
+                                old = P[cell + 21]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 21] = CykNode(
+                                        "noqa-maybe", x, y, annotations=_A8
+                                    )
+                        x = P[left + 15]
+                        if x:
+                            y = P[right + 20]
+                            if y:
+                                old = P[cell + 22]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 22] = CykNode(
+                                        "noqa-head", x, y, annotations=_A0
+                                    )
+                        x = P[left + 11]
+                        if x:
+                            y = P[right + 23]
+                            if y:
+                                old = P[cell + 23]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 23] = CykNode(
+                                        "words", x, y, annotations=_A0
+                                    )
+                        x = P[left + 17]
+                        if x:
+                            y = P[right + 57]
+                            if y:
+                                old = P[cell + 24]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 24] = CykNode(
+                                        "type-section-parens", x, y, annotations=_A0
+                                    )
+                        x = P[left + 26]
+                        if x:
+                            y = P[right + 25]
+                            if y:
+                                old = P[cell + 25]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 25] = CykNode(
+                                        "type-words-colon", x, y, annotations=_A0
+                                    )
+                            y = P[right + 58]
+                            if y:
+                                old = P[cell + 25]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 25] = CykNode(
+                                        "type-words-colon", x, y, annotations=_A0
+                                    )
+                        x = P[left + 28]
+                        if x:
+                            y = P[right + 27]
+                            if y:
+                                old = P[cell + 25]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 25] = CykNode(
+                                        "type-words-colon", x, y, annotations=_A10
+                                    )
+                            y = P[right + 27]
+                            if y:
+                                old = P[cell + 27]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 27] = CykNode(
+                                        "malformed-type-words", x, y, annotations=_A0
+                                    )
+                        x = P[left + 14]
+                        if x:
+                            y = P[right + 30]
+                            if y:
+                                old = P[cell + 29]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 29] = CykNode(
+                                        "arguments-section1", x, y, annotations=_A0
+                                    )
+                        x = P[left + 18]
+                        if x:
+                            y = P[right + 31]
+                            if y:
+                                old = P[cell + 30]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 30] = CykNode(
+                                        "arguments-section2", x, y, annotations=_A0
+                                    )
+                        x = P[left + 1]
+                        if x:
+                            y = P[right + 10]
+                            if y:
+                                old = P[cell + 31]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 31] = CykNode(
+                                        "arguments-section3", x, y, annotations=_A0
+                                    )
+                        x = P[left + 2]
+                        if x:
+                            y = P[right + 32]
+                            if y:
+                                old = P[cell + 31]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 31] = CykNode(
+                                        "arguments-section3", x, y, annotations=_A0
+                                    )
+                        x = P[left + 3]
+                        if x:
+                            y = P[right + 4]
+                            if y:
+                                old = P[cell + 31]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 31] = CykNode(
+                                        "arguments-section3", x, y, annotations=_A1
+                                    )
+                        x = P[left + 16]
+                        if x:
+                            y = P[right + 33]
+                            if y:
+                                old = P[cell + 31]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 31] = CykNode(
+                                        "arguments-section3", x, y, annotations=_A2
+                                    )
+                            y = P[right + 34]
+                            if y:
+                                old = P[cell + 31]
+                                if old is None or old.weight <= 2:
+                                    P[cell + 31] = CykNode(
+                                        "arguments-section3",
+                                        x,
+                                        y,
+                                        annotations=_A3,
+                                        weight=2,
+                                    )
+                            y = P[right + 37]
+                            if y:
+                                old = P[cell + 31]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 31] = CykNode(
+                                        "arguments-section3", x, y, annotations=_A4
+                                    )
+                            y = P[right + 39]
+                            if y:
+                                old = P[cell + 31]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 31] = CykNode(
+                                        "arguments-section3", x, y, annotations=_A4
+                                    )
+                            y = P[right + 42]
+                            if y:
+                                old = P[cell + 31]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 31] = CykNode(
+                                        "arguments-section3", x, y, annotations=_A2
+                                    )
+                        x = P[left + 18]
+                        if x:
+                            y = P[right + 1]
+                            if y:
+                                old = P[cell + 32]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 32] = CykNode(
+                                        "items-argument0", x, y, annotations=_A0
+                                    )
+                        x = P[left + 12]
+                        if x:
+                            y = P[right + 14]
+                            if y:
+                                old = P[cell + 33]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 33] = CykNode(
+                                        "head-argument1", x, y, annotations=_A0
+                                    )
+                            y = P[right + 35]
+                            if y:
+                                old = P[cell + 34]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 34] = CykNode(
+                                        "head-argument3", x, y, annotations=_A0
+                                    )
+                        x = P[left + 17]
+                        if x:
+                            y = P[right + 36]
+                            if y:
+                                old = P[cell + 35]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 35] = CykNode(
+                                        "head-argument4", x, y, annotations=_A0
+                                    )
+                        x = P[left + 19]
+                        if x:
+                            y = P[right + 14]
+                            if y:
+                                old = P[cell + 36]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 36] = CykNode(
+                                        "head-argument5", x, y, annotations=_A0
+                                    )
+                        x = P[left + 12]
+                        if x:
+                            y = P[right + 38]
+                            if y:
+                                old = P[cell + 37]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 37] = CykNode(
+                                        "head-argument7", x, y, annotations=_A0
+                                    )
+                        x = P[left + 24]
+                        if x:
+                            y = P[right + 14]
+                            if y:
+                                old = P[cell + 38]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 38] = CykNode(
+                                        "head-argument8", x, y, annotations=_A0
+                                    )
+                        x = P[left + 12]
+                        if x:
+                            y = P[right + 40]
+                            if y:
+                                old = P[cell + 39]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 39] = CykNode(
+                                        "head-argument10", x, y, annotations=_A0
+                                    )
+                        x = P[left + 24]
+                        if x:
+                            y = P[right + 41]
+                            if y:
+                                old = P[cell + 40]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 40] = CykNode(
+                                        "head-argument11", x, y, annotations=_A0
+                                    )
+                        x = P[left + 14]
+                        if x:
+                            y = P[right + 18]
+                            if y:
+                                old = P[cell + 41]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 41] = CykNode(
+                                        "head-argument12", x, y, annotations=_A0
+                                    )
+                        x = P[left + 12]
+                        if x:
+                            y = P[right + 43]
+                            if y:
+                                old = P[cell + 42]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 42] = CykNode(
+                                        "head-argument14", x, y, annotations=_A0
+                                    )
+                        x = P[left + 14]
+                        if x:
+                            y = P[right + 18]
+                            if y:
+                                old = P[cell + 43]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 43] = CykNode(
+                                        "head-argument15", x, y, annotations=_A0
+                                    )
+                        x = P[left + 18]
+                        if x:
+                            y = P[right + 5]
+                            if y:
+                                old = P[cell + 44]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 44] = CykNode(
+                                        "item-body0", x, y, annotations=_A0
+                                    )
+                            y = P[right + 46]
+                            if y:
+                                old = P[cell + 45]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 45] = CykNode(
+                                        "item-body1", x, y, annotations=_A0
+                                    )
+                        x = P[left + 5]
+                        if x:
+                            y = P[right + 18]
+                            if y:
+                                old = P[cell + 46]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 46] = CykNode(
+                                        "item-body2", x, y, annotations=_A0
+                                    )
+                        x = P[left + 18]
+                        if x:
+                            y = P[right + 6]
+                            if y:
+                                old = P[cell + 47]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 47] = CykNode(
+                                        "item-body4", x, y, annotations=_A0
+                                    )
+                            y = P[right + 49]
+                            if y:
+                                old = P[cell + 48]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 48] = CykNode(
+                                        "item-body6", x, y, annotations=_A0
+                                    )
+                        x = P[left + 6]
+                        if x:
+                            y = P[right + 18]
+                            if y:
+                                old = P[cell + 49]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 49] = CykNode(
+                                        "item-body7", x, y, annotations=_A0
+                                    )
+                        x = P[left + 7]
+                        if x:
+                            y = P[right + 51]
+                            if y:
+                                old = P[cell + 50]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 50] = CykNode(
+                                        "paragraph-indented-two0", x, y, annotations=_A0
+                                    )
+                        x = P[left + 18]
+                        if x:
+                            y = P[right + 5]
+                            if y:
+                                old = P[cell + 51]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 51] = CykNode(
+                                        "paragraph-indented-two1", x, y, annotations=_A0
+                                    )
+                        x = P[left + 7]
+                        if x:
+                            y = P[right + 53]
+                            if y:
+                                old = P[cell + 52]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 52] = CykNode(
+                                        "paragraph0", x, y, annotations=_A0
+                                    )
+                        x = P[left + 18]
+                        if x:
+                            y = P[right + 6]
+                            if y:
+                                old = P[cell + 53]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 53] = CykNode(
+                                        "paragraph1", x, y, annotations=_A0
+                                    )
+                            y = P[right + 6]
+                            if y:
+                                old = P[cell + 54]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 54] = CykNode(
+                                        "paragraph2", x, y, annotations=_A0
+                                    )
+                        x = P[left + 16]
+                        if x:
+                            y = P[right + 9]
+                            if y:
+                                old = P[cell + 55]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 55] = CykNode(
+                                        "indented-two0", x, y, annotations=_A0
+                                    )
+                        x = P[left + 14]
+                        if x:
+                            y = P[right + 23]
+                            if y:
+                                old = P[cell + 56]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 56] = CykNode(
+                                        "noqa-statement1", x, y, annotations=_A0
+                                    )
+                        x = P[left + 25]
+                        if x:
+                            y = P[right + 19]
+                            if y:
+                                old = P[cell + 57]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 57] = CykNode(
+                                        "type-section-parens0", x, y, annotations=_A0
+                                    )
+                        x = P[left + 18]
+                        if x:
+                            y = P[right + 59]
+                            if y:
+                                old = P[cell + 58]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 58] = CykNode(
+                                        "type-words-colon0", x, y, annotations=_A0
+                                    )
+                        x = P[left + 9]
+                        if x:
+                            y = P[right + 25]
+                            if y:
+                                old = P[cell + 59]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 59] = CykNode(
+                                        "type-words-colon1", x, y, annotations=_A0
+                                    )
+                        x = P[left + 16]
+                        if x:
+                            y = P[right + 9]
+                            if y:
+                                old = P[cell + 59]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 59] = CykNode(
+                                        "type-words-colon1", x, y, annotations=_A0
+                                    )
+                        x = P[left + 26]
+                        if x:
+                            y = P[right + 25]
+                            if y:
+                                old = P[cell + 59]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 59] = CykNode(
+                                        "type-words-colon1", x, y, annotations=_A0
+                                    )
+                            y = P[right + 58]
+                            if y:
+                                old = P[cell + 59]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 59] = CykNode(
+                                        "type-words-colon1", x, y, annotations=_A0
+                                    )
+                        x = P[left + 28]
+                        if x:
+                            y = P[right + 27]
+                            if y:
+                                old = P[cell + 59]
+                                if old is None or old.weight <= 0:
+                                    P[cell + 59] = CykNode(
+                                        "type-words-colon1", x, y, annotations=_A10
+                                    )
+            return P[row[n] * 60]
+        finally:
+            arena.release(size)
+            return_arena(arena)
+
+
+_A0: List[Any] = []
+_A1: List[Any] = [ArgumentItemIdentifier]
+_A2: List[Any] = [ArgumentIdentifier, EmptyDescriptionError]
+_A3: List[Any] = [ArgumentIdentifier, EmptyTypeError, EmptyDescriptionError]
+_A4: List[Any] = [ArgumentIdentifier, ArgumentTypeIdentifier, EmptyDescriptionError]
+_A5: List[Any] = [ArgumentIdentifier]
+_A6: List[Any] = [ArgumentIdentifier, EmptyTypeError]
+_A7: List[Any] = [ArgumentIdentifier, ArgumentTypeIdentifier]
+_A8: List[Any] = [NoqaIdentifier]
+_A9: List[Any] = [IndentError]
+_A10: List[Any] = [ParameterMalformedError]
+
+_TERMINALS = {
+    TokenType.INDENT: (
+        (4, "item-body", 2),
+        (6, "paragraph", 0),
+        (7, "line", 0),
+        (9, "indents", 0),
+        (11, "word", 0),
+        (16, "indent", 0),
+        (23, "words", 0),
+        (25, "type-words-colon", 0),
+        (26, "type-word-colon", 0),
+        (55, "indented-two0", 0),
+        (59, "type-words-colon1", 0),
+    ),
+    TokenType.COLON: (
+        (4, "item-body", 2),
+        (6, "paragraph", 0),
+        (7, "line", 0),
+        (11, "word", 0),
+        (14, "colon", 0),
+        (23, "words", 0),
+        (25, "type-words-colon", 0),
+        (26, "type-word-colon", 0),
+        (59, "type-words-colon1", 0),
+    ),
+    TokenType.HASH: (
+        (4, "item-body", 2),
+        (6, "paragraph", 0),
+        (7, "line", 0),
+        (11, "word", 0),
+        (15, "hash", 0),
+        (23, "words", 0),
+    ),
+    TokenType.LPAREN: (
+        (4, "item-body", 2),
+        (6, "paragraph", 0),
+        (7, "line", 0),
+        (11, "word", 0),
+        (17, "lparen", 0),
+        (23, "words", 0),
+        (25, "type-words-colon", 0),
+        (27, "malformed-type-words", 0),
+        (28, "malformed-type-word", 0),
+        (59, "type-words-colon1", 0),
+    ),
+    TokenType.RPAREN: (
+        (4, "item-body", 2),
+        (6, "paragraph", 0),
+        (7, "line", 0),
+        (11, "word", 0),
+        (19, "rparen", 0),
+        (23, "words", 0),
+        (25, "type-words-colon", 0),
+        (27, "malformed-type-words", 0),
+        (28, "malformed-type-word", 0),
+        (57, "type-section-parens0", 0),
+        (59, "type-words-colon1", 0),
+    ),
+    TokenType.WORD: (
+        (4, "item-body", 2),
+        (6, "paragraph", 0),
+        (7, "line", 0),
+        (11, "word", 0),
+        (12, "ident", 0),
+        (23, "words", 0),
+        (25, "type-words-colon", 0),
+        (26, "type-word-colon", 0),
+        (27, "malformed-type-words", 0),
+        (28, "malformed-type-word", 0),
+        (59, "type-words-colon1", 0),
+    ),
+    TokenType.RAISES: (
+        (4, "item-body", 2),
+        (6, "paragraph", 0),
+        (7, "line", 0),
+        (11, "word", 0),
+        (12, "ident", 0),
+        (23, "words", 0),
+        (25, "type-words-colon", 0),
+        (26, "type-word-colon", 0),
+        (27, "malformed-type-words", 0),
+        (28, "malformed-type-word", 0),
+        (59, "type-words-colon1", 0),
+    ),
+    TokenType.ARGUMENTS: (
+        (4, "item-body", 2),
+        (6, "paragraph", 0),
+        (7, "line", 0),
+        (11, "word", 0),
+        (12, "ident", 0),
+        (13, "arguments", 0),
+        (23, "words", 0),
+        (25, "type-words-colon", 0),
+        (26, "type-word-colon", 0),
+        (27, "malformed-type-words", 0),
+        (28, "malformed-type-word", 0),
+        (59, "type-words-colon1", 0),
+    ),
+    TokenType.ARGUMENT_TYPE: (
+        (4, "item-body", 2),
+        (6, "paragraph", 0),
+        (7, "line", 0),
+        (11, "word", 0),
+        (12, "ident", 0),
+        (23, "words", 0),
+        (25, "type-words-colon", 0),
+        (26, "type-word-colon", 0),
+        (27, "malformed-type-words", 0),
+        (28, "malformed-type-word", 0),
+        (59, "type-words-colon1", 0),
+    ),
+    TokenType.RETURNS: (
+        (4, "item-body", 2),
+        (6, "paragraph", 0),
+        (7, "line", 0),
+        (11, "word", 0),
+        (12, "ident", 0),
+        (23, "words", 0),
+        (25, "type-words-colon", 0),
+        (26, "type-word-colon", 0),
+        (27, "malformed-type-words", 0),
+        (28, "malformed-type-word", 0),
+        (59, "type-words-colon1", 0),
+    ),
+    TokenType.RETURN_TYPE: (
+        (4, "item-body", 2),
+        (6, "paragraph", 0),
+        (7, "line", 0),
+        (11, "word", 0),
+        (12, "ident", 0),
+        (23, "words", 0),
+        (25, "type-words-colon", 0),
+        (26, "type-word-colon", 0),
+        (27, "malformed-type-words", 0),
+        (28, "malformed-type-word", 0),
+        (59, "type-words-colon1", 0),
+    ),
+    TokenType.YIELDS: (
+        (4, "item-body", 2),
+        (6, "paragraph", 0),
+        (7, "line", 0),
+        (11, "word", 0),
+        (12, "ident", 0),
+        (23, "words", 0),
+        (25, "type-words-colon", 0),
+        (26, "type-word-colon", 0),
+        (27, "malformed-type-words", 0),
+        (28, "malformed-type-word", 0),
+        (59, "type-words-colon1", 0),
+    ),
+    TokenType.YIELD_TYPE: (
+        (4, "item-body", 2),
+        (6, "paragraph", 0),
+        (7, "line", 0),
+        (11, "word", 0),
+        (12, "ident", 0),
+        (23, "words", 0),
+        (25, "type-words-colon", 0),
+        (26, "type-word-colon", 0),
+        (27, "malformed-type-words", 0),
+        (28, "malformed-type-word", 0),
+        (59, "type-words-colon1", 0),
+    ),
+    TokenType.VARIABLES: (
+        (4, "item-body", 2),
+        (6, "paragraph", 0),
+        (7, "line", 0),
+        (11, "word", 0),
+        (12, "ident", 0),
+        (23, "words", 0),
+        (25, "type-words-colon", 0),
+        (26, "type-word-colon", 0),
+        (27, "malformed-type-words", 0),
+        (28, "malformed-type-word", 0),
+        (59, "type-words-colon1", 0),
+    ),
+    TokenType.VARIABLE_TYPE: (
+        (4, "item-body", 2),
+        (6, "paragraph", 0),
+        (7, "line", 0),
+        (11, "word", 0),
+        (12, "ident", 0),
+        (23, "words", 0),
+        (25, "type-words-colon", 0),
+        (26, "type-word-colon", 0),
+        (27, "malformed-type-words", 0),
+        (28, "malformed-type-word", 0),
+        (59, "type-words-colon1", 0),
+    ),
+    TokenType.NOQA: (
+        (4, "item-body", 2),
+        (6, "paragraph", 0),
+        (7, "line", 0),
+        (11, "word", 0),
+        (12, "ident", 0),
+        (20, "noqa", 0),
+        (23, "words", 0),
+        (25, "type-words-colon", 0),
+        (26, "type-word-colon", 0),
+        (27, "malformed-type-words", 0),
+        (28, "malformed-type-word", 0),
+        (59, "type-words-colon1", 0),
+    ),
+    TokenType.OTHER: (
+        (4, "item-body", 2),
+        (6, "paragraph", 0),
+        (7, "line", 0),
+        (11, "word", 0),
+        (12, "ident", 0),
+        (23, "words", 0),
+        (25, "type-words-colon", 0),
+        (26, "type-word-colon", 0),
+        (27, "malformed-type-words", 0),
+        (28, "malformed-type-word", 0),
+        (59, "type-words-colon1", 0),
+    ),
+    TokenType.RECEIVES: (
+        (4, "item-body", 2),
+        (6, "paragraph", 0),
+        (7, "line", 0),
+        (11, "word", 0),
+        (12, "ident", 0),
+        (23, "words", 0),
+        (25, "type-words-colon", 0),
+        (26, "type-word-colon", 0),
+        (27, "malformed-type-words", 0),
+        (28, "malformed-type-word", 0),
+        (59, "type-words-colon1", 0),
+    ),
+    TokenType.WARNS: (
+        (4, "item-body", 2),
+        (6, "paragraph", 0),
+        (7, "line", 0),
+        (11, "word", 0),
+        (12, "ident", 0),
+        (23, "words", 0),
+        (25, "type-words-colon", 0),
+        (26, "type-word-colon", 0),
+        (27, "malformed-type-words", 0),
+        (28, "malformed-type-word", 0),
+        (59, "type-words-colon1", 0),
+    ),
+    TokenType.SEE: (
+        (4, "item-body", 2),
+        (6, "paragraph", 0),
+        (7, "line", 0),
+        (11, "word", 0),
+        (12, "ident", 0),
+        (23, "words", 0),
+        (25, "type-words-colon", 0),
+        (26, "type-word-colon", 0),
+        (27, "malformed-type-words", 0),
+        (28, "malformed-type-word", 0),
+        (59, "type-words-colon1", 0),
+    ),
+    TokenType.ALSO: (
+        (4, "item-body", 2),
+        (6, "paragraph", 0),
+        (7, "line", 0),
+        (11, "word", 0),
+        (12, "ident", 0),
+        (23, "words", 0),
+        (25, "type-words-colon", 0),
+        (26, "type-word-colon", 0),
+        (27, "malformed-type-words", 0),
+        (28, "malformed-type-word", 0),
+        (59, "type-words-colon1", 0),
+    ),
+    TokenType.NOTES: (
+        (4, "item-body", 2),
+        (6, "paragraph", 0),
+        (7, "line", 0),
+        (11, "word", 0),
+        (12, "ident", 0),
+        (23, "words", 0),
+        (25, "type-words-colon", 0),
+        (26, "type-word-colon", 0),
+        (27, "malformed-type-words", 0),
+        (28, "malformed-type-word", 0),
+        (59, "type-words-colon1", 0),
+    ),
+    TokenType.EXAMPLES: (
+        (4, "item-body", 2),
+        (6, "paragraph", 0),
+        (7, "line", 0),
+        (11, "word", 0),
+        (12, "ident", 0),
+        (23, "words", 0),
+        (25, "type-words-colon", 0),
+        (26, "type-word-colon", 0),
+        (27, "malformed-type-words", 0),
+        (28, "malformed-type-word", 0),
+        (59, "type-words-colon1", 0),
+    ),
+    TokenType.REFERENCES: (
+        (4, "item-body", 2),
+        (6, "paragraph", 0),
+        (7, "line", 0),
+        (11, "word", 0),
+        (12, "ident", 0),
+        (23, "words", 0),
+        (25, "type-words-colon", 0),
+        (26, "type-word-colon", 0),
+        (27, "malformed-type-words", 0),
+        (28, "malformed-type-word", 0),
+        (59, "type-words-colon1", 0),
+    ),
+    TokenType.HEADER: (
+        (4, "item-body", 2),
+        (6, "paragraph", 0),
+        (7, "line", 0),
+        (11, "word", 0),
+        (23, "words", 0),
+    ),
+    TokenType.NEWLINE: (
+        (10, "newlines", 0),
+        (18, "newline", 0),
+        (58, "type-words-colon0", 0),
+    ),
+}
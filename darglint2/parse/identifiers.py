@@ -1,10 +1,43 @@
 import abc
-from typing import Callable, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from ..custom_assert import Assert
 from ..token import TokenType
 from .cyk import CykNode
 
+# The result of following a path: the value of a token, a node, or
+# None if the path couldn't be followed.
+Extraction = Union[str, CykNode, None]
+
+
+def _always(_: CykNode) -> bool:
+    return True
+
+
+def _has_left(node: CykNode) -> bool:
+    return bool(node.lchild)
+
+
+def _has_right(node: CykNode) -> bool:
+    return bool(node.rchild)
+
+
+# The conditions which are compiled to an attribute access, rather
+# than a call.
+_INLINE_CONDITIONS: Dict[Callable[[CykNode], bool], str] = {
+    _has_left: "node.lchild",
+    _has_right: "node.rchild",
+}
+
+
+def _unexpected(value: Any, expected: str) -> None:
+    Assert(
+        False,
+        "Expected path extraction to yield {} but was {}".format(
+            expected, value.__class__.__name__
+        ),
+    )
+
 
 class Continuation(object):
     """Represents a continuation of a path.
@@ -35,7 +68,7 @@ class Continuation(object):
         if isinstance(self.child, Continuation):
             self.child.of(path)
         elif self.child is None:
-            self.child = Continuation(path, lambda _: True, None)
+            self.child = Continuation(path, _always, None)
         return self
 
     def branch(self, *continuations: "Continuation") -> "Continuation":
@@ -115,6 +148,78 @@ class Continuation(object):
                 return None
         return curr
 
+    def compile(self) -> Callable[[CykNode], Extraction]:
+        """Compile the path into a function.
+
+        The function follows the path with direct attribute access,
+        and gives the same result as `extract`.  Since continuations
+        can be extended, it should only be compiled once the path is
+        complete.
+
+        Returns:
+            A function which extracts the value at the end of this
+            path from the given node.
+
+        """
+        namespace: Dict[str, Any] = {
+            "CykNode": CykNode,
+            "_unexpected": _unexpected,
+            "condition": self.condition,
+        }
+        lines = ["def extract(node):"]
+        if self.condition in _INLINE_CONDITIONS:
+            lines.append("    if not {}:".format(_INLINE_CONDITIONS[self.condition]))
+            lines.append("        return None")
+        elif self.condition is not _always:
+            lines.append("    if not condition(node):")
+            lines.append("        return None")
+        lines.append("    curr = node")
+        for letter in self.path:
+            if letter == "r":
+                lines.append("    curr = curr.rchild")
+            elif letter == "l":
+                lines.append("    curr = curr.lchild")
+            elif letter == "v":
+                lines.append("    if not curr.value:")
+                lines.append("        return None")
+                lines.append("    return curr.value.value")
+                break
+            else:
+                lines.append("    return None")
+                break
+            lines.append("    if not curr:")
+            lines.append("        return None")
+        else:
+            if isinstance(self.child, tuple):
+                for i, branch in enumerate(self.child):
+                    namespace["branch{}".format(i)] = branch.compile()
+                    lines.extend(
+                        [
+                            "    value = branch{}(curr)".format(i),
+                            "    if value is not None:",
+                            "        if isinstance(value, (str, CykNode)):",
+                            "            return value",
+                            "        _unexpected(value, 'str or None or CykNode')",
+                            "        return None",
+                        ]
+                    )
+                lines.append("    return None")
+            elif isinstance(self.child, Continuation):
+                namespace["child"] = self.child.compile()
+                lines.extend(
+                    [
+                        "    value = child(curr)",
+                        "    if value is None or isinstance(value, str):",
+                        "        return value",
+                        "    _unexpected(value, 'str or None')",
+                        "    return None",
+                    ]
+                )
+            else:
+                lines.append("    return curr")
+        exec("\n".join(lines), namespace)
+        return namespace["extract"]
+
 
 class Path(object):
     """Represents a path which can be taken in a parse tree.
@@ -143,7 +248,7 @@ class Path(object):
             A continuation of the path.
 
         """
-        return Continuation(path, lambda _: True)
+        return Continuation(path, _always)
 
     @staticmethod
     def branch(*paths: Continuation) -> Continuation:
@@ -156,18 +261,18 @@ class Path(object):
             A continuation representing the path.
 
         """
-        return Continuation("", lambda _: True, paths)
+        return Continuation("", _always, paths)
 
     # These methods are technically unnecessary -- they are
     # synonymous with an `of`.  However, it makes for nicer
     # documentation of intent, I think.
     @staticmethod
     def if_left(path: str) -> Continuation:
-        return Continuation(path, lambda x: bool(x.lchild))
+        return Continuation(path, _has_left)
 
     @staticmethod
     def if_right(path: str) -> Continuation:
-        return Continuation(path, lambda x: bool(x.rchild))
+        return Continuation(path, _has_right)
 
 
 class Identifier(abc.ABC):
@@ -192,12 +297,21 @@ class Identifier(abc.ABC):
     def path() -> Continuation:
         pass
 
+    # The path, compiled when the subclass is created.
+    _extract_path: Callable[[CykNode], Extraction]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        path = cls.__dict__.get("path")
+        if isinstance(path, Continuation):
+            cls._extract_path = staticmethod(path.compile())  # type: ignore
+
     @classmethod
     def extract(cls, node: CykNode) -> str:
         # TODO: Fix the type annotation here.
-        value = cls.path.extract(node)  # type: ignore
+        value = cls._extract_path(node)
         Assert(value is not None, "Failed to extract {}".format(cls.key))
-        return value or ""
+        return value or ""  # type: ignore
 
     def __str__(self):
         return "<identifier: {}>".format(self.key)
@@ -226,7 +340,7 @@ class ArgumentTypeIdentifier(Identifier):
 
     @staticmethod
     def extract(node: CykNode) -> str:
-        value = ArgumentTypeIdentifier.path.extract(node)
+        value = ArgumentTypeIdentifier._extract_path(node)
         is_leaf = isinstance(value, str)
         is_branch = isinstance(value, CykNode)
         Assert(is_leaf or is_branch, "Unable to extract argument type.")
@@ -262,11 +376,14 @@ class NoqaIdentifier(Identifier):
     key = "id_Noqa"
     path = Path.of("rr").branch(Path.of("v"), Path.if_left("lv"))
 
+    _extract_value = staticmethod(
+        Path.branch(Path.of("rrv"), Path.of("rrlv")).compile()
+    )
+
     @staticmethod
     def extract(node: CykNode) -> str:
         if node.rchild and node.rchild.rchild:
-            path = Path.branch(Path.of("rrv"), Path.of("rrlv"))
-            value = path.extract(node)
+            value = NoqaIdentifier._extract_value(node)
             if isinstance(value, str):
                 return value
             # path2 = Path.of('rrlv')
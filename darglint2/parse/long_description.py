@@ -1,151 +1,154 @@
-from functools import reduce
-from typing import List, Optional
+"""A parser for long descriptions.
 
-from ..node import CykNode
-from ..peaker import Peaker
-from ..token import Token, TokenType
-from .identifiers import NoqaIdentifier
+The long description is the fallback for any section which doesn't
+match a grammar, so it can be long (the Notes or Examples of a
+narrative docstring), and it's parsed often.  It's parsed in one
+pass over the tokens, by index: each token is either the start of
+a noqa statement, or a word of the description.
 
+The tree is a chain down the right, with a node for each word:
 
-def _is(peaker: Peaker[Token], token_type: Optional[TokenType], index: int = 1) -> bool:
-    try:
-        token = peaker.peak(lookahead=index)
-    except IndexError:
-        token = None
-    if not token_type and not token:
-        return True
-    return bool(token and token.token_type == token_type)
+    long-description
+      long-description1: word
+      long-description1
+        long-description1: word
+        long-description1
+          ...
 
+A noqa statement is put on the left of the node for the preceding
+word (or at the top, if it comes first), so that it's never beneath
+a long-description node.
 
-def _are(peaker: Peaker[Token], *token_types: Optional[TokenType]) -> bool:
-    return all(
-        [_is(peaker, token_type, i + 1) for i, token_type in enumerate(token_types)]
-    )
+"""
 
+from typing import List, Optional, Tuple
 
-def _parse_noqa_head(peaker: Peaker[Token]) -> Optional[CykNode]:
-    if not (
-        _are(peaker, TokenType.HASH, TokenType.NOQA, TokenType.NEWLINE)
-        or _are(peaker, TokenType.HASH, TokenType.NOQA, None)
-    ):
-        return None
-    noqa_hash = CykNode("hash", value=peaker.next())
-    noqa = CykNode("noqa", value=peaker.next())
-    if _is(peaker, TokenType.NEWLINE):
-        peaker.next()
-    return CykNode(
-        "noqa",
-        lchild=noqa_hash,
-        rchild=noqa,
-        annotations=[
-            NoqaIdentifier,
-        ],
-    )
-
-
-def _last_node(node: CykNode) -> CykNode:
-    curr = node
-    rchild = curr.rchild
-    while rchild:
-        curr = rchild
-        rchild = curr.rchild
-    return curr
-
+from ..node import CykNode
+from ..profiling import profiled
+from ..token import Token, TokenType
+from .identifiers import NoqaIdentifier
 
-def foldr(fun, xs, acc):
-    return reduce(lambda x, y: fun(y, x), xs[::-1], acc)
 
+def _parse_words(tokens: List[Token], start: int, end: int) -> CykNode:
+    """Parse the targets of a noqa statement.
 
-def _parse_words_until_newline_or_end(peaker):
-    if not peaker.has_next() or _is(peaker, TokenType.NEWLINE):
-        return None
-    words = [CykNode("word", value=peaker.next())]
-    while peaker.has_next() and not _is(peaker, TokenType.NEWLINE):
-        words.append(CykNode("word", value=peaker.next()))
+    Args:
+        tokens: The tokens in the description.
+        start: The index of the first target.
+        end: The index after the last target.  It must be
+            greater than `start`.
 
-    if len(words) == 1:
-        head = words[0]
-        head.symbol = "words"
-        return head
+    Returns:
+        The words, as a chain down the right.
 
-    def join(x, y):
-        return CykNode(
+    """
+    acc = CykNode("words", value=tokens[end - 1])
+    for i in range(end - 2, start - 1, -1):
+        acc = CykNode(
             "words",
-            lchild=x,
-            rchild=y,
+            lchild=CykNode("word", value=tokens[i]),
+            rchild=acc,
         )
+    return acc
 
-    acc = words.pop()
-    acc.symbol = "words"
 
-    return foldr(join, words, acc)
+def _parse_noqa(tokens: List[Token], i: int) -> Tuple[Optional[CykNode], int]:
+    """Parse a noqa statement starting at the given index.
 
+    A noqa statement is either bare (`# noqa`, at the end of a line),
+    or has targets (`# noqa: X Y`, up to the end of the line.)
 
-def _parse_noqa(peaker: Peaker[Token]) -> Optional[CykNode]:
+    Args:
+        tokens: The tokens in the description.
+        i: The index to parse the statement from.
+
+    Returns:
+        The noqa statement, and the index after it.  If there
+        isn't a noqa statement at the index, None and the index.
+
+    """
+    n = len(tokens)
     if not (
-        _are(peaker, TokenType.HASH, TokenType.NOQA, TokenType.COLON, TokenType.WORD)
+        i + 1 < n
+        and tokens[i].token_type == TokenType.HASH
+        and tokens[i + 1].token_type == TokenType.NOQA
     ):
-        return None
-    noqa_hash = CykNode("hash", value=peaker.next())
-    noqa = CykNode("noqa", value=peaker.next())
-    colon = CykNode("colon", value=peaker.next())
-    targets = _parse_words_until_newline_or_end(peaker)
-    head = CykNode(
+        return None, i
+    noqa_hash = CykNode("hash", value=tokens[i])
+    noqa = CykNode("noqa", value=tokens[i + 1])
+    if (
+        i + 3 < n
+        and tokens[i + 2].token_type == TokenType.COLON
+        and tokens[i + 3].token_type == TokenType.WORD
+    ):
+        end = i + 4
+        while end < n and tokens[end].token_type != TokenType.NEWLINE:
+            end += 1
+        statement = CykNode(
+            "noqa",
+            lchild=CykNode(
+                "noqa-head",
+                lchild=noqa_hash,
+                rchild=noqa,
+            ),
+            rchild=CykNode(
+                "noqa-statement1",
+                lchild=CykNode("colon", value=tokens[i + 2]),
+                rchild=_parse_words(tokens, i + 3, end),
+            ),
+            annotations=[
+                NoqaIdentifier,
+            ],
+        )
+        return statement, end
+    if i + 2 == n:
+        end = n
+    elif tokens[i + 2].token_type == TokenType.NEWLINE:
+        # The newline is consumed by the statement.
+        end = i + 3
+    else:
+        return None, i
+    statement = CykNode(
         "noqa",
-        lchild=CykNode(
-            "noqa-head",
-            lchild=noqa_hash,
-            rchild=noqa,
-        ),
-        rchild=CykNode(
-            "noqa-statement1",
-            lchild=colon,
-            rchild=targets,
-        ),
+        lchild=noqa_hash,
+        rchild=noqa,
         annotations=[
             NoqaIdentifier,
         ],
     )
-    return head
+    return statement, end
 
 
-def _parse_long_description(peaker: Peaker[Token]) -> Optional[CykNode]:
-    if not peaker.has_next():
+@profiled("long_description")
+def parse(tokens: List[Token]) -> Optional[CykNode]:
+    if not tokens:
         return None
-    head = _parse_noqa(peaker) or _parse_noqa_head(peaker)
-    if head:
-        new_head = CykNode(
-            "long-description",
-            lchild=head,
-        )
-        head = new_head
+    n = len(tokens)
+    statement, i = _parse_noqa(tokens, 0)
+    if statement:
+        head = CykNode("long-description", lchild=statement)
     else:
         head = CykNode(
-            symbol="long-description",
-            lchild=CykNode("long-description1", value=peaker.next()),
+            "long-description",
+            lchild=CykNode("long-description1", value=tokens[0]),
         )
-    curr = _last_node(head)
-    while peaker.has_next():
-        noqa = _parse_noqa(peaker) or _parse_noqa_head(peaker)
-        if not noqa:  # curr.rchild:
-            curr.rchild = CykNode(
-                symbol="long-description1",
-                lchild=CykNode("long-description1", value=peaker.next()),
+        i = 1
+
+    # The last node in the chain, which the next word is added to.
+    tail = head
+    while i < n:
+        statement, i = _parse_noqa(tokens, i)
+        if statement:
+            tail.lchild = CykNode(
+                "long-description1",
+                lchild=tail.lchild,
+                rchild=statement,
             )
         else:
-            old_left = curr.lchild
-            curr.lchild = CykNode(
-                symbol="long-description1",
-                lchild=old_left,
-                rchild=noqa,
+            tail.rchild = CykNode(
+                "long-description1",
+                lchild=CykNode("long-description1", value=tokens[i]),
             )
-        curr = _last_node(curr)
+            tail = tail.rchild
+            i += 1
     return head
-
-
-def parse(tokens: List[Token]) -> Optional[CykNode]:
-    peaker = Peaker((x for x in tokens), lookahead=5)
-    if not peaker.has_next():
-        return None
-
-    return _parse_long_description(peaker)
@@ -0,0 +1,281 @@
+"""The order in which to try the parsers for a section.
+
+A section's parsers are tried in a fixed order (see each style's
+`lookup`), and the first to succeed builds its tree.  When the
+first parser usually fails in a project, every section pays for a
+failed parse first.  So the outcome of each parser is counted, and
+the parser which most often succeeds is tried first -- but only
+where that can't change the result.
+
+A parser can be tried ahead of its turn if it's a grammar whose
+language is disjoint from that of every parser it jumps over: if it
+succeeds, they would all have failed, and it would have been the
+first to succeed anyway.  If it fails, the rest are tried as before.
+Languages of context free grammars can't be compared in general, so
+a simple, sufficient test is used: one of the grammars requires a
+token type which the other can never produce.  (For example, a
+short description never has a newline, but every section after
+it does.)  Parsers which aren't grammars are never moved.
+
+The counts are kept for the run, and can be saved to (and loaded
+from) a file, so that the next run starts with them.  The file also
+holds the number of docstrings the `auto` style detected in each
+style.
+
+"""
+
+import inspect
+import json
+import threading
+from collections import defaultdict
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Sequence, Set, Tuple
+
+from ..token import TokenType
+from .grammar import BaseGrammar
+
+# The key of the styles' counts in the saved statistics.  (The
+# other keys name parsers, so they can't be confused with it.)
+_STYLES_KEY = "styles"
+
+# The types of token which appear in a section.
+_ALL_TOKEN_TYPES = frozenset(TokenType)
+
+
+def _is_grammar(parser: Any) -> bool:
+    return inspect.isclass(parser) and issubclass(parser, BaseGrammar)
+
+
+def _get_name(parser: Any) -> str:
+    return "{}.{}".format(parser.__module__, parser.__qualname__)
+
+
+@lru_cache(maxsize=None)
+def _get_key(parsers: Tuple[Any, ...], parser: Any) -> str:
+    return "{} ({})".format(_get_name(parser), ", ".join(_get_name(x) for x in parsers))
+
+
+@lru_cache(maxsize=None)
+def get_alphabet(grammar: BaseGrammar) -> FrozenSet[TokenType]:
+    """Get the types of token which can appear in the grammar's sections.
+
+    Args:
+        grammar: The grammar, in CNF.
+
+    Returns:
+        The token types of the terminals reachable from the
+        grammar's start symbol.
+
+    """
+    productions = {x.lhs: x for x in grammar.productions}
+    alphabet: Set[TokenType] = set()
+    seen = {grammar.start}
+    stack = [grammar.start]
+    while stack:
+        production = productions.get(stack.pop())
+        if production is None:
+            continue
+        for derivation in production.rhs:
+            if len(derivation) == 2:
+                alphabet.add(derivation[0])
+                continue
+            for symbol in derivation[1:3]:
+                if symbol not in seen:
+                    seen.add(symbol)
+                    stack.append(symbol)
+    return frozenset(alphabet)
+
+
+@lru_cache(maxsize=None)
+def get_required(grammar: BaseGrammar) -> FrozenSet[TokenType]:
+    """Get the types of token which appear in all of the grammar's sections.
+
+    Args:
+        grammar: The grammar, in CNF.
+
+    Returns:
+        The token types which every section the grammar matches
+        has.  (Computed as the greatest fixed point of the
+        intersection, over a symbol's derivations, of the types
+        required by each.)
+
+    """
+    required: Dict[str, FrozenSet[TokenType]] = defaultdict(lambda: _ALL_TOKEN_TYPES)
+    changed = True
+    while changed:
+        changed = False
+        for production in grammar.productions:
+            current = _ALL_TOKEN_TYPES
+            for derivation in production.rhs:
+                if len(derivation) == 2:
+                    current = current & {derivation[0]}
+                else:
+                    current = current & (
+                        required[derivation[1]] | required[derivation[2]]
+                    )
+            if current != required[production.lhs]:
+                required[production.lhs] = current
+                changed = True
+    return required[grammar.start]
+
+
+@lru_cache(maxsize=None)
+def are_disjoint(a: BaseGrammar, b: BaseGrammar) -> bool:
+    """Tell whether no section can be matched by both grammars.
+
+    Args:
+        a: A grammar.
+        b: Another grammar.
+
+    Returns:
+        True if one of the grammars requires a type of token which
+        the other never has.  False if that can't be shown (even
+        if they are, in fact, disjoint.)
+
+    """
+    return bool(get_required(a) - get_alphabet(b)) or bool(
+        get_required(b) - get_alphabet(a)
+    )
+
+
+class GrammarStatistics(object):
+    """The number of times each parser succeeded, for each section.
+
+    Sections are told apart by their parsers in the fixed order,
+    which are decided by the section's keyword (and whether it's
+    the first section.)  The statistics are shared by the threads
+    checking docstrings, so they are guarded by a lock.
+
+    """
+
+    def __init__(self) -> None:
+        self._counts: Dict[str, List[int]] = dict()
+        self._styles: Dict[str, int] = dict()
+        self._lock = threading.Lock()
+
+    def record(self, parsers: Sequence[Any], parser: Any, succeeded: bool) -> None:
+        """Count the outcome of a parser.
+
+        Args:
+            parsers: The parsers for the section, in the fixed order.
+            parser: The parser which was tried.
+            succeeded: Whether it parsed the section.
+
+        """
+        key = _get_key(tuple(parsers), parser)
+        with self._lock:
+            counts = self._counts.setdefault(key, [0, 0])
+            counts[0] += succeeded
+            counts[1] += 1
+
+    def record_style(self, style: str) -> None:
+        """Count a docstring whose style was detected.
+
+        Args:
+            style: The name of the style it was detected as.
+
+        """
+        with self._lock:
+            self._styles[style] = self._styles.get(style, 0) + 1
+
+    def get_styles(self) -> Dict[str, int]:
+        """Get the number of docstrings detected in each style.
+
+        Returns:
+            The counts, by the name of the style.
+
+        """
+        with self._lock:
+            return dict(self._styles)
+
+    def get_rate(self, parsers: Sequence[Any], parser: Any) -> float:
+        """Estimate how likely the parser is to succeed.
+
+        Args:
+            parsers: The parsers for the section, in the fixed order.
+            parser: One of the parsers.
+
+        Returns:
+            The fraction of the times it succeeded, after adding
+            one success and one failure (so that a parser which
+            hasn't been tried is as likely to succeed as not.)
+
+        """
+        key = _get_key(tuple(parsers), parser)
+        successes, attempts = self._counts.get(key, (0, 0))
+        return (successes + 1) / (attempts + 2)
+
+    def order(self, parsers: Sequence[Any]) -> List[Any]:
+        """Order the parsers so the most likely to succeed come first.
+
+        Args:
+            parsers: The parsers for the section, in the fixed order.
+
+        Returns:
+            The parsers in the order to try them.  The first of them
+            to succeed is the first which would have in the fixed
+            order.  Ties keep the fixed order.
+
+        """
+        rates = [self.get_rate(parsers, x) for x in parsers]
+        remaining = list(range(len(parsers)))
+        ordered = list()
+        while remaining:
+            best = remaining[0]
+            for i in remaining[1:]:
+                if rates[i] <= rates[best]:
+                    continue
+                # It may only jump over parsers whose sections it
+                # can't match.
+                if all(
+                    _is_grammar(parsers[j])
+                    and _is_grammar(parsers[i])
+                    and are_disjoint(parsers[j], parsers[i])
+                    for j in remaining
+                    if j < i
+                ):
+                    best = i
+            remaining.remove(best)
+            ordered.append(parsers[best])
+        return ordered
+
+    def clear(self) -> None:
+        """Forget every count."""
+        with self._lock:
+            self._counts.clear()
+            self._styles.clear()
+
+    def load(self, filename: str) -> None:
+        """Add the counts saved in the file.
+
+        Args:
+            filename: The file written by `save`.
+
+        """
+        with open(filename) as fin:
+            saved = json.load(fin)
+        styles = saved.pop(_STYLES_KEY, dict())
+        with self._lock:
+            for style, count in styles.items():
+                self._styles[style] = self._styles.get(style, 0) + count
+            for key, (successes, attempts) in saved.items():
+                counts = self._counts.setdefault(key, [0, 0])
+                counts[0] += successes
+                counts[1] += attempts
+
+    def save(self, filename: str) -> None:
+        """Save the counts to the file.
+
+        Args:
+            filename: The file to write.
+
+        """
+        with self._lock:
+            counts: Dict[str, Any] = dict(self._counts)
+            if self._styles:
+                counts[_STYLES_KEY] = dict(self._styles)
+        with open(filename, "w") as fout:
+            json.dump(counts, fout, indent=2, sort_keys=True)
+
+
+grammar_statistics = GrammarStatistics()
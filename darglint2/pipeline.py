@@ -0,0 +1,614 @@
+"""A streaming pipeline for checking source files.
+
+Checking a file happens in stages: the files are discovered, read,
+parsed into an AST, the functions in the tree are analyzed, their
+docstrings are checked, and finally the report is rendered.  Each
+stage is a generator which consumes the previous stage, so only
+the files currently in flight are held in memory.  A file's tree
+and function descriptions are released as soon as its report has
+been rendered, rather than being kept until the end of the run.
+
+Stages can be decoupled with `bounded`, which runs the upstream
+stages in a background thread, holding at most a fixed number of
+items between the two.  That way, a slow stage (e.g. reading from
+disk) can run ahead of the others without the amount of memory
+in use growing with the number of files.
+
+Reading the files is handled by `read_ahead`, which prefetches the
+next few files on a small thread pool while the current one is
+being parsed and checked.  The number of bytes held in its buffers
+is capped, so a run of very large modules won't be read into
+memory all at once.
+
+Sources which are already in memory (say, snapshots of files under
+review) can be checked with `check_sources`, which skips reading
+and rendering, and yields a record for each error instead.
+
+"""
+
+import ast
+import collections
+import os
+import pathlib
+import queue
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import (
+    Deque,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from .config import ConfigResolver, Configuration, get_config
+from .error_report import ErrorReport
+from .errors import DarglintError, PythonSyntaxError
+from .function_description import (
+    FunctionDescription,
+    get_function_descriptions,
+    read_program,
+)
+from .integrity_checker import IntegrityChecker, get_analysis_passes
+from .profiling import get_profiler, timed
+
+T = TypeVar("T")
+
+# The default number of items which may be waiting between
+# two stages decoupled by `bounded`.
+DEFAULT_QUEUE_SIZE = 8
+
+# The number of threads used to read files ahead of the parser.
+DEFAULT_READ_WORKERS = 2
+
+# The maximum number of bytes which may be buffered by `read_ahead`
+# at any one time.  A single file larger than this is still read,
+# but nothing else is read ahead while it is buffered.
+DEFAULT_READ_AHEAD_BYTES = 16 * 1024 * 1024
+
+# Files of at least this size are read directly into a buffer
+# allocated up front, rather than being read in chunks which
+# are then joined.
+LARGE_FILE_SIZE = 1024 * 1024
+
+# The number of sources which may be waiting for each worker
+# process in `check_sources`.
+SOURCES_PER_JOB = 4
+
+Source = Tuple[str, Union[bytes, bytearray, str]]
+Module = Tuple[str, Union[ast.AST, SyntaxError]]
+Analyzed = Tuple[str, Union[List[FunctionDescription], SyntaxError]]
+
+
+def discover(paths: Iterable[str]) -> Iterator[str]:
+    """Yield the python files to check.
+
+    Args:
+        paths: The files and directories given by the user.
+            Directories are searched recursively for python files.
+
+    Yields:
+        The filenames of the python files to check.
+
+    """
+    for path in paths:
+        p = pathlib.Path(path)
+        if not p.is_dir() and p.suffix == ".py":
+            yield path
+        # Convert back to strings to not require modifications of any
+        # subsequent code.
+        for child in p.glob("**/*.py"):
+            yield str(child)
+
+
+def read(filenames: Iterable[str]) -> Iterator[Source]:
+    """Read the contents of each file.
+
+    Args:
+        filenames: The names of the files to read.
+
+    Yields:
+        The filename and the contents of the file.
+
+    """
+    for filename in filenames:
+        yield filename, read_program(filename)
+
+
+def _get_size(filename: str) -> int:
+    if filename == "-":
+        return 0
+    try:
+        return os.stat(filename).st_size
+    except OSError:
+        # Let the read itself report the error.
+        return 0
+
+
+def _read_file(filename: str, size: int) -> Union[bytes, bytearray, str]:
+    """Read the file, using a preallocated buffer for large files.
+
+    Args:
+        filename: The name of the file to read.
+        size: The size of the file, as given by `os.stat`.
+
+    Returns:
+        The contents of the file.
+
+    """
+    if filename == "-" or size < LARGE_FILE_SIZE:
+        return read_program(filename)
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    offset = 0
+    with open(filename, "rb", buffering=0) as fin:
+        while offset < size:
+            count = fin.readinto(view[offset:])
+            if not count:
+                break
+            offset += count
+        view.release()
+        if offset < size:
+            # The file shrank after it was measured.
+            del buffer[offset:]
+        else:
+            # Or it grew.
+            buffer.extend(fin.read())
+    return buffer
+
+
+def read_ahead(
+    filenames: Iterable[str],
+    max_files: int = DEFAULT_QUEUE_SIZE,
+    max_bytes: int = DEFAULT_READ_AHEAD_BYTES,
+    workers: int = DEFAULT_READ_WORKERS,
+) -> Iterator[Source]:
+    """Read the contents of each file, prefetching the next files.
+
+    Args:
+        filenames: The names of the files to read.
+        max_files: The maximum number of files which may be read
+            ahead of the file currently being consumed.
+        max_bytes: The maximum number of bytes which may be buffered,
+            including the file currently being consumed.  At least
+            one file is always read, regardless of its size.
+        workers: The number of threads reading files.
+
+    Yields:
+        The filename and the contents of the file, in the order
+        the filenames were given.
+
+    """
+    remaining = iter(filenames)
+    pending: Deque[
+        Tuple[str, int, "Future[Union[bytes, bytearray, str]]"]
+    ] = collections.deque()
+    buffered = 0
+    upcoming: Optional[Tuple[str, int]] = None
+    executor = ThreadPoolExecutor(max_workers=max(1, workers))
+    try:
+        while True:
+            while len(pending) < max(1, max_files):
+                if upcoming is None:
+                    filename = next(remaining, None)
+                    if filename is None:
+                        break
+                    upcoming = (filename, _get_size(filename))
+                filename, size = upcoming
+                if pending and buffered + size > max_bytes:
+                    break
+                pending.append(
+                    (filename, size, executor.submit(_read_file, filename, size))
+                )
+                buffered += size
+                upcoming = None
+            if not pending:
+                return
+            filename, size, future = pending.popleft()
+            program = future.result()
+            del future
+            yield filename, program
+            del program
+            buffered -= size
+    finally:
+        for _, _, future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+def parse(sources: Iterable[Source]) -> Iterator[Module]:
+    """Parse each program into an AST.
+
+    Args:
+        sources: The filenames and their contents.
+
+    Yields:
+        The filename, and either the module's tree or the
+        syntax error encountered while parsing it.
+
+    """
+    for filename, program in sources:
+        try:
+            with timed("ast.parse"):
+                tree: Union[ast.AST, SyntaxError] = ast.parse(program)
+        except SyntaxError as e:
+            tree = e
+        del program
+        yield filename, tree
+        del tree
+
+
+def _get_config(filename: str, configs: Optional[ConfigResolver]) -> Configuration:
+    if configs is None:
+        return get_config()
+    return configs.get_config(filename)
+
+
+def analyze(
+    modules: Iterable[Module], configs: Optional[ConfigResolver] = None
+) -> Iterator[Analyzed]:
+    """Describe the functions in each module.
+
+    Args:
+        modules: The filenames and their trees.
+        configs: The configuration of each file.  By default, every
+            file has the global configuration.
+
+    Yields:
+        The filename, and either the descriptions of the functions
+        in it, or the syntax error encountered while parsing it.
+
+    """
+    # The files with the same configuration share it, so the passes
+    # are only found once for each configuration.
+    passes_by_config: Dict[Configuration, FrozenSet[str]] = dict()
+    for filename, tree in modules:
+        if isinstance(tree, SyntaxError):
+            yield filename, tree
+            continue
+        config = _get_config(filename, configs)
+        passes = passes_by_config.get(config)
+        if passes is None:
+            passes = get_analysis_passes(config.style, config.errors_to_ignore)
+            if config.frozen:
+                passes_by_config[config] = passes
+        with timed("get_function_descriptions"):
+            functions = get_function_descriptions(tree, passes=passes)
+
+        # The function descriptions only keep the function nodes,
+        # so the rest of the module can be collected.
+        del tree
+        yield filename, functions
+        del functions
+
+
+def check(
+    analyzed: Iterable[Analyzed],
+    verbosity: int,
+    raise_errors_for_syntax: bool,
+    configs: Optional[ConfigResolver] = None,
+) -> Iterator[ErrorReport]:
+    """Check the docstrings of the functions in each module.
+
+    Args:
+        analyzed: The filenames and their function descriptions.
+        verbosity: The level of verbosity, in the range [1, 3].
+        raise_errors_for_syntax: True if we want parser errors
+            to propagate up (crashing darglint2.)
+        configs: The configuration of each file.  By default, every
+            file has the global configuration.
+
+    Yields:
+        An error report for each module.
+
+    """
+    for filename, functions in analyzed:
+        profiler = get_profiler()
+        if profiler is not None:
+            profiler.current_file = filename
+        config = _get_config(filename, configs)
+        if "*" in config.ignore:
+            yield ErrorReport([], filename, verbosity, config=config)
+            continue
+        if isinstance(functions, SyntaxError):
+            error = PythonSyntaxError(functions)
+            yield ErrorReport([error], filename, verbosity, config=config)
+            continue
+        checker = IntegrityChecker(
+            raise_errors=raise_errors_for_syntax,
+            config=config,
+        )
+        for function in functions:
+            checker.schedule(function)
+        del functions
+        report = checker.get_error_report(verbosity, filename)
+        del checker
+        yield report
+        del report
+
+
+def render(reports: Iterable[ErrorReport]) -> Iterator[str]:
+    """Render each error report as a string.
+
+    Args:
+        reports: The error reports to render.
+
+    Yields:
+        The string representation of each report.  Once it
+        is rendered, the report (and the errors in it) can be
+        collected.
+
+    """
+    for report in reports:
+        rendered = str(report)
+        del report
+        yield rendered
+
+
+def bounded(stage: Iterable[T], maxsize: int = DEFAULT_QUEUE_SIZE) -> Iterator[T]:
+    """Run the given stage in a background thread.
+
+    Args:
+        stage: The stage whose items should be produced in the
+            background.
+        maxsize: The maximum number of items which can be waiting
+            to be consumed.  The background thread blocks until
+            there is room in the queue.
+
+    Raises:
+        BaseException: Any exception raised while producing items
+            is re-raised in the consuming thread.
+
+    Yields:
+        The items produced by the stage, in order.
+
+    # noqa: DAR401 error
+    # noqa: DAR402 BaseException
+
+    """
+    items: queue.Queue = queue.Queue(maxsize=max(1, maxsize))
+    stopped = threading.Event()
+    done = object()
+
+    def put(item):
+        while not stopped.is_set():
+            try:
+                items.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for item in stage:
+                if not put((item, None)):
+                    return
+        except BaseException as ex:
+            put((done, ex))
+        else:
+            put((done, None))
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    try:
+        while True:
+            item, error = items.get()
+            if item is done:
+                if error is not None:
+                    raise error
+                return
+            yield item
+            del item
+    finally:
+        # Unblock the producer if the consumer stopped early.
+        stopped.set()
+        producer.join()
+
+
+def get_error_reports(
+    paths: Iterable[str],
+    verbosity: int,
+    raise_errors_for_syntax: bool,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+    read_ahead_bytes: int = DEFAULT_READ_AHEAD_BYTES,
+    configs: Optional[ConfigResolver] = None,
+) -> Iterator[ErrorReport]:
+    """Check the given files, streaming an error report for each.
+
+    Args:
+        paths: The files and directories to check.
+        verbosity: The level of verbosity, in the range [1, 3].
+        raise_errors_for_syntax: True if we want parser errors
+            to propagate up (crashing darglint2.)
+        queue_size: The maximum number of files which may be
+            read ahead of the file currently being checked.
+        read_ahead_bytes: The maximum number of bytes which may
+            be buffered by files read ahead.
+        configs: The configuration of each file.  By default, every
+            file has the global configuration.
+
+    Returns:
+        An iterator of error reports, one for each file checked.
+
+    """
+    filenames = bounded(discover(paths), queue_size)
+    sources = read_ahead(filenames, queue_size, read_ahead_bytes)
+    return check(
+        analyze(parse(sources), configs),
+        verbosity,
+        raise_errors_for_syntax,
+        configs,
+    )
+
+
+def check_files(
+    paths: Iterable[str],
+    verbosity: int,
+    raise_errors_for_syntax: bool,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+    read_ahead_bytes: int = DEFAULT_READ_AHEAD_BYTES,
+    configs: Optional[ConfigResolver] = None,
+) -> Iterator[str]:
+    """Check the given files, streaming a rendered report for each.
+
+    Args:
+        paths: The files and directories to check.
+        verbosity: The level of verbosity, in the range [1, 3].
+        raise_errors_for_syntax: True if we want parser errors
+            to propagate up (crashing darglint2.)
+        queue_size: The maximum number of files which may be
+            read ahead of the file currently being checked.
+        read_ahead_bytes: The maximum number of bytes which may
+            be buffered by files read ahead.
+        configs: The configuration of each file.  By default, every
+            file has the global configuration.
+
+    Returns:
+        An iterator of rendered error reports, one for each file
+        checked.
+
+    """
+    return render(
+        get_error_reports(
+            paths,
+            verbosity,
+            raise_errors_for_syntax,
+            queue_size,
+            read_ahead_bytes,
+            configs,
+        )
+    )
+
+
+class Record(NamedTuple):
+    """An error found by `check_sources`."""
+
+    # The path the source was given with.
+    path: str
+
+    # The error code, e.g. "DAR101".
+    code: str
+
+    message: str
+
+    # The first and last lines of the error, as reported on the
+    # command line.
+    line: int
+    end_line: int
+
+    # The name of the function whose docstring has the error.
+    function: str
+
+
+def _get_record(report: ErrorReport, error: DarglintError) -> Record:
+    line = report.get_line_number(error)
+    end_line = line
+    if error.line_numbers:
+        end_line += error.line_numbers[1] - error.line_numbers[0]
+    return Record(
+        path=report.filename,
+        code=error.error_code,
+        message=error.message(verbosity=report.verbosity),
+        line=line,
+        end_line=end_line,
+        function=error.function.name,
+    )
+
+
+def _check_source(
+    path: str,
+    source: Union[bytes, str],
+    config: Configuration,
+    verbosity: int,
+) -> List[Record]:
+    """Check a single source, possibly in a worker process.
+
+    Args:
+        path: The path to report the errors with.
+        source: The source code.
+        config: The (frozen) configuration to check with.
+        verbosity: The level of verbosity, in the range [1, 2].
+
+    Returns:
+        The errors in the source, in the order they're reported.
+
+    """
+    if "*" in config.ignore:
+        return []
+    try:
+        with timed("ast.parse"):
+            tree = ast.parse(source)
+    except SyntaxError as e:
+        errors: List[DarglintError] = [PythonSyntaxError(e)]
+    else:
+        passes = get_analysis_passes(config.style, config.errors_to_ignore)
+        with timed("get_function_descriptions"):
+            functions = get_function_descriptions(tree, passes=passes)
+        del tree
+
+        # The functions are checked on this thread: the checks hold
+        # the GIL, so the batch is better parallelized by source.
+        checker = IntegrityChecker(config=config)
+        for function in functions:
+            checker.run_checks(function)
+        errors = checker.errors
+    report = ErrorReport(errors, path, verbosity, config=config)
+    return [_get_record(report, error) for error in report]
+
+
+def check_sources(
+    sources: Iterable[Tuple[str, Union[bytes, str]]],
+    config: Optional[Configuration] = None,
+    verbosity: int = 1,
+    jobs: int = 1,
+) -> Iterator[Tuple[str, List[Record]]]:
+    """Check sources held in memory, streaming the errors in each.
+
+    Nothing is read from (or written to) disk: the paths are only
+    used to report the errors.  The caches of the parser are shared
+    by every source in the batch (or, with several jobs, by every
+    source checked by the same worker.)
+
+    Args:
+        sources: The path and source code of each module.
+        config: The configuration to check every source with.  By
+            default, the configuration for the current context.
+        verbosity: The level of verbosity of the messages, in the
+            range [1, 2].
+        jobs: The number of worker processes to check the sources
+            in.  With one job, they're checked in this process.
+
+    Yields:
+        The path of each source, and the errors found in it, in the
+        order the sources were given.
+
+    """
+    config = (config or get_config()).snapshot()
+    if jobs <= 1:
+        for path, source in sources:
+            yield path, _check_source(path, source, config, verbosity)
+        return
+
+    pending: Deque[Tuple[str, Future]] = collections.deque()
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        try:
+            for path, source in sources:
+                future = executor.submit(_check_source, path, source, config, verbosity)
+                pending.append((path, future))
+                del source
+                if len(pending) >= jobs * SOURCES_PER_JOB:
+                    path, future = pending.popleft()
+                    yield path, future.result()
+            while pending:
+                path, future = pending.popleft()
+                yield path, future.result()
+        finally:
+            for _, future in pending:
+                future.cancel()
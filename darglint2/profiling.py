@@ -0,0 +1,320 @@
+"""Instrumentation for finding where time is spent during a run.
+
+Profiling is off by default, in which case the instrumentation
+points cost a single check of a global.  When enabled (with
+`enable`), each instrumented phase accumulates its wall time and
+number of calls, and the slowest docstrings are kept along with
+their locations and token counts.  Notable events, such as a
+section exceeding the parse budget, are counted.
+
+Docstrings are checked on several threads at once, so the times
+for the phases within a docstring are summed across threads, and
+can add up to more than the run's wall time.
+
+"""
+
+import functools
+import heapq
+import itertools
+import json
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union, cast
+
+T = TypeVar("T", bound=Callable[..., Any])
+
+# The default number of slowest docstrings to report.
+DEFAULT_TOP = 10
+
+
+class _Timer(object):
+    """Times a single call of a phase."""
+
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler: "Profiler", name: str) -> None:
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self) -> "_Timer":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.profiler.record(self.name, time.perf_counter() - self.start)
+
+
+class _NullTimer(object):
+    """Stands in for a timer when profiling is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullTimer":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        pass
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class Profiler(object):
+    """Accumulates the time spent in each phase of a run."""
+
+    def __init__(self, top: int = DEFAULT_TOP) -> None:
+        """Create a new profiler.
+
+        Args:
+            top: The number of slowest docstrings to keep.
+
+        """
+        self.top = top
+
+        # The file currently being checked, used to locate the
+        # slowest docstrings.
+        self.current_file = ""
+
+        # The phase names, mapped to their call count and total time.
+        self.phases: Dict[str, List[Union[int, float]]] = dict()
+
+        # The number of times each counted event occurred.
+        self.counters: Dict[str, int] = dict()
+
+        # A min-heap of the slowest docstrings seen so far.
+        self._docstrings: List[Tuple[float, int, Dict[str, Any]]] = list()
+        self._counter = itertools.count()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def timed(self, name: str) -> _Timer:
+        return _Timer(self, name)
+
+    def record(self, name: str, elapsed: float) -> None:
+        """Record a single call of the given phase.
+
+        Args:
+            name: The name of the phase.
+            elapsed: The number of seconds the call took.
+
+        """
+        with self._lock:
+            phase = self.phases.get(name)
+            if phase is None:
+                self.phases[name] = [1, elapsed]
+            else:
+                phase[0] += 1
+                phase[1] += elapsed
+
+    def count(self, name: str) -> None:
+        """Count an occurrence of the given event.
+
+        Args:
+            name: The name of the event.
+
+        """
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + 1
+
+    def note_tokens(self, count: int) -> None:
+        """Note the number of tokens in the docstring being parsed.
+
+        Args:
+            count: The number of tokens, after condensing.
+
+        """
+        self._local.tokens = count
+
+    def record_docstring(self, function: str, line: int, elapsed: float) -> None:
+        """Record the time taken to parse and check a docstring.
+
+        The token count is taken from the last call to `note_tokens`
+        on this thread.
+
+        Args:
+            function: The name of the function.
+            line: The line on which the function is defined.
+            elapsed: The number of seconds taken.
+
+        """
+        record = {
+            "path": self.current_file,
+            "line": line,
+            "function": function,
+            "tokens": getattr(self._local, "tokens", 0),
+            "seconds": elapsed,
+        }
+        self._local.tokens = 0
+        item = (elapsed, next(self._counter), record)
+        with self._lock:
+            if len(self._docstrings) < self.top:
+                heapq.heappush(self._docstrings, item)
+            elif self._docstrings and item > self._docstrings[0]:
+                heapq.heapreplace(self._docstrings, item)
+
+    def get_phases(self) -> List[Dict[str, Any]]:
+        """Get the totals for each phase.
+
+        Returns:
+            The phases, from the most to the least total time.
+
+        """
+        return [
+            {"name": name, "calls": calls, "seconds": seconds}
+            for name, (calls, seconds) in sorted(
+                self.phases.items(),
+                key=lambda x: (-x[1][1], x[0]),
+            )
+        ]
+
+    def get_slowest_docstrings(self) -> List[Dict[str, Any]]:
+        """Get the slowest docstrings.
+
+        Returns:
+            The slowest docstrings, from slowest to fastest.
+
+        """
+        return [record for _, _, record in sorted(self._docstrings, reverse=True)]
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "phases": self.get_phases(),
+                "counters": dict(sorted(self.counters.items())),
+                "docstrings": self.get_slowest_docstrings(),
+            },
+            indent=2,
+        )
+
+    def summary(self) -> str:
+        """Summarize the run in a human-readable table.
+
+        Returns:
+            The phases, sorted by total time, followed by the
+            counted events and the slowest docstrings.
+
+        """
+        lines = [
+            "{:<40} {:>10} {:>12} {:>12}".format(
+                "Phase", "Calls", "Total (s)", "Mean (ms)"
+            ),
+        ]
+        for phase in self.get_phases():
+            lines.append(
+                "{:<40} {:>10} {:>12.4f} {:>12.4f}".format(
+                    phase["name"],
+                    phase["calls"],
+                    phase["seconds"],
+                    1000 * phase["seconds"] / phase["calls"],
+                )
+            )
+        if self.counters:
+            lines.append("")
+            lines.append("Counters:")
+            for name, value in sorted(self.counters.items()):
+                lines.append("{:>10}  {}".format(value, name))
+        docstrings = self.get_slowest_docstrings()
+        if docstrings:
+            lines.append("")
+            lines.append("Slowest docstrings:")
+            for docstring in docstrings:
+                lines.append(
+                    "{:>10.4f}s  {}:{}: {} ({} tokens)".format(
+                        docstring["seconds"],
+                        docstring["path"],
+                        docstring["line"],
+                        docstring["function"],
+                        docstring["tokens"],
+                    )
+                )
+        return "\n".join(lines)
+
+
+_profiler: Optional[Profiler] = None
+
+
+def enable(top: int = DEFAULT_TOP) -> Profiler:
+    """Start profiling.
+
+    Args:
+        top: The number of slowest docstrings to keep.
+
+    Returns:
+        The profiler which will accumulate the results.
+
+    """
+    global _profiler
+    _profiler = Profiler(top)
+    return _profiler
+
+
+def disable() -> Optional[Profiler]:
+    """Stop profiling.
+
+    Returns:
+        The profiler which accumulated the results, if
+        profiling was enabled.
+
+    """
+    global _profiler
+    profiler = _profiler
+    _profiler = None
+    return profiler
+
+
+def get_profiler() -> Optional[Profiler]:
+    return _profiler
+
+
+def timed(name: str) -> Union[_Timer, _NullTimer]:
+    """Time the enclosed block as a call of the given phase.
+
+    Args:
+        name: The name of the phase.
+
+    Returns:
+        A context manager which times the block, if profiling
+        is enabled.
+
+    """
+    if _profiler is None:
+        return _NULL_TIMER
+    return _profiler.timed(name)
+
+
+def count(name: str) -> None:
+    if _profiler is not None:
+        _profiler.count(name)
+
+
+def note_tokens(count: int) -> None:
+    if _profiler is not None:
+        _profiler.note_tokens(count)
+
+
+def profiled(name: Union[str, Callable[..., str]]) -> Callable[[T], T]:
+    """Time each call of the decorated function.
+
+    Args:
+        name: The name of the phase, or a function which takes
+            the decorated function's arguments and returns the
+            name of the phase.
+
+    Returns:
+        A decorator.
+
+    """
+
+    def decorator(fun: T) -> T:
+        @functools.wraps(fun)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if _profiler is None:
+                return fun(*args, **kwargs)
+            phase = name(*args, **kwargs) if callable(name) else name
+            with _profiler.timed(phase):
+                return fun(*args, **kwargs)
+
+        return cast(T, wrapper)
+
+    return decorator
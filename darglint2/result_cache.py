@@ -0,0 +1,143 @@
+"""A persistent cache of the errors reported for each file.
+
+When darglint2 runs under flake8, every docstring is parsed again on
+every run, though most files haven't changed since the last one.  The
+errors reported for a file are stored under a key derived from the
+file's contents and the configuration it was checked with, so that an
+unchanged file checked the same way is reported from the cache.
+
+Each entry is stored in its own file, which is written to a temporary
+file and then moved into place.  The move is atomic, so flake8's
+workers can read and write the cache at once: a reader sees either a
+whole entry or none.  Entries are never evicted; the cache can be
+removed at any time.
+
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from typing import Any, Iterable, List, Optional, Tuple
+
+from . import __version__
+from .config import Configuration, get_logger
+
+logger = get_logger()
+
+Report = List[Tuple[int, int, str]]
+
+
+def get_cache_directory() -> str:
+    """Get the directory to store the cache in.
+
+    Returns:
+        The directory given by `DARGLINT2_CACHE_DIR`, or else the
+        darglint2 directory in the user's cache directory.
+
+    """
+    directory = os.environ.get("DARGLINT2_CACHE_DIR")
+    if directory:
+        return directory
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(cache_home, "darglint2")
+
+
+def _describe(value: Any) -> Any:
+    if hasattr(value, "name"):
+        # An enum, which should be described the same way by every
+        # process.
+        return value.name
+    if isinstance(value, (list, set, frozenset)):
+        return sorted(map(str, value))
+    return value
+
+
+def get_key(lines: Iterable[str], config: Configuration, verbosity: int) -> str:
+    """Get the key of the errors for a file.
+
+    Args:
+        lines: The lines of the file.
+        config: The configuration the file is checked with.
+        verbosity: The verbosity of the messages.
+
+    Returns:
+        A key which is the same only for the same contents, checked
+        by the same version of darglint2 with the same configuration.
+
+    """
+    options = {name: _describe(value) for name, value in vars(config).items()}
+    digest = hashlib.sha256()
+    digest.update(
+        json.dumps(
+            [__version__, verbosity, options], sort_keys=True, default=str
+        ).encode("utf8")
+    )
+    for line in lines:
+        digest.update(line.encode("utf8", "surrogateescape"))
+    return digest.hexdigest()
+
+
+class ResultCache(object):
+    """The errors reported for each file, stored in a directory."""
+
+    def __init__(self, directory: str) -> None:
+        """Create a cache stored in the given directory.
+
+        Args:
+            directory: The directory to store the entries in.  It's
+                created when the first entry is stored.
+
+        """
+        self.directory = directory
+
+    def _get_path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key + ".json")
+
+    def get(self, key: str) -> Optional[Report]:
+        """Get the errors stored for the key.
+
+        Args:
+            key: The key of the file.  (See `get_key`.)
+
+        Returns:
+            The errors, as flake8 reports them, or None if they
+            haven't been stored (or couldn't be read.)
+
+        """
+        try:
+            with open(self._get_path(key)) as fin:
+                return [(line, col, msg) for line, col, msg in json.load(fin)]
+        except (OSError, ValueError, TypeError) as ex:
+            if not isinstance(ex, FileNotFoundError):
+                logger.debug("Unable to read the cache entry {}: {}".format(key, ex))
+            return None
+
+    def set(self, key: str, report: Report) -> None:
+        """Store the errors for the key.
+
+        Args:
+            key: The key of the file.  (See `get_key`.)
+            report: The errors, as flake8 reports them.
+
+        """
+        path = self._get_path(key)
+        directory = os.path.dirname(path)
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, temporary = tempfile.mkstemp(suffix=".tmp", dir=directory)
+        except OSError as ex:
+            logger.debug("Unable to write the cache entry {}: {}".format(key, ex))
+            return
+        try:
+            with os.fdopen(fd, "w") as fout:
+                json.dump(report, fout)
+            os.replace(temporary, path)
+        except OSError as ex:
+            logger.debug("Unable to write the cache entry {}: {}".format(key, ex))
+            try:
+                os.unlink(temporary)
+            except OSError:
+                pass
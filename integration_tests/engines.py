@@ -0,0 +1,151 @@
+"""A script to compare the parsing engines on each section type.
+
+Docstrings are extracted from the given python files (or from
+darglint2 itself), split into sections for each docstring style,
+and every section is parsed with every grammar its style would try,
+by CYK, by the Earley chart parser, and by the parse function which
+`bnf_to_cnf -f specialized` would generate for the grammar.  The
+trees must be identical; the time taken by each engine is reported
+by grammar.
+
+The specialized parse functions are generated from the grammars'
+`productions` lists, so all three engines use the same grammars,
+even though the checked-in grammars weren't generated with them.
+
+Usage:
+
+    python integration_tests/engines.py [PATH ...]
+
+"""
+
+import ast
+import inspect
+import os
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, Iterator, List, Type
+
+from darglint2.lex import condense, lex
+from darglint2.parse import cyk, earley, google, numpy, sphinx
+from darglint2.parse.grammar import BaseGrammar
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "bin", "bnf_to_cnf"))
+
+from bnf_to_cnf.specializer import IMPORTS, Specializer  # noqa: E402
+
+STYLES = {
+    "google": google,
+    "sphinx": sphinx,
+    "numpy": numpy,
+}
+
+
+def get_docstrings(paths: List[str]) -> Iterator[str]:
+    for path in paths:
+        filenames = [path]
+        if os.path.isdir(path):
+            filenames = [
+                os.path.join(directory, filename)
+                for directory, _, names in os.walk(path)
+                for filename in names
+                if filename.endswith(".py")
+            ]
+        for filename in filenames:
+            try:
+                with open(filename) as fin:
+                    tree = ast.parse(fin.read())
+            except (SyntaxError, UnicodeDecodeError):
+                continue
+            for node in ast.walk(tree):
+                if isinstance(
+                    node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+                ):
+                    docstring = ast.get_docstring(node)
+                    if docstring:
+                        yield docstring
+
+
+def specialize(grammar: Type[BaseGrammar]) -> Type[BaseGrammar]:
+    """Generate the specialized parse function for a grammar.
+
+    Args:
+        grammar: The grammar to generate a parse function for.
+
+    Returns:
+        A subclass of the grammar, with the parse function.
+
+    """
+    productions = list()
+    for production in grammar.productions:
+        derivations = list()
+        for derivation in production.rhs:
+            if len(derivation) == 2:
+                token_type, weight = derivation
+                derivations.append((str(token_type), weight))
+            else:
+                annotations, B, C, weight = derivation
+                names = ", ".join(x.__name__ for x in annotations)
+                derivations.append(("[{}]".format(names), B, C, weight))
+        productions.append((production.lhs, derivations))
+    source = Specializer(productions, grammar.start).to_python()
+    namespace = dict(vars(sys.modules[grammar.__module__]))
+    exec("\n".join(IMPORTS + ["class Specialized:"] + [source]), namespace)
+    return type(
+        grammar.__name__,
+        (grammar,),
+        {"specialized_parse": namespace["Specialized"].specialized_parse},
+    )
+
+
+def compare(docstrings: List[str]) -> Dict[str, List[float]]:
+    times: Dict[str, List[float]] = defaultdict(lambda: [0, 0.0, 0.0, 0.0])
+    specialized: Dict[Type[BaseGrammar], Type[BaseGrammar]] = dict()
+    for style, module in STYLES.items():
+        for docstring in docstrings:
+            sections = module.top_parse(condense(lex(docstring)))
+            for i, section in enumerate(sections):
+                for grammar in module.lookup(section, i):
+                    if not inspect.isclass(grammar):
+                        continue
+                    if grammar not in specialized:
+                        specialized[grammar] = specialize(grammar)
+                    timings = [time.perf_counter()]
+                    expected = cyk.parse(grammar, section)
+                    timings.append(time.perf_counter())
+                    actual = [earley.parse(grammar, section)]
+                    timings.append(time.perf_counter())
+                    actual.append(cyk.parse_specialized(specialized[grammar], section))
+                    timings.append(time.perf_counter())
+                    for tree in actual:
+                        if expected is None or tree is None:
+                            assert expected is tree, grammar
+                        else:
+                            assert str(expected) == str(tree), grammar
+                    entry = times["{} {}".format(style, grammar.__name__)]
+                    entry[0] += 1
+                    for j in range(3):
+                        entry[j + 1] += timings[j + 1] - timings[j]
+    return times
+
+
+if __name__ == "__main__":
+    paths = sys.argv[1:] or [os.path.join(os.path.dirname(__file__), "..", "darglint2")]
+    times = compare(list(get_docstrings(paths)))
+    print(
+        "{} {} {} {} {}".format(
+            "GRAMMAR".ljust(40),
+            "SECTIONS".rjust(8),
+            "CYK".rjust(8),
+            "EARLEY".rjust(8),
+            "SPECIAL".rjust(8),
+        )
+    )
+    for name, (sections, *engine_times) in sorted(times.items()):
+        print(
+            "{} {} {}".format(
+                name.ljust(40),
+                str(sections).rjust(8),
+                " ".join("{:.3f}".format(x).rjust(8) for x in engine_times),
+            )
+        )
@@ -0,0 +1,155 @@
+"""A script to benchmark the identifiers' extraction paths.
+
+Each Google docstring in the goldens (or in the given python files)
+is parsed, and every node annotated with an identifier has its path
+followed twice: by the interpreted `Continuation.extract`, and by the
+function the path was compiled to.  The results must be identical;
+the time taken by each is reported by identifier, along with the time
+spent in the `Docstring` accessors which use them, with either.
+
+Usage:
+
+    python integration_tests/identifiers.py [PATH ...]
+
+where each path is a JSON file of goldens (as produced by the
+doc_extract utility), or a python file or directory.  By default,
+the goldens in integration_tests/goldens.json are used.
+
+"""
+
+import ast
+import json
+import os
+import sys
+import time
+from collections import defaultdict
+from typing import Callable, Dict, Iterator, List, Type
+
+from darglint2.docstring.google import Docstring
+from darglint2.docstring.sections import Sections
+from darglint2.parse.identifiers import (
+    ArgumentIdentifier,
+    ArgumentItemIdentifier,
+    ArgumentTypeIdentifier,
+    ExceptionIdentifier,
+    ExceptionItemIdentifier,
+    Identifier,
+    NoqaIdentifier,
+    ReturnTypeIdentifier,
+    YieldTypeIdentifier,
+)
+
+IDENTIFIERS = [
+    ArgumentIdentifier,
+    ArgumentItemIdentifier,
+    ArgumentTypeIdentifier,
+    ExceptionIdentifier,
+    ExceptionItemIdentifier,
+    NoqaIdentifier,
+    ReturnTypeIdentifier,
+    YieldTypeIdentifier,
+]
+
+DEFAULT_GOLDENS = os.path.join(os.path.dirname(__file__), "goldens.json")
+
+
+def get_docstrings(paths: List[str]) -> Iterator[str]:
+    for path in paths:
+        if path.endswith(".json"):
+            with open(path) as fin:
+                for golden in json.load(fin):
+                    if golden["type"] == "GOOGLE":
+                        yield golden["docstring"]
+            continue
+        filenames = [path]
+        if os.path.isdir(path):
+            filenames = [
+                os.path.join(directory, filename)
+                for directory, _, names in os.walk(path)
+                for filename in names
+                if filename.endswith(".py")
+            ]
+        for filename in filenames:
+            try:
+                with open(filename) as fin:
+                    tree = ast.parse(fin.read())
+            except (SyntaxError, UnicodeDecodeError):
+                continue
+            for node in ast.walk(tree):
+                if isinstance(
+                    node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+                ):
+                    docstring = ast.get_docstring(node)
+                    if docstring:
+                        yield docstring
+
+
+def use_paths(paths: Dict[Type[Identifier], Callable]) -> None:
+    for identifier, path in paths.items():
+        identifier._extract_path = staticmethod(path)  # type: ignore
+
+
+def get_all(docstring: Docstring) -> None:
+    for section in (Sections.ARGUMENTS_SECTION, Sections.RAISES_SECTION):
+        docstring.get_items(section)
+    for section in (
+        Sections.ARGUMENTS_SECTION,
+        Sections.RETURNS_SECTION,
+        Sections.YIELDS_SECTION,
+    ):
+        docstring.get_types(section)
+    docstring.get_noqas()
+
+
+def compare(docstrings: List[str]) -> Dict[str, List[float]]:
+    times: Dict[str, List[float]] = defaultdict(lambda: [0, 0.0, 0.0])
+    compiled = {x: x._extract_path for x in IDENTIFIERS}
+    interpreted = {x: x.path.extract for x in IDENTIFIERS}
+    for raw in docstrings:
+        docstring = Docstring(raw)
+        for identifier in IDENTIFIERS:
+            nodes = docstring._lookup.get(identifier.key, [])
+            extract = compiled[identifier]
+            start = time.perf_counter()
+            expected = [identifier.path.extract(node) for node in nodes]
+            middle = time.perf_counter()
+            actual = [extract(node) for node in nodes]
+            end = time.perf_counter()
+            assert actual == expected, identifier.key
+            entry = times[identifier.__name__]
+            entry[0] += len(nodes)
+            entry[1] += middle - start
+            entry[2] += end - middle
+
+        # The accessors, on fresh docstrings so that nothing is cached,
+        # with the interpreted paths and then with the compiled paths.
+        for column, paths in ((1, interpreted), (2, compiled)):
+            use_paths(paths)
+            fresh = Docstring(docstring.root)
+            start = time.perf_counter()
+            get_all(fresh)
+            times["(accessors)"][column] += time.perf_counter() - start
+        times["(accessors)"][0] += 1
+    return times
+
+
+if __name__ == "__main__":
+    paths = sys.argv[1:] or [DEFAULT_GOLDENS]
+    times = compare(list(get_docstrings(paths)))
+    print(
+        "{} {} {} {}".format(
+            "IDENTIFIER".ljust(28),
+            "NODES".rjust(8),
+            "PATH".rjust(8),
+            "COMPILED".rjust(8),
+        )
+    )
+    for name, (nodes, interpreted, compiled) in sorted(times.items()):
+        print(
+            "{} {} {} {}".format(
+                name.ljust(28),
+                str(nodes).rjust(8),
+                "{:.4f}".format(interpreted).rjust(8),
+                "{:.4f}".format(compiled).rjust(8),
+            )
+        )
@@ -1,12 +1,21 @@
 import ast
 from unittest import TestCase
 
-from darglint2.analysis.analysis_visitor import AnalysisVisitor
+from darglint2.analysis.analysis_visitor import (
+    ALL_ANALYSIS_PASSES,
+    AnalysisVisitor,
+    get_analysis_visitor,
+)
 
 from .utils import reindent
 
 
 class AnalysisVisitorTests(TestCase):
+    def analyze(self, function):
+        visitor = AnalysisVisitor()
+        visitor.visit(function)
+        return visitor
+
     def assertFound(self, program, attribute, args, transform=None):
         """Assert that the given attribute values were found.
 
@@ -22,8 +31,7 @@ class AnalysisVisitorTests(TestCase):
 
         """
         function = ast.parse(reindent(program))
-        visitor = AnalysisVisitor()
-        visitor.visit(function)
+        visitor = self.analyze(function)
         actual = getattr(visitor, attribute)
         if transform:
             if isinstance(actual, list):
@@ -81,8 +89,7 @@ class AnalysisVisitorTests(TestCase):
                 pass
         '''
         function = ast.parse(reindent(program))
-        visitor = AnalysisVisitor()
-        visitor.visit(function)
+        visitor = self.analyze(function)
         self.assertTrue(visitor.is_abstract, "Should have been marked abstract.")
 
     def test_finds_not_abstract(self):
@@ -92,6 +99,46 @@ class AnalysisVisitorTests(TestCase):
                 return x / 2
         '''
         function = ast.parse(reindent(program))
-        visitor = AnalysisVisitor()
-        visitor.visit(function)
+        visitor = self.analyze(function)
         self.assertFalse(visitor.is_abstract, "Should have been marked abstract.")
+
+
+class GetAnalysisVisitorTests(TestCase):
+    def test_all_passes_is_analysis_visitor(self):
+        self.assertIs(get_analysis_visitor(ALL_ANALYSIS_PASSES), AnalysisVisitor)
+
+    def test_visitor_only_has_selected_passes(self):
+        program = r"""
+            def f(x):
+                y = x
+                raise Exception()
+                return y
+        """
+        function = ast.parse(reindent(program))
+        visitor = get_analysis_visitor(frozenset({"returns"}))()
+        visitor.visit(function)
+        self.assertEqual(len(visitor.returns), 1)
+        self.assertFalse(hasattr(visitor, "variables"))
+        self.assertFalse(hasattr(visitor, "exceptions"))
+
+    def test_visitors_are_cached(self):
+        passes = frozenset({"arguments", "yields"})
+        self.assertIs(get_analysis_visitor(passes), get_analysis_visitor(passes))
+
+    def test_first_return_same_without_raises(self):
+        program = r"""
+            def f():
+                try:
+                    pass
+                except Exception:
+                    pass
+                else:
+                    return 1
+                finally:
+                    return
+        """
+        function = ast.parse(reindent(program))
+        for passes in (ALL_ANALYSIS_PASSES, frozenset({"returns"})):
+            visitor = get_analysis_visitor(passes)()
+            visitor.visit(function)
+            self.assertIsNone(visitor.returns[0].value)
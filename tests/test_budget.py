@@ -0,0 +1,178 @@
+"""Tests for the limits on parsing a single docstring."""
+
+import ast
+import os
+import tempfile
+import time
+from unittest import TestCase
+
+from darglint2 import profiling
+from darglint2.config import load_config_file
+from darglint2.errors import MissingParameterError, ParseBudgetExceededError
+from darglint2.function_description import get_function_descriptions
+from darglint2.integrity_checker import IntegrityChecker
+from darglint2.lex import condense, lex
+from darglint2.parse import budget
+from darglint2.parse.budget import Budget, BudgetExceeded, limit
+from darglint2.utils import ConfigurationContext
+
+# An arguments section which isn't in the canonical form (the
+# descriptions contain hashes), so it can only be parsed by CYK.
+ARGUMENTS = "".join("        x{}: The x # not\n".format(i) for i in range(30))
+
+PROGRAM = "\n".join(
+    [
+        "def f({}):".format(", ".join("x{}".format(i) for i in range(30))),
+        '    """Do something.',
+        "",
+        "    Args:",
+        ARGUMENTS,
+        '    """',
+        "    pass",
+    ]
+)
+
+
+class BudgetTest(TestCase):
+    def test_section_too_long(self):
+        tokens = condense(lex("a b\nc d"))
+        Budget(max_section_tokens=len(tokens)).check_section(tokens)
+        with self.assertRaises(BudgetExceeded) as context:
+            Budget(max_section_tokens=len(tokens) - 1).check_section(tokens)
+        self.assertEqual(context.exception.reason, budget.TOKENS)
+
+    def test_no_limit(self):
+        tokens = condense(lex("a b\nc d"))
+        Budget().check_section(tokens)
+
+    def test_out_of_time(self):
+        b = Budget(time_limit=0.001)
+        time.sleep(0.01)
+        with self.assertRaises(BudgetExceeded) as context:
+            b.check_time()
+        self.assertEqual(context.exception.reason, budget.TIME)
+
+    def test_limit_restores_previous_budget(self):
+        tokens = condense(lex("a\nb\nc"))
+        with limit(max_section_tokens=1):
+            with limit():
+                budget.check_section(tokens)
+            with self.assertRaises(BudgetExceeded):
+                budget.check_section(tokens)
+        budget.check_section(tokens)
+
+
+class ParseBudgetExceededTest(TestCase):
+    def setUp(self):
+        self.function = get_function_descriptions(ast.parse(PROGRAM))[0]
+
+    def get_errors(self, function, **kwargs):
+        with ConfigurationContext(**kwargs):
+            checker = IntegrityChecker()
+            checker.run_checks(function)
+            return checker.errors
+
+    def test_long_section_not_analyzed(self):
+        errors = self.get_errors(self.function, max_section_tokens=50)
+        self.assertEqual(
+            [type(error) for error in errors],
+            [ParseBudgetExceededError],
+        )
+        self.assertEqual(errors[0].line_numbers[0], 2)
+
+    def test_error_can_be_ignored(self):
+        self.assertEqual(
+            self.get_errors(
+                self.function,
+                max_section_tokens=50,
+                ignore=[ParseBudgetExceededError.error_code],
+            ),
+            [],
+        )
+
+    def test_error_can_be_suppressed_with_noqa(self):
+        program = PROGRAM.replace(
+            '    """\n',
+            '    # noqa: DAR006\n\n    """\n',
+            1,
+        )
+        function = get_function_descriptions(ast.parse(program))[0]
+        self.assertEqual(self.get_errors(function, max_section_tokens=50), [])
+
+    def test_exceeded_budgets_counted(self):
+        profiler = profiling.enable()
+        try:
+            self.get_errors(self.function, max_section_tokens=50)
+        finally:
+            profiling.disable()
+        self.assertEqual(profiler.counters["parse budget exceeded: tokens"], 1)
+
+    def test_other_sections_still_checked(self):
+        raises = "".join(
+            "        Error{}: If it fails # not\n".format(i) for i in range(30)
+        )
+        program = "\n".join(
+            [
+                "def f(a, b):",
+                '    """Do something.',
+                "",
+                "    Args:",
+                "        a: The a.",
+                "",
+                "    Raises:",
+                raises,
+                '    """',
+                "    pass",
+            ]
+        )
+        function = get_function_descriptions(ast.parse(program))[0]
+        errors = self.get_errors(function, max_section_tokens=50)
+        self.assertEqual(
+            sorted(error.error_code for error in errors),
+            [ParseBudgetExceededError.error_code, MissingParameterError.error_code],
+        )
+        self.assertIn(
+            "b",
+            [
+                error.message()
+                for error in errors
+                if isinstance(error, MissingParameterError)
+            ][0],
+        )
+
+    def test_no_limit_by_default(self):
+        # A long section with a style error is still parsed in full.
+        arguments = ARGUMENTS + "        x30 The x.\n"
+        program = PROGRAM.replace(ARGUMENTS, arguments).replace("x29):", "x29, extra):")
+        function = get_function_descriptions(ast.parse(program))[0]
+        errors = self.get_errors(function)
+        self.assertEqual(
+            sorted(error.error_code for error in errors),
+            ["DAR003", "DAR101"],
+        )
+        self.assertIn(
+            "extra",
+            [
+                error.message()
+                for error in errors
+                if isinstance(error, MissingParameterError)
+            ][0],
+        )
+
+    def test_canonical_sections_not_limited(self):
+        program = PROGRAM.replace(" # not", "")
+        function = get_function_descriptions(ast.parse(program))[0]
+        self.assertEqual(self.get_errors(function, max_section_tokens=50), [])
+
+
+class LoadConfigTest(TestCase):
+    def test_budget_read_from_config(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "setup.cfg")
+            with open(filename, "w") as fout:
+                fout.write(
+                    "[darglint2]\nmax_section_tokens=50\nparse_time_budget=2.5\n"
+                )
+            config = load_config_file(filename)
+        self.assertEqual(config.max_section_tokens, 50)
+        self.assertEqual(config.parse_time_budget, 2.5)
@@ -1,16 +1,27 @@
 """Tests configuration scripts."""
 
+import ast
+import os
+import tempfile
+import threading
 from random import choice, randint
 from string import ascii_letters
 from unittest import TestCase, mock
 
 from darglint2.config import (
     POSSIBLE_CONFIG_FILENAMES,
+    ConfigResolver,
+    Configuration,
     LogLevel,
     find_config_file_in_path,
+    get_config,
     get_logger,
     walk_path,
 )
+from darglint2.docstring.style import DocstringStyle
+from darglint2.function_description import get_function_descriptions
+from darglint2.integrity_checker import IntegrityChecker
+from darglint2.lex import lex
 from darglint2.utils import ConfigurationContext
 
 
@@ -85,3 +96,169 @@ class LoggingTestCase(TestCase):
         with ConfigurationContext(log_level=LogLevel.ERROR):
             logger = get_logger()
             self.assertEqual(logger.level, LogLevel.ERROR.value)
+
+
+class SnapshotTestCase(TestCase):
+    def test_snapshot_is_frozen(self):
+        config = Configuration(ignore=["DAR101"], enable=["DAR104"])
+        snapshot = config.snapshot()
+        self.assertTrue(snapshot.frozen)
+        self.assertIs(snapshot.snapshot(), snapshot)
+        with self.assertRaises(AttributeError):
+            snapshot.indentation = 2
+        with self.assertRaises(AttributeError):
+            snapshot.ignore.append("DAR102")
+        self.assertEqual(snapshot.errors_to_ignore, frozenset({"DAR101"}))
+
+        # The original can still be changed, without changing the snapshot.
+        config.ignore.append("DAR102")
+        config.indentation = 2
+        self.assertEqual(snapshot.errors_to_ignore, frozenset({"DAR101"}))
+        self.assertEqual(snapshot.indentation, 4)
+
+    def test_replace_leaves_original(self):
+        config = Configuration(ignore=["DAR101"])
+        for original in [config, config.snapshot()]:
+            replaced = original.replace(indentation=2, ignore=["DAR102"])
+            self.assertTrue(replaced.frozen)
+            self.assertEqual(replaced.indentation, 2)
+            self.assertIn("DAR102", replaced.errors_to_ignore)
+            self.assertNotIn("DAR101", replaced.errors_to_ignore)
+            self.assertEqual(original.indentation, 4)
+            self.assertEqual(list(original.ignore), ["DAR101"])
+
+    def test_context_applies_snapshot(self):
+        config = Configuration(indentation=2)
+        with config.context() as snapshot:
+            self.assertIs(get_config(), snapshot)
+            self.assertEqual(get_config().indentation, 2)
+            config.indentation = 3
+            self.assertEqual(get_config().indentation, 2)
+        self.assertIsNot(get_config(), snapshot)
+
+    def test_contexts_are_per_thread(self):
+        barrier = threading.Barrier(2)
+        seen = dict()
+
+        def lex_with(indentation):
+            with Configuration(indentation=indentation).context():
+                barrier.wait()
+                tokens = list(lex("\n" + " " * 4 + "x"))
+                seen[indentation] = sum(1 for t in tokens if t.value == " " * 4)
+
+        threads = [
+            threading.Thread(target=lex_with, args=(indentation,))
+            for indentation in (2, 4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(seen, {2: 2, 4: 1})
+
+    def test_checkers_keep_their_configuration(self):
+        program = "\n".join(
+            [
+                "def f(x):",
+                '    """Do something.',
+                "",
+                "    :param x: The thing.",
+                "",
+                "    Args:",
+                "        y: Not an argument.",
+                "",
+                '    """',
+                "    pass",
+            ]
+        )
+        function = get_function_descriptions(ast.parse(program))[0]
+        google = Configuration(style=DocstringStyle.GOOGLE)
+        sphinx = Configuration(style=DocstringStyle.SPHINX)
+        checkers = [
+            IntegrityChecker(config=google),
+            IntegrityChecker(config=sphinx),
+        ]
+        google.style = DocstringStyle.SPHINX
+        for checker in checkers:
+            for _ in range(10):
+                checker.schedule(function)
+        codes = [
+            {error.error_code for error in checker.get_error_report(2, "f.py").errors}
+            for checker in checkers
+        ]
+        self.assertEqual(codes[0], {"DAR101", "DAR102"})
+        self.assertEqual(codes[1], set())
+
+
+class ConfigResolverTestCase(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.root = os.path.realpath(self.directory.name)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, name, contents):
+        filename = os.path.join(self.root, name)
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        with open(filename, "w") as fout:
+            fout.write(contents)
+        return filename
+
+    def test_nearest_config_file_is_used(self):
+        self.write("setup.cfg", "[darglint2]\ndocstring_style=sphinx\n")
+        self.write(os.path.join("a", "tox.ini"), "[tox]\nenvlist=py\n")
+        self.write(os.path.join("b", ".darglint2"), "[darglint2]\nstrictness=short\n")
+        resolver = ConfigResolver(Configuration.get_default_instance())
+        top = resolver.get_config(os.path.join(self.root, "x.py"))
+        a = resolver.get_config(os.path.join(self.root, "a", "x.py"))
+        b = resolver.get_config(os.path.join(self.root, "b", "c", "x.py"))
+        self.assertEqual(top.style, DocstringStyle.SPHINX)
+        # A config file without a section for darglint2 is skipped.
+        self.assertIs(a, top)
+        self.assertEqual(b.style, DocstringStyle.GOOGLE)
+        self.assertEqual(b.strictness.name, "SHORT_DESCRIPTION")
+        self.assertTrue(b.frozen)
+        self.assertIs(resolver.get_config(os.path.join(self.root, "b", "y.py")), b)
+
+    def test_default_without_config_file(self):
+        default = Configuration(indentation=2)
+        resolver = ConfigResolver(default)
+        with mock.patch("darglint2.config.os.path.dirname", side_effect=lambda x: x):
+            config = resolver.get_config(os.path.join(self.root, "x.py"))
+        self.assertEqual(config.indentation, 2)
+        self.assertTrue(config.frozen)
+
+    def test_overrides_take_precedence(self):
+        self.write("setup.cfg", "[darglint2]\ndocstring_style=sphinx\nindentation=2\n")
+        resolver = ConfigResolver(
+            Configuration.get_default_instance(),
+            {"style": DocstringStyle.NUMPY},
+        )
+        config = resolver.get_config(os.path.join(self.root, "x.py"))
+        self.assertEqual(config.style, DocstringStyle.NUMPY)
+        self.assertEqual(config.indentation, 2)
+
+    def test_lookups_are_cached_until_modified(self):
+        filename = self.write(".darglint2", "[darglint2]\nindentation=2\n")
+        resolver = ConfigResolver(Configuration.get_default_instance())
+        source = os.path.join(self.root, "x.py")
+        first = resolver.get_config(source)
+        with mock.patch("darglint2.config.load_config_file") as load:
+            self.assertIs(resolver.get_config(source), first)
+            load.assert_not_called()
+
+        with open(filename, "w") as fout:
+            fout.write("[darglint2]\nindentation=8\n")
+        stat = os.stat(filename)
+        os.utime(filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        self.assertEqual(resolver.get_config(source).indentation, 8)
+
+        # A config file added nearer to the source is found.
+        sub = os.path.join(self.root, "sub")
+        os.mkdir(sub)
+        self.assertEqual(resolver.get_config(os.path.join(sub, "x.py")).indentation, 8)
+        self.write(os.path.join("sub", "setup.cfg"), "[darglint2]\n")
+        stat = os.stat(sub)
+        os.utime(sub, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        self.assertEqual(resolver.get_config(os.path.join(sub, "x.py")).indentation, 4)
@@ -1,10 +1,19 @@
 """Tests darglint2's implementation of CYK."""
 
 import random
+import threading
 from collections import deque
 from unittest import TestCase
 
-from darglint2.parse.cyk import parse
+from darglint2.lex import condense, lex
+from darglint2.parse import google
+from darglint2.parse.cyk import (
+    ChartArena,
+    checkout_arena,
+    parse,
+    parse_specialized,
+    return_arena,
+)
 from darglint2.parse.grammar import BaseGrammar
 from darglint2.parse.grammar import Production as P
 from darglint2.token import BaseTokenType, Token
@@ -451,6 +460,129 @@ class PhoneNumberTests(TestCase):
             self.assertTrue(self.contains_annotation(node, ConfusionError))
 
 
+def _binary(digits):
+    return [
+        Token(value=x, token_type=ST.ONE if x == "1" else ST.ZERO, line_number=0)
+        for x in digits
+    ] + [Token(value="ε", token_type=ST.EPSILON, line_number=0)]
+
+
+class ChartArenaTests(TestCase):
+    def get_last_arena(self):
+        arena = checkout_arena()
+        return_arena(arena)
+        return arena
+
+    def test_chart_is_reused_and_reset(self):
+        parse(SmallGrammar, _binary("0110"))
+        arena = self.get_last_arena()
+        slots = arena.slots
+        self.assertGreater(len(slots), 0)
+        self.assertTrue(all(slot is None for slot in slots))
+        parse(SmallGrammar, _binary("01"))
+        self.assertIs(self.get_last_arena(), arena)
+        self.assertIs(arena.slots, slots)
+
+    def test_results_independent_of_previous_parses(self):
+        for digits in ["0101101", "1", "00", "1101011010"]:
+            tokens = _binary(digits)
+            parse(SmallGrammar, _binary("1" * 12))
+            reused = parse(SmallGrammar, tokens)
+            arena = self.get_last_arena()
+            arena.slots, saved = ChartArena().slots, arena.slots
+            try:
+                expected = parse(SmallGrammar, tokens)
+            finally:
+                arena.slots = saved
+            self.assertTrue(expected.equals(reused))
+
+    def test_chart_grows_geometrically(self):
+        arena = ChartArena()
+        arena.acquire(10)
+        self.assertEqual(len(arena.slots), 10)
+        arena.acquire(11)
+        self.assertEqual(len(arena.slots), 20)
+
+    def test_large_chart_not_retained(self):
+        arena = ChartArena(max_retained=10)
+        arena.acquire(20)
+        arena.release(20)
+        self.assertEqual(arena.slots, [])
+
+    def test_arena_outlives_thread(self):
+        thread = threading.Thread(target=parse, args=(SmallGrammar, _binary("01")))
+        thread.start()
+        thread.join()
+        arena = self.get_last_arena()
+        self.assertGreater(len(arena.slots), 0)
+        parse(SmallGrammar, _binary("0110"))
+        self.assertIs(self.get_last_arena(), arena)
+
+    def test_arenas_not_shared_by_concurrent_parses(self):
+        first = checkout_arena()
+        second = checkout_arena()
+        try:
+            self.assertIsNot(first, second)
+        finally:
+            return_arena(second)
+            return_arena(first)
+
+
+class ParseSpecializedTests(TestCase):
+    def test_falls_back_to_cyk(self):
+        tokens = _binary("0110")
+        self.assertTrue(
+            parse_specialized(SmallGrammar, tokens).equals(parse(SmallGrammar, tokens))
+        )
+
+    def test_uses_generated_function(self):
+        parsed = list()
+
+        class SpecializedGrammar(SmallGrammar):
+            @staticmethod
+            def specialized_parse(tokens):
+                parsed.append(tokens)
+                return parse(SmallGrammar, tokens)
+
+        tokens = _binary("01")
+        self.assertTrue(
+            parse_specialized(SpecializedGrammar, tokens).equals(
+                parse(SmallGrammar, tokens)
+            )
+        )
+        self.assertEqual(parsed, [tokens])
+
+    def assertIdentical(self, expected, actual):
+        if expected is None or actual is None:
+            self.assertIs(expected, actual)
+            return
+        self.assertEqual(expected.symbol, actual.symbol)
+        self.assertEqual(expected.weight, actual.weight)
+        self.assertEqual(expected.annotations, actual.annotations)
+        self.assertIs(expected.value, actual.value)
+        self.assertIdentical(expected.lchild, actual.lchild)
+        self.assertIdentical(expected.rchild, actual.rchild)
+
+    def test_generated_function_builds_same_trees(self):
+        grammar = google.ArgumentsGrammar
+        self.assertIsNotNone(grammar.specialized_parse)
+        for section in [
+            "Args:\n    x: The x.\n",
+            "Args:\n    x (int): The x.\n        More.\n    y: The y.\n",
+            "Args:\n    x: The x.  # noqa: DAR103\n",
+            "Args:\n    x:\n    y (): The y.\n",
+            "Args:\n    x (int The x.\n",
+            "Args:\n        x: Indented too far.\n",
+            "Args:\n    x: The x.\n  y: Not indented enough.\n",
+            "Args:\nx: Not indented.\n",
+        ]:
+            tokens = condense(lex(section))
+            with self.subTest(section=section):
+                self.assertIdentical(
+                    parse(grammar, tokens), grammar.specialized_parse(tokens)
+                )
+
+
 def verify_implementation():
     """Run many iterations and report the data for analysis.
 
@@ -0,0 +1,89 @@
+from unittest import TestCase
+
+from darglint2.docstring.detect import detect_style
+from darglint2.docstring.style import DocstringStyle
+
+GOOGLE = """Add the numbers.
+
+Args:
+    x: The first.
+    y: The second.
+
+Returns:
+    The sum.
+
+"""
+
+SPHINX = """Add the numbers.
+
+:param x: The first.
+:type x: int
+:param y: The second.
+:returns: The sum.
+:rtype: int
+
+"""
+
+NUMPY = """Add the numbers.
+
+Parameters
+----------
+x : int
+    The first.
+
+Returns
+-------
+int
+    The sum.
+
+"""
+
+
+class DetectStyleTestCase(TestCase):
+    def test_google(self):
+        self.assertEqual(detect_style(GOOGLE), DocstringStyle.GOOGLE)
+
+    def test_sphinx(self):
+        self.assertEqual(detect_style(SPHINX), DocstringStyle.SPHINX)
+
+    def test_numpy(self):
+        self.assertEqual(detect_style(NUMPY), DocstringStyle.NUMPY)
+
+    def test_short_description_is_google(self):
+        self.assertEqual(detect_style("Add the numbers."), DocstringStyle.GOOGLE)
+        self.assertEqual(detect_style(""), DocstringStyle.GOOGLE)
+
+    def test_list_item_is_not_a_numpy_section(self):
+        docstring = "\n".join(
+            [
+                "Add the numbers, which may be",
+                "- ints, or",
+                "- floats.",
+                "",
+                ":param x: The first.",
+            ]
+        )
+        self.assertEqual(detect_style(docstring), DocstringStyle.SPHINX)
+
+    def test_colon_in_title_is_not_a_numpy_section(self):
+        docstring = "\n".join(
+            [
+                "Args: x, and then",
+                "-----",
+            ]
+        )
+        self.assertEqual(detect_style(docstring), DocstringStyle.GOOGLE)
+
+    def test_most_sections_win(self):
+        docstring = "\n".join(
+            [
+                "Add the numbers.",
+                "",
+                "Args:",
+                "    x: The first.",
+                "",
+                ":returns: The sum.",
+                ":rtype: int",
+            ]
+        )
+        self.assertEqual(detect_style(docstring), DocstringStyle.SPHINX)
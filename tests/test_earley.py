@@ -0,0 +1,138 @@
+"""Tests for the predictive chart parser.
+
+The chart parser must build exactly the trees the CYK parser builds,
+so these tests are differential: each input is parsed by both, and
+the trees compared node by node.
+
+"""
+
+import random
+from unittest import TestCase
+
+from darglint2 import profiling
+from darglint2.lex import condense, lex
+from darglint2.parse import google, numpy, sphinx
+from darglint2.parse.cyk import parse as cyk_parse
+from darglint2.parse.earley import parse
+from darglint2.parse.fast_path import parse_section
+from darglint2.parse.grammar import CYK, EARLEY, BaseGrammar
+from darglint2.token import Token
+
+from .test_cyk import (
+    AKT,
+    AmbiguousKlingonGrammar,
+    ErrorKlingonGrammar,
+    PhoneNumberGrammar,
+    SmallGrammar,
+    _binary,
+    ekg_lex,
+    pn_lex,
+)
+from .test_fast_path import GoogleFastPathTest, _assert_identical
+
+WORDS = [
+    "x",
+    "int",
+    "Args",
+    "Returns",
+    "Raises",
+    "Yields",
+    "Parameters",
+    "----",
+    ":",
+    "x:",
+    "(",
+    ")",
+    "#",
+    "noqa",
+    ":param",
+    ":returns:",
+    ":type",
+    "\n",
+    "\n\n",
+    "\n    ",
+]
+
+
+class EarleyTest(TestCase):
+    def assertSameTree(self, grammar, tokens):
+        _assert_identical(self, cyk_parse(grammar, tokens), parse(grammar, tokens))
+
+    def test_small_grammars(self):
+        for digits in ["0", "01", "1101011010"]:
+            self.assertSameTree(SmallGrammar, _binary(digits))
+        for sentence in ["qet loD", "qam qet", "qam qet loD", "qam qIp loD"]:
+            self.assertSameTree(ErrorKlingonGrammar, ekg_lex(sentence))
+
+    def test_ties_broken_by_weight(self):
+        for number in ["983-32", "1-1.1-1", "3829279-32879.1", "1.1"]:
+            self.assertSameTree(PhoneNumberGrammar, pn_lex(number))
+
+    def test_ambiguous_grammar(self):
+        r = random.Random(0)
+        for _ in range(50):
+            tokens = [
+                Token(value="x", token_type=r.choice(list(AKT)), line_number=0)
+                for _ in range(r.randint(1, 8))
+            ]
+            self.assertSameTree(AmbiguousKlingonGrammar, tokens)
+
+    def test_duplicate_symbols(self):
+        r = random.Random(0)
+        for _ in range(50):
+            sentence = " ".join(
+                r.choice(["qam", "qet", "qIp", "loD"]) for _ in range(r.randint(1, 8))
+            )
+            self.assertSameTree(ErrorKlingonGrammar, ekg_lex(sentence))
+
+    def test_empty_section(self):
+        self.assertIsNone(parse(SmallGrammar, []))
+
+    def test_random_sections(self):
+        r = random.Random(0)
+        for _ in range(100):
+            text = "".join(
+                r.choice(WORDS) + r.choice(["", " "]) for _ in range(r.randint(1, 20))
+            )
+            tokens = condense(lex(text))
+            for module in [google, sphinx, numpy]:
+                for grammar in module.lookup(tokens, r.randint(0, 1)):
+                    if isinstance(grammar, type):
+                        self.assertSameTree(grammar, tokens)
+
+    def test_google_sections(self):
+        r = random.Random(0)
+        generator = GoogleFastPathTest()
+        for _ in range(100):
+            sections = google.top_parse(condense(lex(generator.random_section(r))))
+            for i, section in enumerate(sections):
+                for grammar in google.lookup(section, i):
+                    if isinstance(grammar, type):
+                        self.assertSameTree(grammar, section)
+
+
+class EngineSelectionTest(TestCase):
+    def tearDown(self):
+        profiling.disable()
+        google.ReturnsGrammar.engine = EARLEY
+
+    def get_phases(self, grammar):
+        tokens = condense(lex("Returns:\n    x # y"))
+        profiler = profiling.enable()
+        parse_section(grammar, tokens, {})
+        profiling.disable()
+        return {x["name"] for x in profiler.get_phases()}
+
+    def test_cyk_by_default(self):
+        self.assertEqual(BaseGrammar.engine, CYK)
+        self.assertIn(
+            "cyk: ShortDescriptionGrammar",
+            self.get_phases(google.ShortDescriptionGrammar),
+        )
+
+    def test_grammars_opt_in_to_earley(self):
+        self.assertIn("earley: ReturnsGrammar", self.get_phases(google.ReturnsGrammar))
+
+    def test_engine_selected_per_grammar(self):
+        google.ReturnsGrammar.engine = CYK
+        self.assertIn("cyk: ReturnsGrammar", self.get_phases(google.ReturnsGrammar))
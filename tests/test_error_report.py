@@ -5,8 +5,8 @@ from unittest import TestCase
 
 from darglint2.config import Configuration
 from darglint2.error_report import ErrorReport
-from darglint2.errors import EmptyDescriptionError
-from darglint2.function_description import get_function_descriptions
+from darglint2.errors import EmptyDescriptionError, PythonSyntaxError
+from darglint2.function_description import FunctionLocation, get_function_descriptions
 
 
 def _get_function_description(program):
@@ -105,3 +105,64 @@ class ErrorReportMessageTemplateTest(TestCase):
             # This will raise an error if the template
             # parameters are incorrect.
             str(error_report)
+
+
+class ErrorReportLocationTest(TestCase):
+    """Test that errors are reported by their function's location."""
+
+    def test_errors_do_not_keep_function_node(self):
+        """Make sure errors only hold a location for the function."""
+        function = _get_function_description(
+            "\n".join(
+                [
+                    "@decorator",
+                    "def f(",
+                    "    x):",
+                    '    """Do something."""',
+                    "    pass",
+                ]
+            )
+        )
+        error = EmptyDescriptionError(function.function, "x")
+        self.assertIsInstance(error.function, FunctionLocation)
+        self.assertEqual(
+            error.function,
+            FunctionLocation(
+                lineno=2,
+                name="f",
+                line_numbers=(2, 3),
+                decorators=1,
+            ),
+        )
+        self.assertFalse(
+            any(isinstance(x, ast.AST) for x in vars(error).values()),
+        )
+
+    def test_errors_grouped_and_sorted_by_location(self):
+        first = FunctionLocation(1, "a", (1, 1), 0)
+        second = FunctionLocation(5, "b", (5, 6), 0)
+        errors = [
+            EmptyDescriptionError(second, "y", line_numbers=(2, 2)),
+            EmptyDescriptionError(first, "x", line_numbers=(1, 1)),
+            EmptyDescriptionError(second, "z", line_numbers=(1, 1)),
+        ]
+        with Configuration(message_template="{line}:{obj}:{msg}").context():
+            error_report = ErrorReport(errors=errors, filename="a.py", verbosity=1)
+            self.assertEqual(list(error_report.error_dict), [first, second])
+            self.assertEqual(
+                str(error_report).split("\n"),
+                ["3:a:e x", "8:b:e z", "9:b:e y"],
+            )
+
+    def test_syntax_error_reported_at_its_line(self):
+        try:
+            ast.parse("x = 1\ndef f(:\n")
+        except SyntaxError as e:
+            error = PythonSyntaxError(e)
+        with Configuration(message_template="{line} {msg_id}").context():
+            error_report = ErrorReport(errors=[error], filename="a.py")
+            self.assertEqual(str(error_report), "2 DAR000")
+            self.assertEqual(
+                [line for line, _, _ in error_report.flake8_report()],
+                [2],
+            )
@@ -0,0 +1,284 @@
+"""Tests for the fast paths which stand in for CYK on canonical sections.
+
+The fast paths are only correct if they build exactly the tree the CYK
+parser would build, so most of these tests are differential: sections
+are generated (or taken from this repository's own docstrings), and
+every section a fast path accepts is also parsed by CYK, and the two
+trees compared node by node.
+
+"""
+
+import ast
+import os
+import random
+from unittest import TestCase
+
+from darglint2.lex import condense, lex
+from darglint2.parse import google, numpy, sphinx
+from darglint2.parse.cyk import parse as cyk_parse
+from darglint2.parse.fast_path import Rejected, TreeBuilder, parse_section
+from darglint2.token import Token, TokenType
+
+WORDS = [
+    "x",
+    "value",
+    "int",
+    "List[int]",
+    "The value.",
+    "(a)",
+    "b:",
+    ":",
+    "#",
+    "noqa",
+    "Returns",
+]
+
+
+def _assert_identical(test, expected, actual, path="root"):
+    if expected is None or actual is None:
+        test.assertIs(expected, actual, path)
+        return
+    test.assertEqual(expected.symbol, actual.symbol, path)
+    test.assertEqual(expected.weight, actual.weight, path)
+    test.assertEqual(expected.annotations, actual.annotations, path)
+    test.assertIs(expected.value, actual.value, path)
+    path += "/" + expected.symbol
+    _assert_identical(test, expected.lchild, actual.lchild, path + "<")
+    _assert_identical(test, expected.rchild, actual.rchild, path + ">")
+
+
+class DifferentialTestCase(TestCase):
+    def assertSameTrees(self, module, docstring):
+        """Assert the fast paths agree with CYK for each section.
+
+        Args:
+            module: The parser module for the docstring's style.
+            docstring: The docstring to split into sections.
+
+        Returns:
+            The number of sections accepted by a fast path.
+
+        """
+        accepted = 0
+        for section in module.top_parse(condense(lex(docstring))):
+            for grammar, fast_path in module.FAST_PATHS.items():
+                try:
+                    actual = fast_path(section)
+                except Rejected:
+                    continue
+                accepted += 1
+                _assert_identical(self, cyk_parse(grammar, section), actual)
+        return accepted
+
+
+def _random_line(r, indent):
+    return " " * 4 * indent + " ".join(r.choice(WORDS) for _ in range(r.randint(1, 3)))
+
+
+class GoogleFastPathTest(DifferentialTestCase):
+    def random_section(self, r):
+        keyword = r.choice(["Args", "Raises", "Returns", "Yields"])
+        lines = [keyword + ":"]
+        for _ in range(r.randint(1, 3)):
+            if keyword in ("Args", "Raises"):
+                head = r.choice(["x", "ValueError", "x (int)", "x(int)", ""])
+            else:
+                head = r.choice(["int", "", "List[int]"])
+            head += r.choice([":", ":", ""])
+            indent = r.choice([1, 1, 1, 2, 0])
+            lines.append(" " * 4 * indent + head + " " + _random_line(r, 0))
+            for _ in range(r.randint(0, 2)):
+                lines.append(_random_line(r, r.choice([1, 2, 3])))
+        return "Short.\n\n" + "\n".join(lines) + "\n\n"
+
+    def test_canonical_sections_accepted(self):
+        docstring = "\n".join(
+            [
+                "Short.",
+                "",
+                "Args:",
+                "    x (int): The first",
+                "        and more.",
+                "    y: Second.",
+                "",
+                "Returns:",
+                "    int: The value.",
+                "",
+                "Yields:",
+                "    The value.",
+                "",
+                "Raises:",
+                "    ValueError: If bad.",
+                "",
+            ]
+        )
+        self.assertEqual(self.assertSameTrees(google, docstring), 4)
+
+    def test_random_sections_identical(self):
+        r = random.Random(0)
+        accepted = 0
+        for _ in range(400):
+            accepted += self.assertSameTrees(google, self.random_section(r))
+        self.assertGreater(accepted, 0)
+
+    def test_own_docstrings_identical(self):
+        root = os.path.join(os.path.dirname(__file__), "..", "darglint2")
+        accepted = 0
+        for directory, _, filenames in os.walk(root):
+            for filename in filenames:
+                if not filename.endswith(".py"):
+                    continue
+                with open(os.path.join(directory, filename)) as fin:
+                    tree = ast.parse(fin.read())
+                for node in ast.walk(tree):
+                    if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                        continue
+                    docstring = ast.get_docstring(node)
+                    if docstring:
+                        accepted += self.assertSameTrees(google, docstring)
+        self.assertGreater(accepted, 100)
+
+    def long_section(self, items, lines):
+        section = ["Args:"]
+        for i in range(items):
+            section.append("    x{} (int): The value.".format(i))
+            section.extend(["        More about it."] * (lines - 1))
+        return "Short.\n\n" + "\n".join(section) + "\n\n"
+
+    def test_long_sections_identical(self):
+        self.assertEqual(self.assertSameTrees(google, self.long_section(10, 1)), 1)
+        self.assertEqual(self.assertSameTrees(google, self.long_section(2, 6)), 1)
+
+    def test_very_long_sections_accepted(self):
+        for items, lines in [(800, 1), (20, 4), (2, 400)]:
+            docstring = self.long_section(items, lines)
+            section = google.top_parse(condense(lex(docstring)))[1]
+            node = google.FAST_PATHS[google.ArgumentsGrammar](section)
+            self.assertEqual(node.symbol, "arguments-section")
+
+    def test_errors_left_to_cyk(self):
+        docstring = "\n".join(
+            [
+                "Short.",
+                "",
+                "Args:",
+                "    x: ",
+                "    y (int) The second.",
+                "",
+            ]
+        )
+        section = google.top_parse(condense(lex(docstring)))[1]
+        with self.assertRaises(Rejected):
+            google.FAST_PATHS[google.ArgumentsGrammar](section)
+
+
+class SphinxFastPathTest(DifferentialTestCase):
+    def test_canonical_sections_accepted(self):
+        docstring = "\n".join(
+            [
+                "Short.",
+                "",
+                ":param x: The x",
+                "    and more.",
+                "    And yet more.",
+                ":type x: int",
+                ":raises ValueError: If bad.",
+                ":returns: Something.",
+                ":rtype: int",
+                "",
+            ]
+        )
+        self.assertEqual(self.assertSameTrees(sphinx, docstring), 5)
+
+    def test_random_sections_identical(self):
+        keywords = ["param", "type", "var", "raises", "yield", "returns", "rtype"]
+        r = random.Random(0)
+        accepted = 0
+        for _ in range(400):
+            lines = list()
+            for _ in range(r.randint(1, 3)):
+                lines.append(
+                    ":{}{}: {}".format(
+                        r.choice(keywords),
+                        r.choice(["", " x", " int x"]),
+                        _random_line(r, 0),
+                    )
+                )
+                for _ in range(r.randint(0, 3)):
+                    lines.append(_random_line(r, r.choice([0, 1, 2])))
+            docstring = "Short.\n\n" + "\n".join(lines) + "\n" * r.randint(0, 2)
+            accepted += self.assertSameTrees(sphinx, docstring)
+        self.assertGreater(accepted, 0)
+
+
+class NumpyFastPathTest(DifferentialTestCase):
+    headers = {
+        "Parameters": "----------",
+        "Returns": "-------",
+        "Yields": "------",
+        "Raises": "------",
+    }
+
+    def test_canonical_sections_accepted(self):
+        docstring = "\n".join(
+            [
+                "Short.",
+                "",
+                "Parameters",
+                "----------",
+                "x : int",
+                "    The x",
+                "    and more.",
+                "y",
+                "    The y.",
+                "",
+                "Yields",
+                "------",
+                "int",
+                "    The value.",
+                "",
+                "Raises",
+                "------",
+                "ValueError",
+                "    If bad.",
+                "",
+            ]
+        )
+        self.assertEqual(self.assertSameTrees(numpy, docstring), 3)
+
+    def test_random_sections_identical(self):
+        r = random.Random(0)
+        accepted = 0
+        for _ in range(400):
+            sections = list()
+            for _ in range(r.randint(1, 2)):
+                keyword = r.choice(list(self.headers))
+                lines = [keyword, self.headers[keyword]]
+                for _ in range(r.randint(1, 3)):
+                    lines.append(r.choice(["x", "ValueError", "x : int", "x :", ""]))
+                    for _ in range(r.randint(0, 3)):
+                        lines.append(_random_line(r, r.choice([1, 1, 2, 0])))
+                sections.append("\n".join(lines))
+            docstring = "Short.\n\n" + "\n\n".join(sections) + "\n" * r.randint(0, 3)
+            accepted += self.assertSameTrees(numpy, docstring)
+        self.assertGreater(accepted, 0)
+
+
+class ParseSectionTest(TestCase):
+    def test_falls_back_to_cyk(self):
+        tokens = condense(lex("Args:\n    x The x.\n"))
+        grammar = google.ArgumentsGrammar
+
+        def reject(tokens):
+            raise Rejected
+
+        self.assertEqual(
+            parse_section(grammar, tokens, {grammar: reject}),
+            cyk_parse(grammar, tokens),
+        )
+
+    def test_builder_rejects_missing_derivation(self):
+        builder = TreeBuilder(google.ArgumentsGrammar)
+        token = Token(value="x", token_type=TokenType.WORD, line_number=0)
+        with self.assertRaises(Rejected):
+            builder.leaf("colon", token)
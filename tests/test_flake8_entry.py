@@ -0,0 +1,161 @@
+import argparse
+import ast
+import os
+import tempfile
+from unittest import TestCase
+
+from darglint2 import flake8_entry
+from darglint2.config import get_config
+from darglint2.docstring.style import DocstringStyle
+from darglint2.flake8_entry import DarglintChecker
+from darglint2.result_cache import ResultCache, get_key
+
+from .utils import reindent
+
+FUNCTION = r'''
+    def f{i}(x, y):
+        """Add the arguments.
+
+        Args:
+            x: The first.
+            z: Not an argument.
+
+        Raises:
+            ValueError: Never.
+
+        """
+        return x + y
+'''
+
+PROPERTY = r'''
+    class C{i}:
+        @property
+        def p(self):
+            """Get it.
+
+            Args:
+                x: Not an argument.
+
+            """
+            return 1
+
+        def m(self, x):
+            """Do it.
+
+            Returns:
+                Nothing.
+
+            """
+            pass
+'''
+
+
+class DarglintCheckerTests(TestCase):
+    def setUp(self):
+        self.program = "\n".join(reindent(FUNCTION.format(i=i)) for i in range(12))
+        self.tree = ast.parse(self.program)
+        self.jobs = DarglintChecker.jobs
+        self.jobs_threshold = DarglintChecker.jobs_threshold
+        self.result_cache = DarglintChecker.result_cache
+        self.config = DarglintChecker.config
+
+    def tearDown(self):
+        DarglintChecker.jobs = self.jobs
+        DarglintChecker.jobs_threshold = self.jobs_threshold
+        DarglintChecker.result_cache = self.result_cache
+        DarglintChecker.config = self.config
+        executor = flake8_entry._executor
+        if executor is not None:
+            flake8_entry._discard_executor(executor)
+            executor.shutdown()
+
+    def run_checker(self, jobs, jobs_threshold):
+        DarglintChecker.jobs = jobs
+        DarglintChecker.jobs_threshold = jobs_threshold
+        return list(DarglintChecker(self.tree, "example.py").run())
+
+    def test_workers_report_same_errors_in_same_order(self):
+        # Functions, methods and properties are interleaved, since
+        # they're found separately.
+        self.tree = ast.parse(
+            "\n".join(
+                reindent(template.format(i=i))
+                for i in range(6)
+                for template in [FUNCTION, PROPERTY]
+            )
+        )
+        serial = self.run_checker(jobs=1, jobs_threshold=1)
+        self.assertTrue(serial)
+        self.assertFalse(any("DAR000" in error[2] for error in serial))
+        lines = [error[0] for error in serial]
+        self.assertEqual(lines, sorted(lines))
+        for jobs in [2, 3]:
+            self.assertEqual(self.run_checker(jobs=jobs, jobs_threshold=10), serial)
+
+    def test_workers_are_reused(self):
+        self.run_checker(jobs=2, jobs_threshold=10)
+        executor = flake8_entry._executor
+        self.assertIsNotNone(executor)
+        self.run_checker(jobs=2, jobs_threshold=10)
+        self.assertIs(flake8_entry._executor, executor)
+
+    def test_small_file_is_checked_serially(self):
+        checker = DarglintChecker(self.tree, "example.py")
+        DarglintChecker.jobs = 2
+        DarglintChecker.jobs_threshold = 13
+        self.assertFalse(checker._use_workers([None] * 12))
+        DarglintChecker.jobs_threshold = 12
+        self.assertTrue(checker._use_workers([None] * 12))
+
+    def test_results_are_cached(self):
+        lines = self.program.splitlines(keepends=True)
+        with tempfile.TemporaryDirectory() as directory:
+            DarglintChecker.result_cache = ResultCache(directory)
+            errors = list(DarglintChecker(self.tree, "example.py", lines).run())
+            self.assertTrue(errors)
+            key = get_key(lines, DarglintChecker.config, 2)
+            self.assertEqual(
+                DarglintChecker.result_cache.get(key),
+                [error[:3] for error in errors],
+            )
+
+            # A cached report is served without checking the file.
+            DarglintChecker.result_cache.set(key, [(1, 0, "DAR101 cached")])
+            self.assertEqual(
+                list(DarglintChecker(None, "example.py", lines).run()),
+                [(1, 0, "DAR101 cached", DarglintChecker)],
+            )
+
+    def test_not_cached_without_lines(self):
+        with tempfile.TemporaryDirectory() as directory:
+            DarglintChecker.result_cache = ResultCache(directory)
+            checker = DarglintChecker(self.tree, "example.py")
+            self.assertIsNone(checker._get_cache_key())
+            list(checker.run())
+            self.assertEqual(os.listdir(directory), [])
+
+    def parse_options(self, **kwargs):
+        config = DarglintChecker.config
+        options = dict(
+            docstring_style=config.style.name,
+            strictness=config.strictness.name,
+            darglint2_ignore_regex=config.ignore_regex,
+            darglint2_jobs=1,
+            darglint2_jobs_threshold=DarglintChecker.jobs_threshold,
+            darglint2_cache=False,
+        )
+        options.update(kwargs)
+        DarglintChecker.parse_options(argparse.Namespace(**options))
+
+    def test_options_not_written_to_global_config(self):
+        self.parse_options(docstring_style="numpy", darglint2_ignore_regex="^_")
+        self.assertEqual(DarglintChecker.config.style, DocstringStyle.NUMPY)
+        self.assertEqual(DarglintChecker.config.ignore_regex, "^_")
+        self.assertTrue(DarglintChecker.config.frozen)
+        self.assertEqual(get_config().style, DocstringStyle.GOOGLE)
+        self.assertIsNone(get_config().ignore_regex)
+
+    def test_cache_is_opt_in(self):
+        for enabled in [False, True]:
+            self.parse_options(darglint2_cache=enabled)
+            self.assertEqual(DarglintChecker.result_cache is not None, enabled)
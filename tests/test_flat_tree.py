@@ -0,0 +1,145 @@
+"""Tests for the flat, array-backed parse tree."""
+
+from collections import deque
+from unittest import TestCase
+
+from darglint2.errors import DarglintError, EmptyDescriptionError
+from darglint2.flat_tree import FlatNode, FlatTree
+from darglint2.lex import condense, lex
+from darglint2.node import CykNode
+from darglint2.parse.google import parse
+from darglint2.parse.identifiers import ArgumentIdentifier, NoqaIdentifier
+from darglint2.token import Token, TokenType
+
+DOCSTRING = "\n".join(
+    [
+        "Short description.",
+        "",
+        "A longer description.  # noqa: DAR101 x",
+        "",
+        "Args:",
+        "    x (int): The first.",
+        "    y: The second, which has",
+        "        a longer description.",
+        "",
+        "Raises:",
+        "    ValueError: If it's wrong.",
+        "",
+        "Returns:",
+        "    The sum.",
+        "",
+    ]
+)
+
+
+def _right_first(root):
+    stack = deque([root])
+    while stack:
+        curr = stack.pop()
+        yield curr
+        if curr.lchild:
+            stack.append(curr.lchild)
+        if curr.rchild:
+            stack.append(curr.rchild)
+
+
+class FlatTreeTest(TestCase):
+    def setUp(self):
+        self.root = parse(condense(lex(DOCSTRING)))
+        self.tree = FlatTree(self.root)
+
+    def test_subtree_is_contiguous(self):
+        nodes = list(self.root.in_order_traverse())
+        self.assertEqual(len(self.tree), len(nodes))
+        for i in range(len(self.tree)):
+            subtree = self.tree.get_in_order(i)
+            self.assertEqual(sorted(subtree), list(range(i, self.tree.ends[i])))
+
+    def test_in_order_traverse_matches_cyk_node(self):
+        expected = [(node.symbol, node.value) for node in self.root.in_order_traverse()]
+        view = self.tree.get_node(0)
+        self.assertEqual(
+            [(node.symbol, node.value) for node in view.in_order_traverse()],
+            expected,
+        )
+
+    def test_views_match_cyk_nodes(self):
+        view = self.tree.get_node(0)
+        self.assertTrue(view.equals(self.root))
+        self.assertEqual(view.reconstruct_string(), self.root.reconstruct_string())
+        for node, view in zip(self.root.in_order_traverse(), view.in_order_traverse()):
+            self.assertIsInstance(view, CykNode)
+            self.assertEqual(view.symbol, node.symbol)
+            self.assertEqual(view.annotations, node.annotations)
+            self.assertEqual(view.line_numbers, node.line_numbers)
+            self.assertEqual(
+                [child.symbol for child in view.walk()],
+                [child.symbol for child in node.walk()],
+            )
+
+    def test_views_are_shared(self):
+        self.assertIs(self.tree.get_node(0), self.tree.get_node(0))
+        self.assertIs(self.tree.get_node(0).lchild, self.tree.get_node(1))
+
+    def test_index_in_order(self):
+        for key in ("arguments-section", ArgumentIdentifier.key, NoqaIdentifier.key):
+            expected = [
+                node
+                for node in self.root.in_order_traverse()
+                if node.symbol == key
+                or any(getattr(a, "key", None) == key for a in node.annotations)
+            ]
+            self.assertTrue(expected)
+            nodes = self.tree.get_nodes(key)
+            self.assertEqual(len(nodes), len(expected))
+            for view, node in zip(nodes, expected):
+                self.assertTrue(view.equals(node))
+
+    def test_missing_key_has_no_nodes(self):
+        self.assertEqual(self.tree.get_nodes("yields-section"), [])
+
+    def test_annotated_in_visitor_order(self):
+        root = CykNode(
+            "a",
+            lchild=CykNode(
+                "b",
+                lchild=CykNode(
+                    "c",
+                    value=Token("x", TokenType.WORD, 1),
+                    annotations=[EmptyDescriptionError],
+                ),
+                annotations=[EmptyDescriptionError],
+            ),
+            rchild=CykNode(
+                "d",
+                value=Token("y", TokenType.WORD, 2),
+                annotations=[EmptyDescriptionError],
+            ),
+            annotations=[EmptyDescriptionError],
+        )
+        tree = FlatTree(root)
+        self.assertEqual(
+            [tree.get_node(i).symbol for _, i in tree.get_annotated(DarglintError)],
+            [node.symbol for node in _right_first(root) if node.annotations],
+        )
+
+    def test_line_numbers_of_sparse_tree(self):
+        root = CykNode(
+            "a",
+            lchild=CykNode(
+                "b",
+                rchild=CykNode("c", value=Token("x", TokenType.WORD, 3)),
+            ),
+            rchild=CykNode("d", value=Token("y", TokenType.WORD, 5)),
+        )
+        tree = FlatTree(root)
+        for node, view in zip(
+            root.in_order_traverse(), tree.get_node(0).in_order_traverse()
+        ):
+            self.assertEqual(view.line_numbers, node.line_numbers)
+
+    def test_view_is_read_only(self):
+        view = self.tree.get_node(0)
+        self.assertIsInstance(view, FlatNode)
+        with self.assertRaises(AttributeError):
+            view.symbol = "other"  # type: ignore
@@ -2,7 +2,7 @@ import random
 from unittest import TestCase
 
 from darglint2.node import CykNode
-from darglint2.parse.identifiers import Path
+from darglint2.parse.identifiers import ArgumentIdentifier, ArgumentItemIdentifier, Path
 from darglint2.token import Token, TokenType
 
 
@@ -162,3 +162,52 @@ class PathTestCase(TestCase):
             node = self._random_node()
             path = self._random_path(depth=3)
             path.extract(node)
+
+    def _random_tree(self, depth=5):
+        if depth == 0 or random.random() < 0.2:
+            return _v()
+        return CykNode(
+            "node",
+            lchild=self._random_tree(depth - 1) if random.random() < 0.7 else None,
+            rchild=self._random_tree(depth - 1) if random.random() < 0.7 else None,
+        )
+
+    def test_compiled_path_matches_extract(self):
+        for _ in range(200):
+            node = self._random_tree()
+            path = Path.of(
+                "".join(random.choice("lr") for _ in range(random.randint(0, 2)))
+            )
+            self._random_branch_or_of(path, depth=3)
+            self.assertIs(path.compile()(node), path.extract(node))
+
+    def test_compiled_straight_path(self):
+        extract = Path.of("lrv").compile()
+        self.assertEqual(extract(_l(_r(_v()))), target)
+        self.assertIsNone(extract(_l(_l(_v()))))
+        self.assertIsNone(extract(_l(_r(_l(_v())))))
+
+    def test_compiled_branch_with_conditions(self):
+        extract = Path.branch(Path.if_left("lrv"), Path.of("rrv")).compile()
+        self.assertEqual(extract(_l(_r(_v()))), target)
+        self.assertEqual(extract(_r(_r(_v()))), target)
+        self.assertIsNone(extract(_l(_l(_v()))))
+
+    def test_compiled_path_can_extract_non_leaf(self):
+        node = _l(_r(_v()))
+        found = Path.of("lr").compile()(node)
+        self.assertIs(found, node.lchild.rchild)
+
+
+class IdentifierTestCase(TestCase):
+    def test_identifiers_extract_with_compiled_paths(self):
+        item = CykNode(
+            "item",
+            lchild=CykNode("head", value=Token("x", TokenType.WORD, 0)),
+            rchild=CykNode(
+                "rest",
+                lchild=CykNode("word", value=Token("y", TokenType.WORD, 0)),
+            ),
+        )
+        self.assertEqual(ArgumentItemIdentifier.extract(item), "x")
+        self.assertEqual(ArgumentIdentifier.extract(item), "y")
@@ -1,6 +1,7 @@
 import ast
-from unittest import TestCase, skip
+from unittest import TestCase, mock, skip
 
+from darglint2 import profiling
 from darglint2.docstring.style import DocstringStyle
 from darglint2.errors import (
     EmptyDescriptionError,
@@ -21,7 +22,12 @@ from darglint2.errors import (
     ReturnTypeMismatchError,
 )
 from darglint2.function_description import get_function_descriptions
-from darglint2.integrity_checker import IntegrityChecker
+from darglint2.integrity_checker import (
+    ANALYSIS_PASSES_BY_ERROR,
+    IntegrityChecker,
+    get_analysis_passes,
+)
+from darglint2.parse.ordering import grammar_statistics
 from darglint2.strictness import Strictness
 from darglint2.utils import ConfigurationContext
 
@@ -1682,3 +1688,133 @@ class StrictnessTests(TestCase):
             self.two_spaces_config,
             self.two_spaces_docstring,
         )
+
+
+class AnalysisPassesTestCase(TestCase):
+    """Tests that each check only consumes the passes declared for it."""
+
+    program = "\n".join(
+        [
+            "import abc",
+            "",
+            "def f(x: int, y) -> str:",
+            '    """Do things.',
+            "",
+            "    :param x: The x.",
+            "    :type x: str",
+            "    :param z: The z.",
+            "    :var w: The w.",
+            "    :raises IndexError: Never.",
+            "    :returns: Something.",
+            "    :rtype: int",
+            "    :yields: Something.",
+            "",
+            '    """',
+            "    v = x",
+            "    assert v",
+            "    try:",
+            "        raise ValueError()",
+            "    except KeyError:",
+            "        pass",
+            "    return",
+            "",
+            "def g(x):",
+            '    """Do other things.',
+            "",
+            "    Args:",
+            "        x: The x.",
+            "        z (int): The z.",
+            "",
+            "    Raises:",
+            "        AssertionError: Maybe.",
+            "",
+            '    """',
+            "    assert x",
+            "    yield x",
+            "    return x",
+            "",
+            "class A(abc.ABC):",
+            "    @abc.abstractmethod",
+            "    def h(self, x):",
+            '        """Not implemented."""',
+            "        raise NotImplementedError()",
+        ]
+    )
+
+    def get_errors(self, style, ignore, passes=None):
+        with ConfigurationContext(
+            ignore=ignore,
+            style=style,
+            strictness=Strictness.FULL_DESCRIPTION,
+            enable=["DAR104"],
+        ):
+            checker = IntegrityChecker()
+            functions = get_function_descriptions(
+                ast.parse(self.program),
+                passes=passes if passes is not None else checker.analysis_passes,
+            )
+            for function in functions:
+                checker.run_checks(function)
+            return sorted(
+                (error.error_code, error.function.name, error.message())
+                for error in checker.errors
+            )
+
+    def test_each_error_only_needs_its_passes(self):
+        all_passes = frozenset().union(*ANALYSIS_PASSES_BY_ERROR.values())
+        for style in DocstringStyle:
+            for error_code in ANALYSIS_PASSES_BY_ERROR:
+                ignore = [x for x in ANALYSIS_PASSES_BY_ERROR if x != error_code]
+                with self.subTest(style=style, error_code=error_code):
+                    self.assertEqual(
+                        self.get_errors(style, ignore),
+                        self.get_errors(style, ignore, all_passes),
+                    )
+
+    def test_google_skips_variables(self):
+        passes = get_analysis_passes(DocstringStyle.GOOGLE, [])
+        self.assertNotIn("variables", passes)
+        self.assertIn("variables", get_analysis_passes(DocstringStyle.SPHINX, []))
+
+    def test_ignored_excess_variables_not_reported(self):
+        errors = self.get_errors(DocstringStyle.SPHINX, ["DAR501"])
+        self.assertNotIn("DAR501", [error_code for error_code, _, _ in errors])
+
+    def test_ignored_errors_skip_passes(self):
+        passes = get_analysis_passes(DocstringStyle.GOOGLE, ["DAR401", "DAR402"])
+        self.assertNotIn("raises", passes)
+        self.assertNotIn("asserts", passes)
+        self.assertIn("returns", passes)
+
+    def test_auto_checks_each_docstring_in_its_style(self):
+        sphinx = [x for x in self.get_errors(DocstringStyle.SPHINX, []) if x[1] == "f"]
+        google = [x for x in self.get_errors(DocstringStyle.GOOGLE, []) if x[1] != "f"]
+        self.assertTrue(sphinx)
+        self.assertTrue(google)
+        self.assertEqual(
+            self.get_errors(DocstringStyle.AUTO, []), sorted(sphinx + google)
+        )
+
+    def test_auto_lexes_each_docstring_once(self):
+        # The docstrings parse the tokens the style was detected from.
+        grammar_statistics.clear()
+        profiler = profiling.enable()
+        try:
+            with mock.patch("darglint2.docstring.google.lex") as google, mock.patch(
+                "darglint2.docstring.sphinx.lex"
+            ) as sphinx:
+                self.get_errors(DocstringStyle.AUTO, [])
+        finally:
+            profiling.disable()
+        self.assertFalse(google.called)
+        self.assertFalse(sphinx.called)
+        calls = {x["name"]: x["calls"] for x in profiler.get_phases()}
+        self.assertEqual(calls["lex/condense"], 3)
+        self.assertEqual(grammar_statistics.get_styles(), {"google": 2, "sphinx": 1})
+        grammar_statistics.clear()
+
+    def test_auto_runs_every_pass(self):
+        self.assertEqual(
+            get_analysis_passes(DocstringStyle.AUTO, []),
+            frozenset().union(*ANALYSIS_PASSES_BY_ERROR.values()),
+        )
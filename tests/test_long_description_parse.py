@@ -199,3 +199,37 @@ class LongDescriptionParserTestCase(TestCase):
                 noqa,
                 individual_node,
             )
+
+    def test_words_chained_down_the_right(self):
+        node = self.parse_string("a\nb")
+        self.assertEqual(
+            str(node),
+            "\n".join(
+                [
+                    "long-description",
+                    "  TokenType.WORD: 'a'",
+                    "  long-description1",
+                    "    TokenType.NEWLINE: '\\n'",
+                    "    long-description1",
+                    "      TokenType.WORD: 'b'",
+                ]
+            ),
+        )
+
+    def test_noqa_wraps_preceding_word(self):
+        node = self.parse_string("a # noqa\nb")
+        self.assertEqual(node.lchild.symbol, "long-description1")
+        self.assertEqual(node.lchild.lchild.value.value, "a")
+        self.assertIn(NoqaIdentifier, node.lchild.rchild.annotations)
+        self.assertEqual(node.rchild.lchild.value.value, "b")
+        self.assertIsNone(node.rchild.rchild)
+
+    def test_very_long_description(self):
+        lines = ["Some words, and a few more words."] * 5000
+        tokens = condense(lex("\n".join(lines)))
+        node = parse(tokens)
+        words = list()
+        while node:
+            words.append(node.lchild.value or node.lchild.lchild.value)
+            node = node.rchild
+        self.assertEqual(words, tokens)
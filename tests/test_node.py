@@ -4,6 +4,7 @@ from random import randint
 from unittest import TestCase
 
 from darglint2.node import CykNode
+from darglint2.token import Token, TokenType
 
 
 class CykNodeTest(TestCase):
@@ -40,3 +41,41 @@ class CykNodeTest(TestCase):
             self.build_binary_search_tree(node, randint(-100, 100))
         values = [x.value for x in node.in_order_traverse()]
         self.assertIsSorted(values)
+
+    def test_walks_on_deep_tree(self):
+        # Deeper than the recursion limit, as a long description
+        # can be.
+        depth = 5000
+        root = CykNode(symbol="word", value=Token("x", TokenType.WORD, depth - 1))
+        for i in range(depth - 2, -1, -1):
+            root = CykNode(
+                symbol="chain",
+                lchild=CykNode(symbol="word", value=Token("x", TokenType.WORD, i)),
+                rchild=root,
+            )
+        self.assertEqual(
+            [x.value.line_number for x in root.in_order_traverse() if x.value],
+            list(range(depth)),
+        )
+        self.assertEqual(root.line_numbers, (0, depth - 1))
+        self.assertEqual(root.rchild.line_numbers, (1, depth - 1))
+        self.assertEqual(len(str(root).splitlines()), 2 * depth - 1)
+        self.assertTrue(root.equals(root))
+        self.assertEqual(len(root.reconstruct_string().split()), depth)
+
+    def test_line_numbers_from_leftmost_and_rightmost_tokens(self):
+        node = CykNode(
+            symbol="a",
+            lchild=CykNode(
+                symbol="b",
+                lchild=CykNode(symbol="c", value=Token("x", TokenType.WORD, 3)),
+            ),
+            rchild=CykNode(
+                symbol="d",
+                lchild=CykNode(symbol="e", value=Token("y", TokenType.WORD, 5)),
+                rchild=CykNode(symbol="f", value=Token("z", TokenType.WORD, 7)),
+            ),
+        )
+        self.assertEqual(node.line_numbers, (3, 7))
+        self.assertEqual(node.lchild.line_numbers, (3, 3))
+        self.assertEqual(node.rchild.line_numbers, (5, 7))
@@ -0,0 +1,159 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from darglint2.lex import condense, lex
+from darglint2.parse import google
+from darglint2.parse.combinator import section_cache
+from darglint2.parse.grammars.google_returns_section import ReturnsGrammar
+from darglint2.parse.grammars.google_returns_section_without_type import (
+    ReturnsWithoutTypeGrammar,
+)
+from darglint2.parse.grammars.google_short_description import ShortDescriptionGrammar
+from darglint2.parse.long_description import parse as long_description_parse
+from darglint2.parse.ordering import (
+    GrammarStatistics,
+    are_disjoint,
+    get_alphabet,
+    get_required,
+    grammar_statistics,
+)
+from darglint2.token import TokenType
+
+RETURNS = [
+    ShortDescriptionGrammar,
+    ReturnsGrammar,
+    ReturnsWithoutTypeGrammar,
+    long_description_parse,
+]
+
+
+def _tree(node):
+    nodes = list()
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if node is None:
+            nodes.append(None)
+            continue
+        value = node.value
+        if value is not None:
+            value = (value.token_type, value.value, value.line_number)
+        nodes.append((node.symbol, value, node.annotations))
+        stack.extend([node.rchild, node.lchild])
+    return nodes
+
+
+class DisjointTestCase(TestCase):
+    def test_short_description_has_no_newline(self):
+        self.assertNotIn(TokenType.NEWLINE, get_alphabet(ShortDescriptionGrammar))
+        self.assertIn(TokenType.NEWLINE, get_required(ReturnsGrammar))
+        self.assertIn(TokenType.RETURNS, get_required(ReturnsGrammar))
+        self.assertTrue(are_disjoint(ShortDescriptionGrammar, ReturnsGrammar))
+        self.assertTrue(are_disjoint(ReturnsGrammar, ShortDescriptionGrammar))
+
+    def test_overlapping_grammars_are_not_disjoint(self):
+        self.assertFalse(are_disjoint(ReturnsGrammar, ReturnsWithoutTypeGrammar))
+
+
+class GrammarStatisticsTestCase(TestCase):
+    def setUp(self):
+        self.statistics = GrammarStatistics()
+
+    def record(self, parser, successes, failures):
+        for _ in range(successes):
+            self.statistics.record(RETURNS, parser, True)
+        for _ in range(failures):
+            self.statistics.record(RETURNS, parser, False)
+
+    def test_fixed_order_without_counts(self):
+        self.assertEqual(self.statistics.order(RETURNS), RETURNS)
+
+    def test_likely_disjoint_grammar_tried_first(self):
+        self.record(ReturnsGrammar, 10, 0)
+        self.assertEqual(
+            self.statistics.order(RETURNS),
+            [
+                ReturnsGrammar,
+                ShortDescriptionGrammar,
+                ReturnsWithoutTypeGrammar,
+                long_description_parse,
+            ],
+        )
+
+    def test_overlapping_grammars_keep_their_order(self):
+        self.record(ShortDescriptionGrammar, 0, 10)
+        self.record(ReturnsGrammar, 0, 10)
+        self.record(ReturnsWithoutTypeGrammar, 10, 0)
+        self.assertEqual(self.statistics.order(RETURNS), RETURNS)
+
+    def test_functions_are_not_moved(self):
+        self.record(ShortDescriptionGrammar, 0, 10)
+        self.record(ReturnsGrammar, 0, 10)
+        self.record(ReturnsWithoutTypeGrammar, 0, 10)
+        self.record(long_description_parse, 10, 0)
+        self.assertEqual(self.statistics.order(RETURNS), RETURNS)
+
+    def test_ties_keep_fixed_order(self):
+        self.record(ShortDescriptionGrammar, 5, 5)
+        self.record(ReturnsGrammar, 5, 5)
+        self.assertEqual(self.statistics.order(RETURNS), RETURNS)
+
+    def test_saved_counts_are_loaded(self):
+        self.record(ShortDescriptionGrammar, 0, 10)
+        self.record(ReturnsGrammar, 10, 0)
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "statistics.json")
+            self.statistics.save(filename)
+            loaded = GrammarStatistics()
+            loaded.load(filename)
+        self.assertEqual(loaded.order(RETURNS), self.statistics.order(RETURNS))
+        self.assertEqual(
+            loaded.get_rate(RETURNS, ReturnsGrammar),
+            self.statistics.get_rate(RETURNS, ReturnsGrammar),
+        )
+
+    def test_saved_styles_are_loaded(self):
+        self.statistics.record_style("google")
+        self.statistics.record_style("google")
+        self.statistics.record_style("numpy")
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "statistics.json")
+            self.statistics.save(filename)
+            loaded = GrammarStatistics()
+            loaded.record_style("numpy")
+            loaded.load(filename)
+        self.assertEqual(loaded.get_styles(), {"google": 2, "numpy": 2})
+
+
+class AdaptiveOrderTestCase(TestCase):
+    docstrings = [
+        "Returns the sum.",
+        "Returns:\n    The sum.\n\n",
+        "Returns:\n    int: The sum.\n\nArgs:\n    x: The x.\n",
+        "Returns: the sum.\n\nRaises:\n    ValueError: Never.\n",
+        "Returns:\n    The sum\n  badly indented: here.\n",
+    ]
+
+    def setUp(self):
+        section_cache.clear()
+        grammar_statistics.clear()
+
+    def tearDown(self):
+        section_cache.clear()
+        grammar_statistics.clear()
+
+    def parse_all(self):
+        return [
+            _tree(google.parse(condense(lex(docstring))))
+            for docstring in self.docstrings
+        ]
+
+    def test_same_trees_as_fixed_order(self):
+        expected = self.parse_all()
+        for _ in range(20):
+            grammar_statistics.record(RETURNS, ShortDescriptionGrammar, False)
+            grammar_statistics.record(RETURNS, ReturnsGrammar, True)
+        self.assertNotEqual(grammar_statistics.order(RETURNS), RETURNS)
+        section_cache.clear()
+        self.assertEqual(self.parse_all(), expected)
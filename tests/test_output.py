@@ -0,0 +1,156 @@
+"""Tests for the structured output writers."""
+
+import ast
+import io
+import json
+from unittest import TestCase
+
+from darglint2.error_report import ErrorReport
+from darglint2.errors import (
+    DarglintError,
+    EmptyDescriptionError,
+    MissingParameterError,
+    PythonSyntaxError,
+)
+from darglint2.function_description import FunctionLocation
+from darglint2.output import JsonLinesWriter, SarifWriter, get_error_classes
+
+LOCATION = FunctionLocation(
+    lineno=3,
+    name="f",
+    line_numbers=(3, 3),
+    decorators=0,
+)
+
+
+def _get_syntax_error():
+    try:
+        ast.parse("def f(:\n")
+    except SyntaxError as e:
+        return PythonSyntaxError(e)
+
+
+class GetErrorClassesTest(TestCase):
+    def test_all_error_codes_listed_once(self):
+        codes = [x.error_code for x in get_error_classes()]
+        self.assertEqual(codes, sorted(set(codes)))
+        self.assertNotIn(DarglintError, get_error_classes())
+        self.assertIn(MissingParameterError, get_error_classes())
+
+
+class JsonLinesWriterTest(TestCase):
+    def test_one_record_per_error(self):
+        stream = io.StringIO()
+        writer = JsonLinesWriter(stream)
+        writer.start()
+        writer.write(
+            ErrorReport(
+                [
+                    EmptyDescriptionError(LOCATION, "x", line_numbers=(2, 2)),
+                    MissingParameterError(LOCATION, "y"),
+                ],
+                "a.py",
+            )
+        )
+        writer.write(ErrorReport([], "b.py"))
+        writer.write(ErrorReport([_get_syntax_error()], "c.py"))
+        writer.finish()
+        records = [json.loads(line) for line in stream.getvalue().splitlines()]
+        self.assertEqual(
+            records,
+            [
+                {
+                    "path": "a.py",
+                    "line": 3,
+                    "code": "DAR101",
+                    "message": "- y",
+                    "function": "f",
+                },
+                {
+                    "path": "a.py",
+                    "line": 6,
+                    "code": "DAR002",
+                    "message": "e x",
+                    "function": "f",
+                },
+                {
+                    "path": "c.py",
+                    "line": 1,
+                    "code": "DAR000",
+                    "message": records[2]["message"],
+                    "function": "",
+                },
+            ],
+        )
+
+    def test_verbosity_changes_message(self):
+        stream = io.StringIO()
+        writer = JsonLinesWriter(stream, verbosity=2)
+        writer.write(ErrorReport([MissingParameterError(LOCATION, "y")], "a.py"))
+        record = json.loads(stream.getvalue())
+        self.assertEqual(
+            record["message"],
+            "Missing parameter(s) in Docstring: - y",
+        )
+
+
+class SarifWriterTest(TestCase):
+    def get_log(self, *reports):
+        stream = io.StringIO()
+        writer = SarifWriter(stream)
+        writer.start()
+        for report in reports:
+            writer.write(report)
+        writer.finish()
+        return json.loads(stream.getvalue())
+
+    def test_empty_log_is_valid(self):
+        log = self.get_log()
+        self.assertEqual(log["version"], "2.1.0")
+        self.assertEqual(log["runs"][0]["results"], [])
+
+    def test_rules_emitted_once(self):
+        log = self.get_log(
+            ErrorReport([MissingParameterError(LOCATION, "x")], "a.py"),
+            ErrorReport([MissingParameterError(LOCATION, "y")], "b.py"),
+        )
+        rules = log["runs"][0]["tool"]["driver"]["rules"]
+        self.assertEqual(
+            [rule["id"] for rule in rules],
+            [x.error_code for x in get_error_classes()],
+        )
+        self.assertEqual(
+            rules[[rule["id"] for rule in rules].index("DAR101")],
+            {
+                "id": "DAR101",
+                "name": "MissingParameterError",
+                "shortDescription": {"text": MissingParameterError.description},
+            },
+        )
+
+    def test_results_reference_rules(self):
+        log = self.get_log(
+            ErrorReport([MissingParameterError(LOCATION, "x")], "a.py"),
+            ErrorReport([_get_syntax_error()], "/tmp/b c.py"),
+        )
+        rules = log["runs"][0]["tool"]["driver"]["rules"]
+        results = log["runs"][0]["results"]
+        self.assertEqual(len(results), 2)
+        for result in results:
+            self.assertEqual(rules[result["ruleIndex"]]["id"], result["ruleId"])
+        self.assertEqual(
+            results[0]["locations"],
+            [
+                {
+                    "physicalLocation": {
+                        "artifactLocation": {"uri": "a.py"},
+                        "region": {"startLine": 3},
+                    },
+                    "logicalLocations": [{"name": "f", "kind": "function"}],
+                }
+            ],
+        )
+        self.assertEqual(
+            results[1]["locations"][0]["physicalLocation"]["artifactLocation"],
+            {"uri": "file:///tmp/b%20c.py"},
+        )
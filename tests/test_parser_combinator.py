@@ -1,11 +1,21 @@
 from unittest import TestCase
 
+from darglint2.lex import condense
+from darglint2.lex import lex as lex_docstring
 from darglint2.node import CykNode
-from darglint2.parse.combinator import parser_combinator
+from darglint2.parse import google
+from darglint2.parse.combinator import (
+    SectionCache,
+    clone,
+    join_balanced,
+    parser_combinator,
+    section_cache,
+)
 from darglint2.parse.cyk import parse
 from darglint2.parse.grammar import BaseGrammar
 from darglint2.parse.grammar import Production as P
 from darglint2.token import BaseTokenType, Token
+from darglint2.utils import ConfigurationContext
 
 
 class PoetryTokenType(BaseTokenType):
@@ -151,3 +161,144 @@ class ParserCombinatorTests(TestCase):
             self.assertTrue(
                 total.equals(combined),
             )
+
+
+class JoinBalancedTests(TestCase):
+    def get_height(self, node):
+        height = 0
+        level = [node]
+        while level:
+            height += 1
+            level = [x for n in level for x in (n.lchild, n.rchild) if x]
+        return height
+
+    def test_no_nodes(self):
+        node = join_balanced("docstring", [])
+        self.assertEqual(node.symbol, "docstring")
+        self.assertIsNone(node.lchild)
+
+    def test_single_node_not_wrapped(self):
+        section = CykNode("section")
+        self.assertIs(join_balanced("docstring", [section]), section)
+
+    def test_balanced_and_in_order(self):
+        sections = [CykNode("section{}".format(i)) for i in range(1000)]
+        node = join_balanced("docstring", sections)
+        self.assertEqual(
+            [x for x in node.in_order_traverse() if x.symbol != "docstring"],
+            sections,
+        )
+        self.assertEqual(self.get_height(node), 11)
+
+    def test_docstring_sections_balanced(self):
+        docstring = "\n\n".join(["Short."] + ["Long {}.".format(i) for i in range(63)])
+        node = google.parse(condense(lex_docstring(docstring)))
+        self.assertEqual(node.lchild.lchild.symbol, "docstring")
+        self.assertEqual(node.rchild.rchild.symbol, "docstring")
+
+
+def grammar_lookup(*args):
+    return [StanzaGrammar]
+
+
+def _flatten(node):
+    return [
+        (
+            x.symbol,
+            x.weight,
+            x.annotations,
+            x.value and (x.value.token_type, x.value.value, x.value.line_number),
+        )
+        for x in node.walk()
+    ]
+
+
+# A docstring whose sections (except for the first) repeat.
+DOCSTRING = "\n".join(
+    [
+        "Short.",
+        "",
+        "Args:",
+        "    x: The x # which isn't canonical.",
+        "",
+        "Returns:",
+        "    The y.",
+        "",
+    ]
+)
+
+
+class SectionCacheTests(TestCase):
+    def setUp(self):
+        section_cache.clear()
+
+    def tearDown(self):
+        section_cache.clear()
+
+    def parse(self, docstring):
+        return google.parse(condense(lex_docstring(docstring)))
+
+    def test_grammars_in_lookup_are_parsed(self):
+        for poem in poems:
+            tokens = lex(poem)
+            total = parse(TotalPoetryGrammar, tokens)
+            combined = parser_combinator(top_parse, grammar_lookup, combine, tokens)
+            self.assertTrue(total.equals(combined))
+
+    def test_repeated_sections_are_cached(self):
+        first = self.parse(DOCSTRING)
+        misses = section_cache.misses
+        self.assertGreater(misses, 0)
+        second = self.parse(DOCSTRING)
+        self.assertEqual(section_cache.misses, misses)
+        self.assertGreater(section_cache.hits, 0)
+        self.assertEqual(_flatten(first), _flatten(second))
+
+    def test_line_numbers_are_rebased(self):
+        offset = "Short.\n\nLong\ndescription.\n\n"
+        self.parse(DOCSTRING)
+        hits = section_cache.hits
+        cached = self.parse(offset + DOCSTRING.split("\n", 2)[2])
+        self.assertGreater(section_cache.hits, hits)
+        section_cache.clear()
+        section_cache.maxsize = 0
+        try:
+            uncached = self.parse(offset + DOCSTRING.split("\n", 2)[2])
+        finally:
+            section_cache.maxsize = SectionCache().maxsize
+        self.assertEqual(_flatten(cached), _flatten(uncached))
+
+    def test_indentation_is_part_of_key(self):
+        # Lexed the same way regardless of the indentation.
+        docstring = "Short.\n\nReturns:\nThe y.\n"
+        self.parse(docstring)
+        self.parse(docstring)
+        hits = section_cache.hits
+        self.assertGreater(hits, 0)
+        with ConfigurationContext(indentation=2):
+            self.parse(docstring)
+        self.assertEqual(section_cache.hits, hits)
+
+    def test_least_recently_used_evicted(self):
+        cache = SectionCache(maxsize=2)
+        cache.put("a", None, 0)
+        cache.put("b", None, 0)
+        cache.get("a")
+        cache.put("c", None, 0)
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(
+            cache.get_stats(),
+            {"hits": 2, "misses": 1, "size": 2, "maxsize": 2},
+        )
+
+    def test_clone_is_independent(self):
+        tokens = lex("Roly poly\n\n")
+        node = parse(StanzaGrammar, tokens)
+        copy = clone(node, 3)
+        copy.symbol = "changed"
+        self.assertEqual(node.symbol, "stanza")
+        self.assertEqual(
+            [x.value.line_number + 3 for x in node.walk() if x.value],
+            [x.value.line_number for x in copy.walk() if x.value],
+        )
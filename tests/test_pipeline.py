@@ -0,0 +1,249 @@
+"""Tests for the streaming check pipeline."""
+
+import os
+import tempfile
+import threading
+from unittest import TestCase
+
+import darglint2
+from darglint2 import pipeline
+from darglint2.config import ConfigResolver, Configuration
+from darglint2.docstring.style import DocstringStyle
+from darglint2.pipeline import (
+    Record,
+    analyze,
+    bounded,
+    check_files,
+    check_sources,
+    discover,
+    get_error_reports,
+    parse,
+    read,
+    read_ahead,
+)
+from darglint2.utils import ConfigurationContext
+
+MISSING_PARAMETER = "\n".join(
+    [
+        "def f(x):",
+        '    """Do something.',
+        "",
+        "    Returns:",
+        "        Something.",
+        "",
+        '    """',
+        "    return x",
+    ]
+)
+
+
+class PipelineTestCase(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, name, contents):
+        filename = os.path.join(self.directory.name, name)
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        with open(filename, "w") as fout:
+            fout.write(contents)
+        return filename
+
+    def test_discover_expands_directories(self):
+        first = self.write("a.py", "")
+        second = self.write(os.path.join("sub", "b.py"), "")
+        self.write("c.txt", "")
+        self.assertEqual(
+            sorted(discover([self.directory.name])),
+            sorted([first, second]),
+        )
+
+    def test_discover_yields_files_directly(self):
+        filename = self.write("a.py", "")
+        self.assertEqual(list(discover([filename])), [filename])
+
+    def test_syntax_error_passed_through(self):
+        filename = self.write("a.py", "def f(:\n    pass\n")
+        analyzed = list(analyze(parse(read([filename]))))
+        self.assertEqual(len(analyzed), 1)
+        self.assertIsInstance(analyzed[0][1], SyntaxError)
+
+    def test_one_report_per_file(self):
+        filenames = [self.write("{}.py".format(i), MISSING_PARAMETER) for i in range(5)]
+        with ConfigurationContext(message_template="{path}:{msg_id}"):
+            reports = list(check_files(filenames, 1, False, queue_size=2))
+        self.assertEqual(
+            reports,
+            ["{}:DAR101".format(filename) for filename in filenames],
+        )
+
+    def test_files_checked_with_nearest_config(self):
+        google = self.write(os.path.join("google", "a.py"), MISSING_PARAMETER)
+        sphinx = self.write(os.path.join("sphinx", "a.py"), MISSING_PARAMETER)
+        ignored = self.write(os.path.join("ignored", "a.py"), MISSING_PARAMETER)
+        self.write(
+            os.path.join("sphinx", "setup.cfg"),
+            "[darglint2]\ndocstring_style=sphinx\n",
+        )
+        self.write(os.path.join("ignored", ".darglint2"), "[darglint2]\nignore=*\n")
+        default = Configuration(message_template="{path}:{msg_id}")
+        configs = ConfigResolver(default, {"message_template": "{msg_id}"})
+        filenames = [google, sphinx, ignored]
+        reports = list(check_files(filenames, 1, False, configs=configs))
+        # The sphinx docstring has no returns section, and the message
+        # template given as an override applies to the config file.
+        # (But not to the default, which is used as it is.)
+        self.assertEqual(reports, ["{}:DAR101".format(google), "DAR201\nDAR101", ""])
+
+    def test_read_ahead_preserves_order(self):
+        filenames = [
+            self.write("{}.py".format(i), "x = {}\n".format(i)) for i in range(20)
+        ]
+        self.assertEqual(
+            list(read_ahead(filenames, max_files=3, workers=3)),
+            list(read(filenames)),
+        )
+
+    def test_read_ahead_bytes_are_bounded(self):
+        filenames = [self.write("{}.py".format(i), "x" * 100) for i in range(10)]
+        reads = list()
+        original = pipeline._read_file
+
+        def _read_file(filename, size):
+            reads.append(filename)
+            return original(filename, size)
+
+        pipeline._read_file = _read_file
+        try:
+            items = read_ahead(filenames, max_files=10, max_bytes=250)
+            for i, (filename, _) in enumerate(items):
+                self.assertEqual(filename, filenames[i])
+                # The current file, and at most one more 100-byte
+                # file, since three would exceed the limit.
+                self.assertLessEqual(len(reads) - i, 2)
+        finally:
+            pipeline._read_file = original
+
+    def test_read_ahead_reads_file_larger_than_limit(self):
+        filename = self.write("a.py", "x = 1\n")
+        self.assertEqual(
+            list(read_ahead([filename], max_bytes=1)),
+            [(filename, b"x = 1\n")],
+        )
+
+    def test_large_files_read_into_buffer(self):
+        contents = "x = 1\n" * (pipeline.LARGE_FILE_SIZE // 4)
+        filename = self.write("a.py", contents)
+        program = pipeline._read_file(filename, os.stat(filename).st_size)
+        self.assertIsInstance(program, bytearray)
+        self.assertEqual(program, contents.encode())
+
+    def test_large_file_changed_after_measuring(self):
+        contents = "x = 1\n" * (pipeline.LARGE_FILE_SIZE // 4)
+        filename = self.write("a.py", contents)
+        size = os.stat(filename).st_size
+        self.assertEqual(
+            pipeline._read_file(filename, size + 10),
+            contents.encode(),
+        )
+        self.assertEqual(
+            pipeline._read_file(filename, size - 10),
+            contents.encode(),
+        )
+
+    def test_read_ahead_missing_file_raises(self):
+        filename = os.path.join(self.directory.name, "missing.py")
+        with self.assertRaises(FileNotFoundError):
+            list(read_ahead([filename]))
+
+
+class CheckSourcesTestCase(TestCase):
+    def setUp(self):
+        self.sources = [
+            ("missing.py", MISSING_PARAMETER),
+            ("syntax.py", "def f(:\n    pass\n"),
+            ("clean.py", "x = 1\n"),
+        ]
+
+    def test_public(self):
+        self.assertIs(darglint2.check_sources, check_sources)
+
+    def test_records_for_each_source(self):
+        results = list(check_sources(self.sources))
+        self.assertEqual([path for path, _ in results], [x for x, _ in self.sources])
+        missing, syntax, clean = [records for _, records in results]
+        self.assertEqual(
+            missing,
+            [Record("missing.py", "DAR101", "- x", 1, 1, "f")],
+        )
+        self.assertEqual([record.code for record in syntax], ["DAR000"])
+        self.assertEqual(clean, [])
+
+    def test_same_errors_as_files(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "a.py")
+            with open(filename, "w") as fout:
+                fout.write(MISSING_PARAMETER)
+            (report,) = get_error_reports([filename], 2, False)
+            expected = [
+                (report.get_line_number(error), error.message(2)) for error in report
+            ]
+        ((_, records),) = check_sources([(filename, MISSING_PARAMETER)], verbosity=2)
+        self.assertEqual([(x.line, x.message) for x in records], expected)
+
+    def test_given_config(self):
+        config = Configuration(style=DocstringStyle.SPHINX)
+        ((_, records),) = check_sources([("a.py", MISSING_PARAMETER)], config)
+        self.assertEqual([x.code for x in records], ["DAR201", "DAR101"])
+        config = Configuration(ignore=["*"])
+        ((_, records),) = check_sources([("a.py", MISSING_PARAMETER)], config)
+        self.assertEqual(records, [])
+
+    def test_workers_report_same_errors_in_order(self):
+        sources = self.sources * 4
+        self.assertEqual(
+            list(check_sources(sources, jobs=2)),
+            list(check_sources(sources)),
+        )
+
+
+class BoundedTestCase(TestCase):
+    def test_preserves_order(self):
+        self.assertEqual(list(bounded(iter(range(100)), 3)), list(range(100)))
+
+    def test_exceptions_propagate(self):
+        def stage():
+            yield 1
+            raise ValueError("Failed in the background.")
+
+        items = bounded(stage(), 2)
+        self.assertEqual(next(items), 1)
+        with self.assertRaises(ValueError):
+            next(items)
+
+    def test_producer_never_exceeds_bound(self):
+        produced = list()
+        lock = threading.Lock()
+
+        def stage():
+            for i in range(50):
+                with lock:
+                    produced.append(i)
+                yield i
+
+        for i, item in enumerate(bounded(stage(), 2)):
+            with lock:
+                # The item being consumed, the queue, and the
+                # item the producer is blocked on.
+                self.assertLessEqual(len(produced) - i, 4)
+
+    def test_stopping_early_releases_producer(self):
+        items = bounded(iter(range(1000)), 1)
+        self.assertEqual(next(items), 0)
+        items.close()
+        self.assertEqual(
+            [x for x in threading.enumerate() if x.daemon and x.is_alive()],
+            [],
+        )
@@ -0,0 +1,146 @@
+"""Tests for the profiling instrumentation."""
+
+import ast
+import json
+from unittest import TestCase
+
+from darglint2 import profiling
+from darglint2.function_description import get_function_descriptions
+from darglint2.integrity_checker import IntegrityChecker
+from darglint2.parse.combinator import section_cache
+from darglint2.pipeline import check_files
+
+
+class ProfilerTest(TestCase):
+    def test_phases_accumulate(self):
+        profiler = profiling.Profiler()
+        profiler.record("a", 1.0)
+        profiler.record("b", 3.0)
+        profiler.record("a", 1.5)
+        self.assertEqual(
+            profiler.get_phases(),
+            [
+                {"name": "b", "calls": 1, "seconds": 3.0},
+                {"name": "a", "calls": 2, "seconds": 2.5},
+            ],
+        )
+
+    def test_only_slowest_docstrings_kept(self):
+        profiler = profiling.Profiler(top=2)
+        profiler.current_file = "a.py"
+        for i, elapsed in enumerate([0.2, 0.5, 0.1, 0.4]):
+            profiler.note_tokens(i * 10)
+            profiler.record_docstring("f{}".format(i), i, elapsed)
+        self.assertEqual(
+            profiler.get_slowest_docstrings(),
+            [
+                {
+                    "path": "a.py",
+                    "line": 1,
+                    "function": "f1",
+                    "tokens": 10,
+                    "seconds": 0.5,
+                },
+                {
+                    "path": "a.py",
+                    "line": 3,
+                    "function": "f3",
+                    "tokens": 30,
+                    "seconds": 0.4,
+                },
+            ],
+        )
+
+    def test_summary_and_json(self):
+        profiler = profiling.Profiler()
+        profiler.record("ast.parse", 0.25)
+        profiler.current_file = "a.py"
+        profiler.note_tokens(12)
+        profiler.record_docstring("f", 3, 0.125)
+        summary = profiler.summary()
+        self.assertIn("ast.parse", summary)
+        self.assertIn("a.py:3: f (12 tokens)", summary)
+        self.assertEqual(
+            json.loads(profiler.to_json())["phases"],
+            [{"name": "ast.parse", "calls": 1, "seconds": 0.25}],
+        )
+
+
+class InstrumentationTest(TestCase):
+    def setUp(self):
+        # Cached sections aren't parsed, so wouldn't have phases.
+        section_cache.clear()
+
+    def tearDown(self):
+        profiling.disable()
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(profiling.get_profiler())
+
+        @profiling.profiled("phase")
+        def f(x):
+            return x + 1
+
+        self.assertEqual(f(1), 2)
+        with profiling.timed("phase"):
+            pass
+
+    def test_profiled_names_phase_from_arguments(self):
+        @profiling.profiled(lambda x: "phase {}".format(x))
+        def f(x):
+            return x + 1
+
+        profiler = profiling.enable()
+        self.assertEqual(f(1), 2)
+        f(1)
+        f(2)
+        self.assertEqual(
+            {x["name"]: x["calls"] for x in profiler.get_phases()},
+            {"phase 1": 2, "phase 2": 1},
+        )
+        self.assertIs(profiling.disable(), profiler)
+        self.assertIsNone(profiling.get_profiler())
+
+    def test_phases_of_checking_a_docstring(self):
+        program = "\n".join(
+            [
+                "def f(x):",
+                '    """Do something.',
+                "",
+                "    Args:",
+                "        x: The thing.",
+                "",
+                "    Returns:",
+                "        Something else.",
+                "",
+                '    """',
+                "    return x",
+            ]
+        )
+        function = get_function_descriptions(ast.parse(program))[0]
+        profiler = profiling.enable()
+        IntegrityChecker().run_checks(function)
+        phases = {x["name"] for x in profiler.get_phases()}
+        for phase in [
+            "lex/condense",
+            "top_parse",
+            "cyk: ShortDescriptionGrammar",
+            "fast: ArgumentsGrammar",
+            "fast: ReturnsGrammar",
+            "_check_parameters",
+            "_check_style",
+        ]:
+            self.assertIn(phase, phases)
+        [docstring] = profiler.get_slowest_docstrings()
+        self.assertEqual(docstring["function"], "f")
+        self.assertEqual(docstring["line"], 1)
+        self.assertGreater(docstring["tokens"], 0)
+
+    def test_pipeline_phases_record_file(self):
+        profiler = profiling.enable()
+        list(check_files([__file__], 1, False))
+        phases = {x["name"] for x in profiler.get_phases()}
+        self.assertIn("ast.parse", phases)
+        self.assertIn("get_function_descriptions", phases)
+        for docstring in profiler.get_slowest_docstrings():
+            self.assertEqual(docstring["path"], __file__)
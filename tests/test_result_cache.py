@@ -0,0 +1,81 @@
+import os
+import tempfile
+import threading
+from unittest import TestCase
+
+from darglint2.config import Configuration
+from darglint2.docstring.style import DocstringStyle
+from darglint2.result_cache import ResultCache, get_cache_directory, get_key
+
+LINES = ["def f(x):\n", '    """Do nothing."""\n']
+
+
+class ResultCacheTests(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = ResultCache(self.directory.name)
+        self.config = Configuration.get_default_instance()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_stored_report_is_returned(self):
+        key = get_key(LINES, self.config, 2)
+        self.assertIsNone(self.cache.get(key))
+        report = [(1, 0, "DAR101 Missing parameter(s) in Docstring: - x")]
+        self.cache.set(key, report)
+        self.assertEqual(self.cache.get(key), report)
+        self.cache.set(key, [])
+        self.assertEqual(self.cache.get(key), [])
+
+    def test_corrupt_entry_is_a_miss(self):
+        key = get_key(LINES, self.config, 2)
+        self.cache.set(key, [(1, 0, "DAR101")])
+        with open(self.cache._get_path(key), "w") as fout:
+            fout.write('[[1, 0, "DAR')
+        self.assertIsNone(self.cache.get(key))
+
+    def test_key_depends_on_contents_and_configuration(self):
+        key = get_key(LINES, self.config, 2)
+        self.assertEqual(key, get_key(list(LINES), self.config, 2))
+        self.assertNotEqual(key, get_key(LINES[:1], self.config, 2))
+        self.assertNotEqual(key, get_key(LINES, self.config, 1))
+        config = Configuration.get_default_instance()
+        config.style = DocstringStyle.SPHINX
+        self.assertNotEqual(key, get_key(LINES, config, 2))
+        config = Configuration.get_default_instance()
+        config.ignore_regex = "^_"
+        self.assertNotEqual(key, get_key(LINES, config, 2))
+
+    def test_concurrent_writers(self):
+        key = get_key(LINES, self.config, 2)
+        reports = [[(i, 0, "DAR101 " + "x" * 1000)] * 100 for i in range(1, 5)]
+        failures = list()
+
+        def write(report):
+            for _ in range(20):
+                self.cache.set(key, report)
+                if self.cache.get(key) not in reports:
+                    failures.append(key)
+
+        threads = [threading.Thread(target=write, args=(r,)) for r in reports]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(failures, [])
+        self.assertIn(self.cache.get(key), reports)
+        directory = os.path.dirname(self.cache._get_path(key))
+        self.assertEqual(os.listdir(directory), [key + ".json"])
+
+    def test_cache_directory_from_environment(self):
+        old = dict(os.environ)
+        try:
+            os.environ.pop("DARGLINT2_CACHE_DIR", None)
+            os.environ["XDG_CACHE_HOME"] = "/tmp/cache"
+            self.assertEqual(get_cache_directory(), "/tmp/cache/darglint2")
+            os.environ["DARGLINT2_CACHE_DIR"] = "/tmp/other"
+            self.assertEqual(get_cache_directory(), "/tmp/other")
+        finally:
+            os.environ.clear()
+            os.environ.update(old)
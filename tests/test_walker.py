@@ -0,0 +1,143 @@
+import ast
+import os
+from unittest import TestCase
+
+from darglint2.analysis.analysis_visitor import (
+    ALL_ANALYSIS_PASSES,
+    ANALYSIS_PASSES,
+    get_analysis_visitor,
+)
+from darglint2.analysis.walker import PASS_HANDLERS, get_handlers, walk
+
+from . import test_analysis_visitor
+from .utils import reindent
+
+ATTRIBUTES = [
+    "arguments",
+    "types",
+    "returns",
+    "return_types",
+    "yields",
+    "exceptions",
+    "variables",
+    "asserts",
+    "is_abstract",
+]
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _get_functions(directory):
+    for path, _, filenames in os.walk(os.path.join(ROOT, directory)):
+        for filename in sorted(filenames):
+            if not filename.endswith(".py"):
+                continue
+            with open(os.path.join(path, filename)) as fin:
+                tree = ast.parse(fin.read())
+            for node in ast.walk(tree):
+                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    yield node
+
+
+class WalkerAnalysisVisitorTests(test_analysis_visitor.AnalysisVisitorTests):
+    """The tests of the `AnalysisVisitor`, run with the walker."""
+
+    def analyze(self, function):
+        return walk(function)
+
+
+class WalkerTests(TestCase):
+    def assertSameAsVisitor(self, function, passes=ALL_ANALYSIS_PASSES):
+        expected = get_analysis_visitor(passes)()
+        expected.visit(function)
+        actual = walk(function, passes)
+        self.assertIs(type(actual), type(expected))
+        for attribute in ATTRIBUTES:
+            self.assertEqual(
+                getattr(actual, attribute, None),
+                getattr(expected, attribute, None),
+                "{} differs for {} in {}".format(
+                    attribute,
+                    getattr(function, "name", "the program"),
+                    sorted(passes),
+                ),
+            )
+
+    def test_every_pass_has_handlers(self):
+        self.assertEqual(set(PASS_HANDLERS), set(ANALYSIS_PASSES))
+        for name, methods in PASS_HANDLERS.items():
+            for method in methods.values():
+                self.assertTrue(hasattr(ANALYSIS_PASSES[name], method))
+
+    def test_handlers_are_cached(self):
+        passes = frozenset({"arguments", "yields"})
+        self.assertIs(get_handlers(passes), get_handlers(passes))
+        self.assertEqual(
+            set(get_handlers(passes)),
+            {ast.arguments, ast.Yield, ast.YieldFrom},
+        )
+
+    def test_nested_functions_are_skipped(self):
+        program = r"""
+            def f(x):
+                def g(y):
+                    z = y
+                    raise ValueError()
+                    return z
+                h = lambda a: a
+                yield g
+        """
+        function = ast.parse(reindent(program)).body[0]
+        visitor = walk(function)
+        self.assertEqual(visitor.arguments, ["x"])
+        self.assertEqual([x.id for x in visitor.variables], ["h"])
+        self.assertEqual(visitor.exceptions, set())
+        self.assertEqual(visitor.returns, [])
+        self.assertEqual(len(visitor.yields), 1)
+        self.assertSameAsVisitor(function)
+
+    def test_lambda_is_analyzed(self):
+        program = "f = lambda x, *args, **kwargs: x"
+        function = ast.parse(program).body[0].value
+        self.assertEqual(walk(function).arguments, ["x", "*args", "**kwargs"])
+        self.assertSameAsVisitor(function)
+
+    def test_try_statements_are_walked_in_order(self):
+        program = r"""
+            def f(x):
+                try:
+                    try:
+                        raise ValueError()
+                    except ValueError as e:
+                        raise TypeError() from e
+                    except:
+                        raise
+                    else:
+                        return 1
+                    finally:
+                        return
+                except (KeyError, IndexError):
+                    raise SyntaxError()
+                except os.error:
+                    pass
+        """
+        function = ast.parse(reindent(program)).body[0]
+        visitor = walk(function)
+        self.assertIsNone(visitor.returns[0].value)
+        self.assertEqual(visitor.exceptions, {"SyntaxError", "TypeError"})
+        for passes in (ALL_ANALYSIS_PASSES, frozenset({"returns"})):
+            self.assertSameAsVisitor(function, passes)
+
+    def test_same_as_visitor_for_each_pass(self):
+        functions = list(_get_functions("darglint2"))
+        self.assertTrue(functions)
+        for name in ANALYSIS_PASSES:
+            passes = frozenset({name})
+            for function in functions:
+                self.assertSameAsVisitor(function, passes)
+
+    def test_same_as_visitor_for_all_passes(self):
+        for directory in ("darglint2", "tests"):
+            for function in _get_functions(directory):
+                self.assertSameAsVisitor(function)
+                self.assertSameAsVisitor(function, ALL_ANALYSIS_PASSES - {"raises"})